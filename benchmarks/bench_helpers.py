@@ -0,0 +1,78 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark building many entities with escapy.helpers.
+
+Usage:
+    python benchmarks/bench_helpers.py [--count N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from escapy.commands import no_op, pick
+from escapy.helpers import build_protocol, make_entity
+from escapy.mixins import UnlockableMixin
+from escapy.protocols import Interactable, Placeable, Unlockable
+
+
+def build_entities(count: int) -> list[object]:
+    entities = []
+    for i in range(count):
+        protocols = [
+            build_protocol("Interactable", interact=pick(f"object-{i}")),
+            build_protocol("Placeable", width=0.1, height=0.1),
+        ]
+        if i % 2:
+            protocols.append(build_protocol("Unlockable", on_unlock=no_op()))
+        entities.append(make_entity((UnlockableMixin,), protocols))
+    return entities
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    entities = build_entities(args.count)
+    build_time = time.perf_counter() - start
+
+    # Measure memory on a separate run, since tracing slows allocation down.
+    tracemalloc.start()
+    build_entities(args.count)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for entity in entities:
+        isinstance(entity, Interactable)
+        isinstance(entity, Placeable)
+        isinstance(entity, Unlockable)
+    isinstance_time = time.perf_counter() - start
+
+    classes = {type(entity) for entity in entities}
+    print(f"entities:          {args.count}")
+    print(f"distinct classes:  {len(classes)}")
+    print(f"build:             {build_time * 1e6 / args.count:.2f} us/entity")
+    print(f"isinstance checks: {isinstance_time * 1e6 / args.count:.2f} us/entity")
+    print(f"peak memory:       {peak / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
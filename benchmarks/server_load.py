@@ -0,0 +1,119 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Load generator for escapy.server.
+
+Starts a GameServer on a Unix socket in a child process, then drives it with
+`--sessions` concurrent clients, each sending requests back to back for
+`--duration` seconds. Reports throughput, latency percentiles and, from the
+server's CPU time, how many sessions one core sustains at `--rate` requests
+per second per player.
+
+Usage:
+    python benchmarks/server_load.py [--definition game.example.json] [--sessions 200] [--duration 5]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from escapy.loader import build_game, load_definition
+from escapy.server import GameServer
+
+ROOT = Path(__file__).parent.parent
+
+
+def _run_server(definition_path: str, socket_path: str, ready, stop, cpu) -> None:
+    definition = load_definition(definition_path)
+    server = GameServer(lambda: build_game(definition))
+
+    async def serve() -> None:
+        listener = await server.start_unix(socket_path)
+        cpu.value = time.process_time()
+        ready.set()
+        async with listener:
+            await asyncio.get_running_loop().run_in_executor(None, stop.wait)
+        cpu.value = time.process_time()
+
+    asyncio.run(serve())
+
+
+async def _client(socket_path: str, session_id: str, objects: list[str], deadline: float, latencies: list[float]):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    i = 0
+    while time.perf_counter() < deadline:
+        request = {"id": i, "session": session_id, "op": "interact", "object": objects[i % len(objects)]}
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    writer.close()
+
+
+async def _drive(socket_path: str, sessions: int, objects: list[str], duration: float) -> list[float]:
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_client(socket_path, f"s{n}", objects, deadline, latencies) for n in range(sessions)))
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--definition", type=Path, default=ROOT / "game.example.json")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--rate", type=float, default=1.0, help="requests per second of one real player")
+    args = parser.parse_args()
+
+    definition = json.loads(args.definition.read_text())
+    objects = [object_id for room in definition["rooms"].values() for object_id in room]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, "server.sock")
+        ready, stop = multiprocessing.Event(), multiprocessing.Event()
+        cpu = multiprocessing.Value("d", 0.0)
+        server = multiprocessing.Process(target=_run_server, args=(str(args.definition), socket_path, ready, stop, cpu))
+        server.start()
+        ready.wait()
+        cpu_before = cpu.value
+
+        latencies = asyncio.run(_drive(socket_path, args.sessions, objects, args.duration))
+
+        stop.set()
+        server.join()
+
+    latencies.sort()
+    server_cpu = cpu.value - cpu_before
+    per_core = len(latencies) / server_cpu if server_cpu else float("inf")
+    print(f"sessions:          {args.sessions}")
+    print(f"requests:          {len(latencies)} ({len(latencies) / args.duration:.0f}/s)")
+    print(f"latency p50:       {latencies[len(latencies) // 2] * 1000:.2f} ms")
+    print(f"latency p99:       {latencies[int(len(latencies) * 0.99)] * 1000:.2f} ms")
+    print(f"server cpu:        {server_cpu:.2f} s")
+    print(f"requests/core-s:   {per_core:.0f}")
+    print(f"sessions per core: {per_core / args.rate:.0f} at {args.rate:g} req/s per player")
+
+
+if __name__ == "__main__":
+    main()
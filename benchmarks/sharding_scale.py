@@ -0,0 +1,70 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Throughput of escapy.sharding.ShardedSessions by number of worker processes.
+
+Usage:
+    python benchmarks/sharding_scale.py [--sessions 2000] [--batches 50] [--workers 1 2 4]
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+from escapy.loader import DefinitionFactory
+from escapy.sharding import ShardedSessions
+
+ROOT = Path(__file__).parent.parent
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--definition", type=Path, default=ROOT / "game.example.json")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--batches", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    definition = json.loads(args.definition.read_text())
+    objects = [object_id for room in definition["rooms"].values() for object_id in room]
+    batches = [
+        [
+            {"id": n, "session": f"s{n}", "op": "interact", "object": objects[(b + n) % len(objects)]}
+            for n in range(args.sessions)
+        ]
+        for b in range(args.batches)
+    ]
+
+    baseline = None
+    for workers in args.workers:
+        sessions = ShardedSessions(DefinitionFactory(args.definition), workers=workers)
+        sessions.submit(batches[0])  # create every session before timing
+        start = time.perf_counter()
+        for batch in batches:
+            sessions.submit(batch)
+        elapsed = time.perf_counter() - start
+        sessions.close()
+
+        throughput = args.sessions * args.batches / elapsed
+        baseline = baseline or throughput
+        print(f"workers {workers:3}: {throughput:9.0f} requests/s  (x{throughput / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark startup: import times and time to the first PyGameUi frame.
+
+Every run starts a fresh interpreter. Import times are read from
+`python -X importtime`, summing the cumulative time of the top-level escapy
+imports. The first frame is timed from just before the interpreter starts to
+the end of the first render of a small synthetic game, under SDL's dummy video
+driver.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--output results.json]
+    python benchmarks/startup.py --save-baseline                 # store results as the baseline
+    python benchmarks/startup.py --baseline startup_baseline.json  # report regressions against it
+    python benchmarks/startup.py --strict                        # and exit with status 1 on any
+
+Results are medians in milliseconds. Runs after the first read files from the
+OS cache; drop the caches between runs to measure a cold boot, e.g. from an
+SD card.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from suite import compare
+from synthetic import write_assets
+
+DEFAULT_BASELINE = Path(__file__).parent / "startup_baseline.json"
+MODULES = ["escapy", "escapy.pygame"]
+
+# Run by a fresh interpreter with the start time, the benchmarks directory and the assets directory
+_FIRST_FRAME = """
+import sys, time
+sys.path.insert(0, sys.argv[2])
+from synthetic import SCALES, synthetic_game, synthetic_ui_config
+from escapy import dict_message_provider
+from escapy.pygame import PyGameUi
+game = synthetic_game(SCALES["small"])
+ui = PyGameUi(synthetic_ui_config(game, sys.argv[3]), dict_message_provider({}))
+ui.init(game)
+ui.render()
+print("first frame:", time.time() - float(sys.argv[1]))
+ui.quit()
+"""
+
+
+def import_ms(module: str) -> float:
+    """Return the time `import module` takes in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package", nested imports are indented
+        _, cumulative, name = line.split("|")
+        if name.startswith(" escapy") and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1000
+
+
+def first_frame_ms(assets_dir: str) -> float:
+    # pygame would print its support prompt to stdout; only the marked line is read
+    env = {**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1", "SDL_VIDEODRIVER": "dummy"}
+    result = subprocess.run(
+        [sys.executable, "-c", _FIRST_FRAME, str(time.time()), str(Path(__file__).parent), assets_dir],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    line = next(line for line in reversed(result.stdout.splitlines()) if line.startswith("first frame:"))
+    return float(line.removeprefix("first frame:")) * 1000
+
+
+def run(runs: int) -> dict[str, dict[str, float]]:
+    results = {}
+    for module in MODULES:
+        results[f"import_{module.replace('.', '_')}_ms"] = statistics.median(import_ms(module) for _ in range(runs))
+
+    try:
+        import pygame
+    except ImportError:
+        return {"startup": results}
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    with tempfile.TemporaryDirectory() as assets_dir:
+        pygame.display.init()
+        write_assets(assets_dir)
+        pygame.quit()
+        results["first_frame_ms"] = statistics.median(first_frame_ms(assets_dir) for _ in range(runs))
+    return {"startup": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change reported as a regression")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 on regressions")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text)
+
+    if args.save_baseline:
+        args.baseline.write_text(text)
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, nothing compared", file=sys.stderr)
+        return
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions and args.strict:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
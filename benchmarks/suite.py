@@ -0,0 +1,228 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Benchmark suite over synthetic games of several scales.
+
+Measures game building (time and peak memory), Game.interact throughput,
+message lookup, snapshot/restore and, when pygame is installed, full
+PyGameUi.render frames under SDL's dummy video driver.
+
+Usage:
+    python benchmarks/suite.py [--scales small medium large] [--output results.json]
+    python benchmarks/suite.py --save-baseline            # store results as the baseline
+    python benchmarks/suite.py --baseline baseline.json   # report regressions against it
+    python benchmarks/suite.py --strict                   # and exit with status 1 on any
+
+Metrics ending in `_per_s` are better when higher, all others when lower.
+Each metric is the best of `--repeat` runs, the least disturbed by whatever
+else the machine is doing, and timings less than `--noise-floor-us` slower per
+operation are not reported as regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from synthetic import SCALES, Scale, synthetic_game, synthetic_messages, synthetic_ui_config, write_assets
+
+from escapy import dict_message_provider
+from escapy.snapshot import restore, snapshot
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def bench_build(scale: Scale) -> dict[str, float]:
+    start = time.perf_counter()
+    synthetic_game(scale)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    synthetic_game(scale)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"build_ms": elapsed * 1000, "build_peak_kib": peak / 1024}
+
+
+def bench_interact(scale: Scale) -> tuple[dict[str, float], list]:
+    game = synthetic_game(scale)
+    targets = [(room_id, object_id) for room_id, room in game.rooms.items() for object_id in list(room)]
+
+    events = []
+    start = time.perf_counter()
+    for room_id, object_id in targets:
+        # Rooms are switched directly, so doors do not send later interactions elsewhere
+        game.current_room_id = room_id
+        events.extend(game.interact(object_id))
+    elapsed = time.perf_counter() - start
+
+    return {"interact_per_s": len(targets) / elapsed}, events
+
+
+def bench_messages(scale: Scale, events: list) -> dict[str, float]:
+    provider = dict_message_provider(synthetic_messages(synthetic_game(scale)))
+    lookups = events * max(1, 20_000 // max(1, len(events)))
+
+    start = time.perf_counter()
+    for event in lookups:
+        provider(event)
+    elapsed = time.perf_counter() - start
+
+    return {"message_lookup_us": elapsed * 1e6 / len(lookups)}
+
+
+def bench_snapshot(scale: Scale, repeat: int = 20) -> dict[str, float]:
+    game = synthetic_game(scale)
+    snapshot_times, restore_times = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        state = snapshot(game)
+        snapshot_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        restore(game, state)
+        restore_times.append(time.perf_counter() - start)
+
+    return {
+        "snapshot_ms": statistics.median(snapshot_times) * 1000,
+        "restore_ms": statistics.median(restore_times) * 1000,
+        "snapshot_kib": len(json.dumps(state)) / 1024,
+    }
+
+
+def bench_render(scale: Scale, frames: int = 60) -> dict[str, float]:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    try:
+        import pygame
+
+        from escapy.pygame import PyGameUi
+    except ImportError:
+        return {}
+
+    game = synthetic_game(scale)
+    with tempfile.TemporaryDirectory() as assets_dir:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        write_assets(assets_dir)
+        ui = PyGameUi(synthetic_ui_config(game, assets_dir), dict_message_provider({}))
+        ui.init(game)
+
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            ui.render()
+            times.append(time.perf_counter() - start)
+        ui.quit()
+
+    times.sort()
+    return {"render_p50_ms": times[len(times) // 2] * 1000, "render_p95_ms": times[int(len(times) * 0.95)] * 1000}
+
+
+def run(scales: list[str], render: bool, repeat: int = 5) -> dict[str, dict[str, float]]:
+    results = {}
+    for name in scales:
+        scale = SCALES[name]
+        runs = []
+        for _ in range(repeat):
+            result = bench_build(scale)
+            interact, events = bench_interact(scale)
+            result |= interact
+            result |= bench_messages(scale, events)
+            result |= bench_snapshot(scale)
+            runs.append(result)
+        results[name] = {
+            metric: (max if metric.endswith("_per_s") else min)(run[metric] for run in runs) for metric in runs[0]
+        }
+        if render:
+            # Already percentiles over many frames
+            results[name] |= bench_render(scale)
+    return results
+
+
+def _time_us(metric: str, value: float) -> float | None:
+    """The time per operation of a timing metric in microseconds, None for other metrics."""
+    if metric.endswith("_per_s"):
+        return 1e6 / value
+    if metric.endswith("_ms"):
+        return value * 1000
+    if metric.endswith("_us"):
+        return value
+    return None
+
+
+def compare(results: dict, baseline: dict, threshold: float, noise_floor_us: float = 2.0) -> list[str]:
+    """Return a description of every metric more than `threshold` worse than the baseline.
+
+    Timings less than `noise_floor_us` microseconds slower per operation are within noise.
+    """
+    regressions = []
+    for scale, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(scale, {}).get(metric)
+            if not base or not value:
+                continue
+            change = (base - value) / base if metric.endswith("_per_s") else (value - base) / base
+            time_us, base_time_us = _time_us(metric, value), _time_us(metric, base)
+            if time_us is not None and time_us - base_time_us < noise_floor_us:
+                continue
+            if change > threshold:
+                regressions.append(f"{scale}.{metric}: {base:.4g} -> {value:.4g} ({change:+.0%} worse)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", choices=SCALES, default=["small", "medium"])
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change reported as a regression")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 on regressions")
+    parser.add_argument("--noise-floor-us", type=float, default=2.0, help="smallest slowdown per operation reported")
+    parser.add_argument("--repeat", type=int, default=5, help="runs to take the median of")
+    parser.add_argument("--no-render", action="store_true", help="skip the PyGameUi render benchmark")
+    args = parser.parse_args()
+
+    results = run(args.scales, render=not args.no_render, repeat=args.repeat)
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        args.output.write_text(text)
+
+    if args.save_baseline:
+        args.baseline.write_text(text)
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, nothing compared", file=sys.stderr)
+        return
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold, args.noise_floor_us)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions and args.strict:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
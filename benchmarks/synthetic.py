@@ -0,0 +1,137 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Synthetic games for benchmarks."""
+
+import random
+from dataclasses import dataclass
+
+from escapy import (
+    Game,
+    InspectableObject,
+    MoveToRoom,
+    PickableObject,
+    Position,
+    SelfKeyLock,
+    SelfSimpleLock,
+    combine,
+    no_op,
+    reveal,
+)
+from escapy.commands import Command
+
+
+@dataclass(frozen=True)
+class Scale:
+    name: str
+    rooms: int
+    objects_per_room: int
+    inventory_size: int
+    combinator_depth: int
+
+
+SCALES = {
+    "small": Scale("small", rooms=2, objects_per_room=10, inventory_size=4, combinator_depth=1),
+    "medium": Scale("medium", rooms=10, objects_per_room=100, inventory_size=20, combinator_depth=3),
+    "large": Scale("large", rooms=20, objects_per_room=1000, inventory_size=50, combinator_depth=6),
+}
+
+
+def _nested_command(depth: int, object_id: str, room_id: str) -> Command:
+    if depth <= 0:
+        return no_op()
+    return combine(
+        reveal(object_id, room_id, Position(x=0.5, y=0.5)),
+        _nested_command(depth - 1, object_id, room_id),
+    )
+
+
+def synthetic_game(scale: Scale, seed: int = 0) -> Game:
+    """Build a game with `scale.rooms` rooms of `scale.objects_per_room` objects each.
+
+    Rooms cycle through pickable objects, simple and key locks whose on_unlock
+    is `scale.combinator_depth` nested combines, inspectable objects and doors
+    to the next room.
+    """
+    rng = random.Random(seed)
+    objects: dict[str, object] = {}
+    rooms: dict[str, dict[str, Position]] = {}
+
+    inventory = [f"inv-{i}" for i in range(scale.inventory_size)]
+    for object_id in inventory:
+        objects[object_id] = PickableObject(object_id, 0.05, 0.05)
+
+    for r in range(scale.rooms):
+        room_id = f"room-{r}"
+        next_room_id = f"room-{(r + 1) % scale.rooms}"
+        room = rooms[room_id] = {}
+        for o in range(scale.objects_per_room):
+            object_id = f"{room_id}-obj-{o}"
+            on_unlock = _nested_command(scale.combinator_depth, object_id, room_id) if o % 5 in (1, 2) else None
+            match o % 5:
+                case 0:
+                    obj = PickableObject(object_id, 0.04, 0.04)
+                case 1:
+                    obj = SelfSimpleLock(object_id, on_unlock, 0.1, 0.1)
+                case 2:
+                    key_id = inventory[o % len(inventory)] if inventory else object_id
+                    obj = SelfKeyLock(object_id, key_id, on_unlock, 0.1, 0.1)
+                case 3:
+                    obj = InspectableObject(object_id, 0.08, 0.08)
+                case _:
+                    obj = MoveToRoom(next_room_id, 0.06, 0.06)
+            objects[object_id] = obj
+            room[object_id] = Position(x=rng.uniform(0, 0.9), y=rng.uniform(0, 0.9))
+
+    return Game(objects=objects, rooms=rooms, inventory=list(inventory), first_room_id="room-0")
+
+
+def synthetic_ui_config(game: Game, assets_dir: str, width: int = 800, height: int = 600) -> dict:
+    """Return a PyGameUi config whose rooms and object states all point at two shared images.
+
+    Only the objects that can be drawn at the start (current room and inventory)
+    get an image, since PyGameUi loads every configured image up front.
+    """
+    objects = {}
+    for object_id in [*game.rooms[game.current_room_id], *game.inventory]:
+        for key in (object_id, f"{object_id}:locked", f"{object_id}:unlocked"):
+            objects[key] = "sprite.png"
+    return {
+        "width": width,
+        "height": height,
+        "fps": 0,
+        "title": "benchmark",
+        "assets_dir": assets_dir,
+        "rooms": dict.fromkeys(game.rooms, "room.png"),
+        "objects": objects,
+    }
+
+
+def synthetic_messages(game: Game) -> dict[str, str]:
+    return {f"InteractedWithLockedEvent(object_id='{object_id}')": "Locked" for object_id in game.objects}
+
+
+def write_assets(assets_dir: str) -> None:
+    """Write the two images referenced by synthetic_ui_config."""
+    import pygame
+
+    room = pygame.Surface((1280, 960))
+    room.fill((80, 60, 40))
+    pygame.image.save(room, f"{assets_dir}/room.png")
+    sprite = pygame.Surface((128, 128), pygame.SRCALPHA)
+    sprite.fill((200, 180, 40, 255))
+    pygame.image.save(sprite, f"{assets_dir}/sprite.png")
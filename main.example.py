@@ -21,6 +21,7 @@ Copy this file and adapt `config.json` to run your own game.
 """
 
 import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -34,7 +35,7 @@ from escapy import (
     no_op,
     reveal,
 )
-from escapy.pygame import PyGameUi
+from escapy.pygame import HotReloader, PyGameUi
 
 
 @dataclass
@@ -92,11 +93,15 @@ def main():
     )
 
     debug = False
+    # With --dev, edits to config.json and the images show up without restarting
+    reloader = HotReloader(ui, "config.json") if "--dev" in sys.argv else None
 
     ui.init(game)
 
     while ui.is_running:
         ui.tick()
+        if reloader is not None:
+            reloader.poll()
         events = ui.input()
         if debug and len(events) > 0:
             print(events)
@@ -0,0 +1,73 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Example spectator display for a session hosted by escapy.server.
+
+Start a server with `python -m escapy.server game.example.json`, then run:
+
+    python spectator.example.py SESSION_ID
+"""
+
+import json
+import socket
+import sys
+from pathlib import Path
+
+from escapy import dict_message_provider
+from escapy.loader import build_game, load_definition
+from escapy.pygame import PyGameUi
+from escapy.sync import ReadOnlyGame, SyncMirror
+
+
+def main():
+    session_id = sys.argv[1]
+    with open("config.json") as f:
+        config = json.load(f)
+
+    mirror = SyncMirror(build_game(load_definition(Path("game.example.json")), ReadOnlyGame))
+    ui = PyGameUi(config["ui"], dict_message_provider(config["messages"]))
+
+    connection = socket.create_connection(("127.0.0.1", 8765))
+    connection.sendall(json.dumps({"id": 0, "session": session_id, "op": "spectate"}).encode() + b"\n")
+    connection.setblocking(False)
+    buffer = b""
+
+    ui.init(mirror.game)
+
+    while ui.is_running:
+        ui.tick()
+        events = ui.input()
+
+        try:
+            buffer += connection.recv(65536)
+        except BlockingIOError:
+            pass
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            message = json.loads(line)
+            if "sync" in message:
+                events.extend(mirror.apply(message["sync"]))
+
+        ui.handle(events)
+        ui.render()
+
+    connection.close()
+    ui.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -38,42 +38,95 @@ Example usage:
         ui.render()
 """
 
-from .commands import (
-    add_to_inventory,
-    ask_for_code,
-    chain,
-    combine,
-    cond,
-    inspect,
-    key_lock,
-    locked,
-    move_to_room,
-    no_op,
-    pick,
-    put_in_hand,
-    reveal,
-    simple_lock,
-)
-from .game import Game
-from .game_types import Position
-from .messages import dict_message_provider
-from .objects import (
-    InspectableObject,
-    MoveToRoom,
-    MoveToRoomAndAddToInventoryObject,
-    PickableInspectableObject,
-    PickableObject,
-    SelfAskCodeLock,
-    SelfKeyLock,
-    SelfSimpleLock,
-    WinMachine,
-)
-from .ui import GameUi
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .columnar_room import ColumnarRoom
+    from .commands import (
+        add_to_inventory,
+        ask_for_code,
+        cancel_timer,
+        chain,
+        combine,
+        cond,
+        inspect,
+        key_lock,
+        locked,
+        move_to_room,
+        no_op,
+        open_container,
+        pick,
+        put_in_hand,
+        reveal,
+        simple_lock,
+        start_timer,
+    )
+    from .game import Game
+    from .game_types import Position
+    from .loader import load_game
+    from .messages import dict_message_provider
+    from .metrics import Metrics
+    from .objects import (
+        Container,
+        InspectableObject,
+        MoveToRoom,
+        MoveToRoomAndAddToInventoryObject,
+        PickableInspectableObject,
+        PickableObject,
+        SelfAskCodeLock,
+        SelfKeyLock,
+        SelfSimpleLock,
+        WinMachine,
+    )
+    from .ui import GameUi
+
+# Where each export is defined. Submodules are imported when one of their names is first used,
+# so importing escapy, or a submodule such as escapy.pygame, only loads what is needed.
+_EXPORTS = {
+    "Game": "game",
+    "Position": "game_types",
+    "ColumnarRoom": "columnar_room",
+    "load_game": "loader",
+    "dict_message_provider": "messages",
+    "Metrics": "metrics",
+    "PickableObject": "objects",
+    "SelfSimpleLock": "objects",
+    "SelfKeyLock": "objects",
+    "SelfAskCodeLock": "objects",
+    "MoveToRoom": "objects",
+    "WinMachine": "objects",
+    "InspectableObject": "objects",
+    "PickableInspectableObject": "objects",
+    "MoveToRoomAndAddToInventoryObject": "objects",
+    "Container": "objects",
+    "no_op": "commands",
+    "pick": "commands",
+    "put_in_hand": "commands",
+    "simple_lock": "commands",
+    "key_lock": "commands",
+    "ask_for_code": "commands",
+    "locked": "commands",
+    "inspect": "commands",
+    "open_container": "commands",
+    "combine": "commands",
+    "cond": "commands",
+    "chain": "commands",
+    "reveal": "commands",
+    "move_to_room": "commands",
+    "add_to_inventory": "commands",
+    "start_timer": "commands",
+    "cancel_timer": "commands",
+    "GameUi": "ui",
+}
 
 __all__ = [
     "Game",
     "Position",
+    "ColumnarRoom",
+    "load_game",
     "dict_message_provider",
+    "Metrics",
     "PickableObject",
     "SelfSimpleLock",
     "SelfKeyLock",
@@ -83,6 +136,7 @@ __all__ = [
     "InspectableObject",
     "PickableInspectableObject",
     "MoveToRoomAndAddToInventoryObject",
+    "Container",
     "no_op",
     "pick",
     "put_in_hand",
@@ -91,11 +145,27 @@ __all__ = [
     "ask_for_code",
     "locked",
     "inspect",
+    "open_container",
     "combine",
     "cond",
     "chain",
     "reveal",
     "move_to_room",
     "add_to_inventory",
+    "start_timer",
+    "cancel_timer",
     "GameUi",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
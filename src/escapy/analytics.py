@@ -0,0 +1,315 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Player analytics: recording sessions' events and finding where players get stuck.
+
+`AnalyticsSink` timestamps the GameEvents of each session and writes them to
+gzip-compressed JSON Lines files, one record per event:
+
+    {"s": "tablet-3", "t": 1760000000.123, "e": ["UnlockedEvent", "a2-poster"]}
+
+with events in the encoding of escapy.serialization. Recording only queues the
+events; a background thread encodes and writes them in batches and starts a
+new file every `max_records` records, so finished files can be collected while
+the game runs. At most `max_queued` calls' events wait in the queue: past
+that, and for events that cannot be encoded or written (e.g. on a full disk),
+records are dropped, logged and counted in `dropped`, and recording goes on.
+
+`aggregate` streams over any number of those files and computes, per puzzle
+(lockable object): how many sessions unlocked it, the time from a session's
+first event and from the first attempt at the puzzle to its unlock, the
+locked interactions, and the wrong codes entered, as a rate of code attempts.
+Memory depends on the number of puzzles and of sessions in progress at once,
+not on the number of records. A session evicted as one of more than
+`max_sessions` in progress is counted again if it comes back, from its return.
+From the shell:
+
+    python -m escapy.analytics analytics/*.jsonl.gz
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from queue import Empty, Full, Queue
+from typing import TextIO
+
+from .game_events import GameEvent
+from .metrics import Histogram
+from .serialization import encode_event
+
+logger = logging.getLogger(__name__)
+
+_SEPARATORS = (",", ":")
+
+# Upper bounds in seconds, from 10s to 2h, for times to unlock
+TIME_BUCKETS = (10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 900.0, 1800.0, 3600.0, 7200.0)
+
+
+class AnalyticsSink:
+    def __init__(
+        self,
+        directory: str | Path,
+        max_records: int = 100_000,
+        flush_interval: float = 1.0,
+        max_queued: int = 100_000,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_records = max_records
+        self.flush_interval = flush_interval
+        # Records not written, by either thread
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._queue: Queue[tuple[str, float, list[GameEvent]] | None] = Queue(max_queued)
+        self._files = 0
+        self._thread = threading.Thread(target=self._run, name="escapy-analytics", daemon=True)
+        self._thread.start()
+
+    def record(self, session_id: str, events: list[GameEvent]) -> None:
+        """Queue the events a session has just emitted; never waits for the disk."""
+        if events:
+            try:
+                self._queue.put_nowait((session_id, time.time(), events))
+            except Full:
+                self._drop(len(events), "queue full, dropped %d events of session %s", len(events), session_id)
+
+    def close(self) -> None:
+        """Write the queued events and close the current file."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        file = None
+        records = 0
+        while True:
+            # Block for the first item, then take what is queued, writing at most once per flush interval
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while batch[-1] is not None and (timeout := deadline - time.monotonic()) > 0:
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except Empty:
+                    break
+
+            for item in batch:
+                if item is None:
+                    _close_quietly(file)
+                    return
+                session_id, timestamp, events = item
+                for event in events:
+                    try:
+                        record = {"s": session_id, "t": round(timestamp, 3), "e": encode_event(event)}
+                        line = json.dumps(record, separators=_SEPARATORS) + "\n"
+                    except Exception as e:
+                        self._drop(1, "cannot encode %r of session %s: %s", event, session_id, e)
+                        continue
+                    try:
+                        if file is None:
+                            file = gzip.open(self._next_path(), "wt", encoding="utf-8")
+                        file.write(line)
+                        records += 1
+                        if records >= self.max_records:
+                            file.close()
+                            file, records = None, 0
+                    except OSError as e:
+                        self._drop(1, "cannot write an event of session %s: %s", session_id, e)
+                        # A new file is started for the next event
+                        _close_quietly(file)
+                        file, records = None, 0
+            if file is not None:
+                try:
+                    # A sync flush leaves every record written so far readable
+                    file.flush()
+                except OSError as e:
+                    self._drop(0, "cannot flush %s: %s", file.name, e)
+                    _close_quietly(file)
+                    file, records = None, 0
+
+    def _drop(self, count: int, message: str, *args) -> None:
+        with self._dropped_lock:
+            self.dropped += count
+        logger.warning(message, *args)
+
+    def _next_path(self) -> Path:
+        self._files += 1
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        return self.directory / f"events-{stamp}-{self._files:04}.jsonl.gz"
+
+
+def _close_quietly(file: TextIO | None) -> None:
+    """Close a file whose writes failed, ignoring the errors of closing it."""
+    if file is not None:
+        try:
+            file.close()
+        except OSError:
+            pass
+
+
+def read_records(paths: Iterable[str | Path]) -> Iterator[dict]:
+    """Yield the records of analytics files in order, tolerating a file still being written."""
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            try:
+                for line in f:
+                    if line.endswith("\n"):
+                        yield json.loads(line)
+            except EOFError, zlib.error:
+                # Ends at the last flush of a file that is still open
+                pass
+
+
+@dataclass
+class PuzzleStats:
+    sessions: int = 0
+    unlocked: int = 0
+    locked_interactions: int = 0
+    wrong_codes: int = 0
+    code_attempts: int = 0
+    # Seconds from the session's first event, and from the first attempt at the puzzle, to its unlock
+    time_to_unlock: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+    time_to_solve: Histogram = field(default_factory=lambda: Histogram(TIME_BUCKETS))
+
+    def to_dict(self) -> dict:
+        return {
+            "sessions": self.sessions,
+            "unlocked": self.unlocked,
+            "locked_interactions": self.locked_interactions,
+            "wrong_codes": self.wrong_codes,
+            "wrong_code_rate": self.wrong_codes / self.code_attempts if self.code_attempts else None,
+            "time_to_unlock": _summary(self.time_to_unlock),
+            "time_to_solve": _summary(self.time_to_solve),
+        }
+
+
+@dataclass
+class _Session:
+    started_at: float
+    # Time of the first attempt at each puzzle not unlocked yet
+    attempted_at: dict[str, float] = field(default_factory=dict)
+    # Puzzle whose code is being asked for
+    asking: str | None = None
+
+
+class FunnelAggregator:
+    def __init__(self, max_sessions: int = 10_000):
+        """Keep the state of at most `max_sessions` unfinished sessions, dropping the least recently active.
+
+        A dropped session that comes back is counted as a new one, started at its return.
+        """
+        self.max_sessions = max_sessions
+        self.puzzles: dict[str, PuzzleStats] = {}
+        self.sessions = 0
+        self._open: OrderedDict[str, _Session] = OrderedDict()
+
+    def add(self, record: dict) -> None:
+        session_id, timestamp, (name, *values) = record["s"], record["t"], record["e"]
+        session = self._open.get(session_id)
+        if session is None:
+            session = self._open[session_id] = _Session(timestamp)
+            self.sessions += 1
+            if len(self._open) > self.max_sessions:
+                self._open.popitem(last=False)
+        else:
+            self._open.move_to_end(session_id)
+
+        match name:
+            case "InteractedWithLockedEvent":
+                self._attempt(session, values[0], timestamp).locked_interactions += 1
+            case "AskedForCodeEvent":
+                self._attempt(session, values[0], timestamp)
+                session.asking = values[0]
+            case "WrongCodeEvent" if session.asking is not None:
+                stats = self._puzzle(session.asking)
+                stats.wrong_codes += 1
+                stats.code_attempts += 1
+            case "UnlockedEvent":
+                object_id = values[0]
+                stats = self._puzzle(object_id)
+                if object_id not in session.attempted_at:
+                    # Solved at the first try, e.g. with the right key in hand
+                    stats.sessions += 1
+                attempted_at = session.attempted_at.pop(object_id, timestamp)
+                stats.unlocked += 1
+                stats.time_to_unlock.observe(timestamp - session.started_at)
+                stats.time_to_solve.observe(timestamp - attempted_at)
+                if session.asking == object_id:
+                    stats.code_attempts += 1
+                    session.asking = None
+            case "GameEndedEvent":
+                del self._open[session_id]
+
+    def report(self) -> dict:
+        return {
+            "sessions": self.sessions,
+            "puzzles": {object_id: stats.to_dict() for object_id, stats in sorted(self.puzzles.items())},
+        }
+
+    def _attempt(self, session: _Session, object_id: str, timestamp: float) -> PuzzleStats:
+        stats = self._puzzle(object_id)
+        if object_id not in session.attempted_at:
+            session.attempted_at[object_id] = timestamp
+            stats.sessions += 1
+        return stats
+
+    def _puzzle(self, object_id: str) -> PuzzleStats:
+        stats = self.puzzles.get(object_id)
+        if stats is None:
+            stats = self.puzzles[object_id] = PuzzleStats()
+        return stats
+
+
+def aggregate(paths: Iterable[str | Path], max_sessions: int = 10_000) -> dict:
+    """Return the per-puzzle report over the records of `paths`."""
+    aggregator = FunnelAggregator(max_sessions)
+    for record in read_records(paths):
+        aggregator.add(record)
+    return aggregator.report()
+
+
+def _summary(histogram: Histogram) -> dict:
+    """Count, mean and median of a histogram.
+
+    The median is the upper bound of its bucket, None above the largest bucket.
+    """
+    if not histogram.count:
+        return {"count": 0}
+    median = next(bound for bound, count in histogram.cumulative() if count * 2 >= histogram.count)
+    return {
+        "count": histogram.count,
+        "mean_s": histogram.sum / histogram.count,
+        "median_s_at_most": median if median != float("inf") else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aggregate analytics files into a per-puzzle report.")
+    parser.add_argument("files", nargs="+", type=Path)
+    parser.add_argument("--max-sessions", type=int, default=10_000, help="unfinished sessions tracked at once")
+    args = parser.parse_args()
+    print(json.dumps(aggregate(sorted(args.files), args.max_sessions), indent=2))
+
+
+if __name__ == "__main__":
+    main()
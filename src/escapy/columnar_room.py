@@ -0,0 +1,146 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Struct-of-arrays room storage for rooms with many objects.
+
+`ColumnarRoom` can be used anywhere a `Room` dict is expected. Instead of one
+`Position` per object it keeps the ids in a list and x, y, width and height in
+parallel `array("d")` columns, which allows scaling the whole layout or hit
+testing a point in one pass. NumPy is used for those passes when installed;
+it is imported by the first pass, so games without columnar rooms never load it.
+"""
+
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from functools import cache
+
+from .game_types import Position
+from .protocols import Placeable
+
+
+@cache
+def _numpy():
+    """Return the numpy module, or None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class ColumnarRoom(MutableMapping[str, Position]):
+    """A room mapping object ids to positions, stored column-wise.
+
+    Object sizes are read from `objects` when an object is placed. Positions
+    returned by indexing are copies: assign a new Position to move an object.
+    Iteration follows placement order, like a dict, which is also the drawing
+    order.
+    """
+
+    def __init__(self, objects: Mapping[str, object], positions: Mapping[str, Position] | None = None):
+        self._objects = objects
+        self.ids: list[str] = []
+        self._index: dict[str, int] = {}
+        self.x = array("d")
+        self.y = array("d")
+        self.width = array("d")
+        self.height = array("d")
+        if positions is not None:
+            self.update(positions)
+
+    def __getitem__(self, object_id: str) -> Position:
+        i = self._index[object_id]
+        return Position(x=self.x[i], y=self.y[i])
+
+    def __setitem__(self, object_id: str, position: Position) -> None:
+        object = self._objects[object_id]
+        if not isinstance(object, Placeable):
+            raise ValueError("object is not placeable")
+
+        i = self._index.get(object_id)
+        if i is None:
+            self._index[object_id] = len(self.ids)
+            self.ids.append(object_id)
+            self.x.append(position.x)
+            self.y.append(position.y)
+            self.width.append(object.width)
+            self.height.append(object.height)
+        else:
+            self.x[i] = position.x
+            self.y[i] = position.y
+
+    def __delitem__(self, object_id: str) -> None:
+        i = self._index.pop(object_id)
+        del self.ids[i]
+        for column in (self.x, self.y, self.width, self.height):
+            del column[i]
+        for j in range(i, len(self.ids)):
+            self._index[self.ids[j]] = j
+
+    def clear(self) -> None:
+        # MutableMapping.clear deletes one item at a time, which reindexes the tail on every step
+        self.ids.clear()
+        self._index.clear()
+        for column in (self.x, self.y, self.width, self.height):
+            del column[:]
+
+    def __contains__(self, object_id: object) -> bool:
+        return object_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __repr__(self) -> str:
+        return f"ColumnarRoom({dict(self.items())!r})"
+
+    def scaled(self, width: float, height: float) -> tuple:
+        """Return the x, y, width and height columns scaled to a `width` x `height` area."""
+        np = _numpy()
+        if np is not None:
+            # frombuffer views are dropped before returning: the arrays cannot grow while exported.
+            return (
+                np.frombuffer(self.x) * width,
+                np.frombuffer(self.y) * height,
+                np.frombuffer(self.width) * width,
+                np.frombuffer(self.height) * height,
+            )
+        return (
+            [v * width for v in self.x],
+            [v * height for v in self.y],
+            [v * width for v in self.width],
+            [v * height for v in self.height],
+        )
+
+    def hit_test(self, x: float, y: float) -> str | None:
+        """Return the topmost object containing the point (x, y), in room fractions."""
+        if not self.ids:
+            return None
+
+        np = _numpy()
+        if np is not None:
+            xs, ys = np.frombuffer(self.x), np.frombuffer(self.y)
+            ws, hs = np.frombuffer(self.width), np.frombuffer(self.height)
+            hits = np.flatnonzero((xs <= x) & (x < xs + ws) & (ys <= y) & (y < ys + hs))
+            return self.ids[hits[-1]] if len(hits) else None
+
+        for i in range(len(self.ids) - 1, -1, -1):
+            if self.x[i] <= x < self.x[i] + self.width[i] and self.y[i] <= y < self.y[i] + self.height[i]:
+                return self.ids[i]
+        return None
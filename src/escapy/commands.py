@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with escapy. If not, see <https://www.gnu.org/licenses/>.
 
+from time import perf_counter
 from typing import Callable
 
 from .game import Game
@@ -31,11 +32,22 @@ from .game_events import (
     UnlockedEvent,
 )
 from .game_types import Position
+from .metrics import command_name
 from .mixins import Unlockable
 
 Command = Callable[[Game], list[GameEvent]]
 
 
+def _run(fn: Command, game: Game) -> list[GameEvent]:
+    """Run a command from a combinator, timing it when the game has metrics enabled."""
+    if game.metrics is None:
+        return fn(game)
+    start = perf_counter()
+    events = fn(game)
+    game.metrics.observe_command(command_name(fn), perf_counter() - start)
+    return events
+
+
 def no_op() -> Command:
     return lambda _game: []
 
@@ -44,6 +56,8 @@ def pick(id: str) -> Command:
     def f(game: Game) -> list[GameEvent]:
         del game.rooms[game.current_room_id][id]
         game.inventory.append(id)
+        game.notify("rooms", game.current_room_id)
+        game.notify("inventory", id)
         return [PickedUpEvent(object_id=id)]
 
     return f
@@ -90,13 +104,56 @@ def inspect(id: str) -> Command:
 
 
 def reveal(object_id: str, room_id: str, position: Position) -> Command:
+    """Place `object_id` in a room; a container opened before it was revealed brings its contents along."""
+
     def f(game: Game) -> list[GameEvent]:
+        obj = game.objects.get(object_id)
+        # An open container in no room was opened there, see open_container
+        opened_away = (
+            hasattr(obj, "materialize")
+            and getattr(obj, "state", None) == "unlocked"
+            and not any(object_id in room for room in game.rooms.values())
+        )
         game.rooms[room_id][object_id] = position
-        return [RevealedEvent(object_id=object_id, room_id=room_id, position=position)]
+        events: list[GameEvent] = [RevealedEvent(object_id=object_id, room_id=room_id, position=position)]
+        if opened_away:
+            events.extend(_place(game, room_id, obj.content_positions()))
+        game.notify("rooms", room_id)
+        return events
 
     return f
 
 
+def open_container(id: str) -> Command:
+    """Create the contents of container `id` and reveal them in the room holding it.
+
+    A container in no room, e.g. opened by a command before it is revealed, keeps its contents until
+    `reveal` places it, and them with it.
+    """
+
+    def f(game: Game) -> list[GameEvent]:
+        room_id = game.current_room_id
+        if id not in game.rooms[room_id]:
+            room_id = next((room_id for room_id, room in game.rooms.items() if id in room), None)
+        positions = game.objects[id].materialize(game)
+        if room_id is None:
+            return []
+        events = _place(game, room_id, positions)
+        game.notify("rooms", room_id)
+        return events
+
+    return f
+
+
+def _place(game: Game, room_id: str, positions: dict[str, Position]) -> list[GameEvent]:
+    room = game.rooms[room_id]
+    events: list[GameEvent] = []
+    for object_id, position in positions.items():
+        room[object_id] = position
+        events.append(RevealedEvent(object_id=object_id, room_id=room_id, position=position))
+    return events
+
+
 def move_to_room(room_id: str) -> Command:
     def f(game: Game) -> list[GameEvent]:
         game.current_room_id = room_id
@@ -108,16 +165,35 @@ def move_to_room(room_id: str) -> Command:
 def add_to_inventory(object_id: str) -> Command:
     def f(game: Game) -> list[GameEvent]:
         game.inventory.append(object_id)
+        game.notify("inventory", object_id)
         return [AddedToInventoryEvent(object_id=object_id)]
 
     return f
 
 
+def start_timer(timer_id: str, delay: float) -> Command:
+    """Start (or restart) timer `timer_id`, defined with `game.scheduler.define`, to expire in `delay` seconds."""
+
+    def f(game: Game) -> list[GameEvent]:
+        game.scheduler.start(timer_id, delay)
+        return []
+
+    return f
+
+
+def cancel_timer(timer_id: str) -> Command:
+    def f(game: Game) -> list[GameEvent]:
+        game.scheduler.cancel(timer_id)
+        return []
+
+    return f
+
+
 def combine(*fns: Command) -> Command:
     def combined(game: Game) -> list[GameEvent]:
         events: list[GameEvent] = []
         for fn in fns:
-            events.extend(fn(game))
+            events.extend(_run(fn, game))
         return events
 
     return combined
@@ -127,7 +203,7 @@ def cond(*clauses: tuple[Callable[[], bool], Command]) -> Command:
     def conditional(game: Game) -> list[GameEvent]:
         for condition, fn in clauses:
             if condition():
-                return fn(game)
+                return _run(fn, game)
         return []
 
     return conditional
@@ -151,7 +227,7 @@ def chain(*clauses: tuple[Callable[[list[GameEvent]], bool], Command]) -> Comman
         for clause in clauses:
             condition, fn = clause
             if condition(events):
-                events.extend(fn(game))
+                events.extend(_run(fn, game))
         return events
 
     return chained
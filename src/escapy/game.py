@@ -15,19 +15,32 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with escapy. If not, see <https://www.gnu.org/licenses/>.
 
+from collections.abc import MutableMapping
+from time import perf_counter
+from typing import Callable, Literal, get_args
+
 from .game_events import (
     GameEndedEvent,
     GameEvent,
     PutOffHandEvent,
 )
 from .game_types import Position
+from .metrics import Metrics
 from .protocols import (
     Decodable,
     Interactable,
     InventoryInteractable,
 )
+from .scheduler import Scheduler
+
+# Rooms are usually plain dicts; see ColumnarRoom for a compact alternative.
+Room = MutableMapping[str, Position]
+
+GameAspect = Literal["rooms", "current_room", "inventory", "hand", "locks"]
 
-Room = dict[str, Position]
+# Called with the aspect that changed and the id it concerns: the room id for
+# "rooms" and "current_room", the object id for "inventory", "hand" and "locks".
+ChangeCallback = Callable[[GameAspect, str | None], None]
 
 
 class Game:
@@ -38,18 +51,85 @@ class Game:
         inventory: list[str],
         first_room_id: str,
     ):
+        self.versions: dict[GameAspect, int] = dict.fromkeys(get_args(GameAspect), 0)
+        self._observers: dict[GameAspect, list[ChangeCallback]] = {aspect: [] for aspect in self.versions}
+
         self.objects = objects
         self.rooms = rooms
-        self.current_room_id = first_room_id
+        self._current_room_id = first_room_id
         self.is_finished = False
         self.inventory = inventory
-        self.in_hand_object_id: str | None = None
+        self._in_hand_object_id: str | None = None
+        self.metrics: Metrics | None = None
+        self.scheduler = Scheduler()
+        self._object_ids: dict[int, str] = {}
+
+    @property
+    def current_room_id(self) -> str:
+        return self._current_room_id
+
+    @current_room_id.setter
+    def current_room_id(self, room_id: str) -> None:
+        self._current_room_id = room_id
+        self.notify("current_room", room_id)
+
+    @property
+    def in_hand_object_id(self) -> str | None:
+        return self._in_hand_object_id
+
+    @in_hand_object_id.setter
+    def in_hand_object_id(self, object_id: str | None) -> None:
+        self._in_hand_object_id = object_id
+        self.notify("hand", object_id)
+
+    def subscribe(self, callback: ChangeCallback, *aspects: GameAspect) -> Callable[[], None]:
+        """Call `callback` whenever one of `aspects` (all of them if none given) changes.
+
+        Returns a function that removes the subscription.
+        """
+        aspects = aspects or tuple(self._observers)
+        for aspect in aspects:
+            self._observers[aspect].append(callback)
+
+        def unsubscribe() -> None:
+            for aspect in aspects:
+                self._observers[aspect].remove(callback)
+
+        return unsubscribe
+
+    def notify(self, aspect: GameAspect, id: str | None = None) -> None:
+        """Record a change to `aspect`.
+
+        Commands that mutate rooms, the inventory or lock states in place must
+        call this; current room and hand changes are tracked automatically.
+        """
+        self.versions[aspect] += 1
+        for callback in self._observers[aspect]:
+            callback(aspect, id)
+
+    def object_id_of(self, obj: object) -> str | None:
+        """Return the id under which `obj` is stored in `objects`."""
+        object_id = self._object_ids.get(id(obj))
+        if object_id is None or self.objects.get(object_id) is not obj:
+            # Built lazily and rebuilt when objects change, so lookups stay O(1) on large games
+            self._object_ids = {id(o): k for k, o in self.objects.items()}
+            object_id = self._object_ids.get(id(obj))
+        return object_id
+
+    def advance(self, dt: float) -> list[GameEvent]:
+        """Advance the game clock by `dt` seconds, running expired timers."""
+        return self.scheduler.advance(self, dt)
 
     def quit(self) -> list[GameEvent]:
         self.is_finished = True
         return [GameEndedEvent()]
 
     def interact(self, object_id: str) -> list[GameEvent]:
+        if self.metrics is None:
+            return self._interact(object_id)
+        return self._measure("interact", object_id, self._interact, object_id)
+
+    def _interact(self, object_id: str) -> list[GameEvent]:
         if object_id not in self.rooms[self.current_room_id]:
             return []
 
@@ -60,6 +140,11 @@ class Game:
         return object.interact(self)
 
     def interact_inventory(self, object_id: str | None) -> list[GameEvent]:
+        if self.metrics is None:
+            return self._interact_inventory(object_id)
+        return self._measure("interact_inventory", object_id, self._interact_inventory, object_id)
+
+    def _interact_inventory(self, object_id: str | None) -> list[GameEvent]:
         if object_id is None:
             self.in_hand_object_id = None
             return [PutOffHandEvent()]
@@ -72,8 +157,19 @@ class Game:
             return object.interact_inventory(self)
 
     def insert_code(self, object_id: str, code: str) -> list[GameEvent]:
+        if self.metrics is None:
+            return self._insert_code(object_id, code)
+        return self._measure("insert_code", object_id, self._insert_code, object_id, code)
+
+    def _insert_code(self, object_id: str, code: str) -> list[GameEvent]:
         object = self.objects[object_id]
         if not isinstance(object, Decodable):
             return []
 
         return object.insert_code(code, self)
+
+    def _measure(self, op: str, object_id: str | None, fn: Callable[..., list[GameEvent]], *args) -> list[GameEvent]:
+        start = perf_counter()
+        events = fn(*args)
+        self.metrics.observe_call(op, object_id, perf_counter() - start, events)
+        return events
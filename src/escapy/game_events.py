@@ -79,6 +79,11 @@ class AddedToInventoryEvent:
     object_id: str
 
 
+@dataclass
+class TimerExpiredEvent:
+    timer_id: str
+
+
 GameEvent = (
     PickedUpEvent
     | PutInHandEvent
@@ -92,4 +97,5 @@ GameEvent = (
     | InspectedEvent
     | GameEndedEvent
     | AddedToInventoryEvent
+    | TimerExpiredEvent
 )
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with escapy. If not, see <https://www.gnu.org/licenses/>.
 
+import warnings
+from functools import cache
 from typing import Literal
 
 from .mixins import GameMixins
@@ -26,54 +28,97 @@ from .protocols import (
     Unlockable,
 )
 
+ProtocolType = Literal["Interactable", "InventoryInteractable", "Placeable", "Unlockable"]
 
-def build_protocol(
-    protocol_type: Literal["Interactable", "InventoryInteractable", "Placeable", "Unlockable"],
-    **kwargs,
-) -> GameProtocol:
+# Attributes copied from a protocol object onto an entity, per capability.
+_CAPABILITY_ATTRS: dict[ProtocolType, tuple[str, ...]] = {
+    "Interactable": ("interact",),
+    "InventoryInteractable": ("interact_inventory",),
+    "Placeable": ("width", "height"),
+    "Unlockable": ("state", "on_unlock"),
+}
+
+_PROTOCOLS: dict[ProtocolType, type] = {
+    "Interactable": Interactable,
+    "InventoryInteractable": InventoryInteractable,
+    "Placeable": Placeable,
+    "Unlockable": Unlockable,
+}
+
+
+@cache
+def _protocol_class(protocol_type: ProtocolType) -> type:
+    protocol = _PROTOCOLS[protocol_type]
+    return type(f"{protocol_type}Impl", (protocol,), {"__module__": __name__, "_capability": protocol_type})
+
+
+@cache
+def _entity_class(mixins: tuple[type[GameMixins], ...], capabilities: frozenset[ProtocolType]) -> type:
+    # Capabilities are listed in a fixed order so the name does not depend on set iteration.
+    name = "Entity[" + ",".join(c for c in _CAPABILITY_ATTRS if c in capabilities) + "]"
+    bases = mixins + tuple(_PROTOCOLS[c] for c in _CAPABILITY_ATTRS if c in capabilities)
+    return type(name, bases, {"__module__": __name__})
+
+
+def build_protocol(protocol_type: ProtocolType, **kwargs) -> GameProtocol:
+    if protocol_type not in _PROTOCOLS:
+        raise ValueError("Unknown protocol type")
+
+    obj = _protocol_class(protocol_type)()
     match protocol_type:
         case "Interactable":
-            obj = type("InteractableImpl", (Interactable,), {"interact": kwargs["interact"]})()
-
+            obj.interact = kwargs["interact"]
         case "InventoryInteractable":
-            obj = type(
-                "InventoryInteractableImpl",
-                (InventoryInteractable,),
-                {"inventory_interact": kwargs["interact_inventory"]},
-            )()
-
+            obj.interact_inventory = kwargs["interact_inventory"]
         case "Placeable":
-            obj = type(
-                "PlaceableImpl",
-                (Placeable,),
-                {"width": kwargs["width"], "height": kwargs["weight"]},
-            )()
-
+            obj.width = kwargs["width"]
+            obj.height = kwargs["height"]
         case "Unlockable":
-            obj = type(
-                "UnlockableImpl",
-                (Unlockable,),
-                {"state": "locked", "on_unlock": kwargs["on_unlock"]},
-            )()
-
-        case _:
-            raise ValueError("Unknown protocol type")
+            obj.state = "locked"
+            obj.on_unlock = kwargs["on_unlock"]
 
     return obj
 
 
-def build_entity(name: str, mixins: tuple[type[GameMixins]], protocols: list[GameProtocol]):
+def make_entity(mixins: tuple[type[GameMixins], ...], protocols: list[GameProtocol]) -> object:
+    """Combine protocol objects into a single entity.
+
+    Entities with the same mixins and capabilities share one class, so building
+    many of them does not create a class per entity.
+    """
+    capabilities, attrs = _combine(protocols)
+    entity = _entity_class(tuple(mixins), frozenset(capabilities))()
+    entity.__dict__.update(attrs)
+    return entity
+
+
+def build_entity(name: str, mixins: tuple[type[GameMixins], ...], protocols: list[GameProtocol]) -> type:
+    """Return a new class named `name` with the mixins and the attributes of the protocol objects.
+
+    Deprecated: it creates a class per entity; use make_entity. The class is
+    a thin subclass of the shared entity class, so entities with the same
+    capabilities still share their bases.
+    """
+    warnings.warn("build_entity is deprecated, use make_entity", DeprecationWarning, stacklevel=2)
+    capabilities, attrs = _combine(protocols)
+    return type(name, (_entity_class(tuple(mixins), frozenset(capabilities)),), {"__module__": __name__, **attrs})
+
+
+def _combine(protocols: list[GameProtocol]) -> tuple[set[ProtocolType], dict]:
+    """Return the capabilities of the protocol objects and the attributes they provide."""
+    capabilities: set[ProtocolType] = set()
     attrs = {}
     for protocol in protocols:
-        if isinstance(protocol, Interactable):
-            attrs["interact"] = protocol.interact
-        if isinstance(protocol, InventoryInteractable):
-            attrs["interact_inventory"] = protocol.interact_inventory
-        if isinstance(protocol, Placeable):
-            attrs["width"] = protocol.width
-            attrs["height"] = protocol.height
-        if isinstance(protocol, Unlockable):
-            attrs["state"] = protocol.state
-            attrs["on_unlock"] = protocol.on_unlock
-
-    return type(name, mixins, attrs)
+        # Objects made by build_protocol know their capability; anything else
+        # goes through the (slower) runtime protocol checks.
+        known = getattr(type(protocol), "_capability", None)
+        for capability, protocol_class in _PROTOCOLS.items():
+            if known is not None:
+                provides = capability == known
+            else:
+                provides = isinstance(protocol, protocol_class)
+            if provides:
+                capabilities.add(capability)
+                for attr in _CAPABILITY_ATTRS[capability]:
+                    attrs[attr] = getattr(protocol, attr)
+    return capabilities, attrs
@@ -0,0 +1,398 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Declarative game definitions.
+
+A definition is a JSON or TOML document describing objects, rooms, the
+initial inventory and the first room:
+
+    {
+        "first_room": "room1",
+        "inventory": [],
+        "objects": {
+            "a1-knife": {"type": "PickableObject", "width": 0.05, "height": 0.05},
+            "a2-poster": {
+                "type": "SelfKeyLock",
+                "key_id": "a1-knife",
+                "on_unlock": {"command": "reveal", "object_id": "a2-key", "room_id": "room1", "position": [0.75, 0.75]},
+                "width": 0.15,
+                "height": 0.25
+            },
+            ...
+        },
+        "rooms": {"room1": {"a1-knife": [0.2, 0.2], ...}},
+        "timers": {"alarm": {"command": {"command": "move_to_room", "room_id": "room2"}, "start": 600}}
+    }
+
+The `id` argument of an object is filled in from its key. Commands are
+written as `{"command": name, **arguments}`; `combine` takes a `commands` list.
+Timers bind a name to a command, run `start` seconds after the game begins if
+given, or when a `start_timer` command starts them.
+
+A `Container` lists the objects it holds under `contents`, each with the
+`position` it is revealed at when the container opens:
+
+    "a3-chest": {
+        "type": "Container", "key_id": "a2-key", "width": 0.2, "height": 0.15,
+        "contents": {
+            "a4-box": {
+                "type": "Container", "code": "1234", "width": 0.12, "height": 0.12, "position": [0.5, 0.6],
+                "contents": {
+                    "a5-ring": {"type": "PickableObject", "width": 0.04, "height": 0.04, "position": [0.5, 0.6]}
+                }
+            }
+        }
+    }
+
+Contents are only built when their container opens, so they cannot be placed
+in rooms or start in the inventory.
+
+Parsing and validation run once per distinct definition: the validated,
+normalized definition is pickled into `cache_dir` under the SHA-256 of the
+source bytes, and later loads of an unchanged file go straight to building.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import tomllib
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+
+from . import commands, objects
+from .commands import Command
+from .game import Game
+from .game_types import Position
+
+# Bump when the normalized format changes, so stale cache entries are ignored.
+_FORMAT_VERSION = 3
+
+OBJECT_TYPES: dict[str, type] = {
+    "PickableObject": objects.PickableObject,
+    "SelfSimpleLock": objects.SelfSimpleLock,
+    "SelfKeyLock": objects.SelfKeyLock,
+    "SelfAskCodeLock": objects.SelfAskCodeLock,
+    "MoveToRoom": objects.MoveToRoom,
+    "WinMachine": objects.WinMachine,
+    "InspectableObject": objects.InspectableObject,
+    "PickableInspectableObject": objects.PickableInspectableObject,
+    "MoveToRoomAndAddToInventoryObject": objects.MoveToRoomAndAddToInventoryObject,
+    "Container": objects.Container,
+}
+
+COMMANDS: dict[str, Callable[..., Command]] = {
+    "no_op": commands.no_op,
+    "pick": commands.pick,
+    "put_in_hand": commands.put_in_hand,
+    "simple_lock": commands.simple_lock,
+    "key_lock": commands.key_lock,
+    "ask_for_code": commands.ask_for_code,
+    "locked": commands.locked,
+    "inspect": commands.inspect,
+    "reveal": commands.reveal,
+    "move_to_room": commands.move_to_room,
+    "add_to_inventory": commands.add_to_inventory,
+    "start_timer": commands.start_timer,
+    "cancel_timer": commands.cancel_timer,
+    "combine": commands.combine,
+}
+
+# Parameter names whose values refer to other parts of the definition.
+_OBJECT_REFS = {"id", "key_id", "object_id"}
+_ROOM_REFS = {"room_id", "win_room_id"}
+_TIMER_REFS = {"timer_id"}
+_COMMAND_PARAMS = {"on_unlock"}
+_POSITION_PARAMS = {"position"}
+_CONTENTS_PARAMS = {"contents"}
+
+# Normalized values: commands become ("command", name, kwargs), positions
+# become ("position", x, y), contents become ("contents", {id: (type_name,
+# kwargs, (x, y))}). Everything else is plain data.
+type _Normalized = dict[str, Any]
+
+
+def load_game(path: str | Path, cache_dir: str | Path | None = None) -> Game:
+    """Build a Game from a JSON or TOML definition file.
+
+    When `cache_dir` is given, the validated definition is cached there and
+    reused as long as the file content does not change.
+    """
+    return build_game(load_definition(path, cache_dir))
+
+
+def load_definition(path: str | Path, cache_dir: str | Path | None = None) -> _Normalized:
+    """Return the validated, normalized definition in `path`, for building many games with build_game."""
+    path = Path(path)
+    source = path.read_bytes()
+
+    definition = None
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.sha256(source + f":{_FORMAT_VERSION}".encode()).hexdigest()
+        cache_path = Path(cache_dir) / f"{key}.pickle"
+        definition = _read_cache(cache_path)
+
+    if definition is None:
+        definition = compile_definition(_parse(path, source))
+        if cache_path is not None:
+            _write_cache(cache_path, definition)
+
+    return definition
+
+
+def compile_definition(raw: dict) -> _Normalized:
+    """Validate a parsed definition and return its normalized form."""
+    for field in ("first_room", "objects", "rooms"):
+        if field not in raw:
+            raise ValueError(f"definition is missing '{field}'")
+
+    object_ids: set[str] = set()
+
+    def collect_ids(specs: dict, where: str) -> None:
+        for object_id, spec in specs.items():
+            if object_id in object_ids:
+                raise ValueError(f"{where}.{object_id}: duplicate object '{object_id}'")
+            object_ids.add(object_id)
+            if isinstance(spec, dict) and isinstance(spec.get("contents"), dict):
+                collect_ids(spec["contents"], f"{where}.{object_id}.contents")
+
+    collect_ids(raw["objects"], "objects")
+    room_ids = set(raw["rooms"])
+    timer_ids = set(raw.get("timers", {}))
+
+    def check_ref(param: str, value: Any, where: str) -> None:
+        if param in _OBJECT_REFS and value not in object_ids:
+            raise ValueError(f"{where}: unknown object '{value}'")
+        if param in _ROOM_REFS and value not in room_ids:
+            raise ValueError(f"{where}: unknown room '{value}'")
+        if param in _TIMER_REFS and value not in timer_ids:
+            raise ValueError(f"{where}: unknown timer '{value}'")
+
+    def check_placed(object_id: str, where: str) -> None:
+        check_ref("object_id", object_id, where)
+        if object_id not in raw["objects"]:
+            raise ValueError(f"{where}: '{object_id}' is in a container")
+
+    def normalize_position(value: Any, where: str) -> tuple:
+        match value:
+            case [x, y]:
+                return ("position", float(x), float(y))
+            case {"x": x, "y": y}:
+                return ("position", float(x), float(y))
+            case _:
+                raise ValueError(f"{where}: invalid position {value!r}")
+
+    def normalize_command(spec: Any, where: str) -> tuple:
+        if not isinstance(spec, dict) or "command" not in spec:
+            raise ValueError(f"{where}: command must be an object with a 'command' field")
+        name = spec["command"]
+        if name not in COMMANDS:
+            raise ValueError(f"{where}: unknown command '{name}'")
+        where = f"{where}.{name}"
+        args = {k: v for k, v in spec.items() if k != "command"}
+
+        if name == "combine":
+            return ("command", name, {"commands": [normalize_command(c, where) for c in args.get("commands", [])]})
+
+        _check_signature(COMMANDS[name], args, where)
+        kwargs = {}
+        for param, value in args.items():
+            check_ref(param, value, where)
+            if param in _POSITION_PARAMS:
+                value = normalize_position(value, where)
+            kwargs[param] = value
+        return ("command", name, kwargs)
+
+    def normalize_object(object_id: str, spec: Any, where: str) -> tuple:
+        if not isinstance(spec, dict):
+            raise ValueError(f"{where}: object must be an object with a 'type' field")
+        type_name = spec.get("type")
+        if type_name not in OBJECT_TYPES:
+            raise ValueError(f"{where}: unknown type {type_name!r}")
+        cls = OBJECT_TYPES[type_name]
+
+        args = {k: v for k, v in spec.items() if k != "type"}
+        if "id" in inspect.signature(cls).parameters:
+            args.setdefault("id", object_id)
+        _check_signature(cls, args, where)
+
+        kwargs = {}
+        for param, value in args.items():
+            check_ref(param, value, where)
+            if param in _COMMAND_PARAMS:
+                value = normalize_command(value, f"{where}.{param}")
+            elif param in _CONTENTS_PARAMS:
+                value = normalize_contents(value, f"{where}.{param}")
+            kwargs[param] = value
+        return (type_name, kwargs)
+
+    def normalize_contents(value: Any, where: str) -> tuple:
+        if not isinstance(value, dict):
+            raise ValueError(f"{where}: contents must be an object mapping ids to objects")
+        contents = {}
+        for object_id, spec in value.items():
+            if not isinstance(spec, dict) or "position" not in spec:
+                raise ValueError(f"{where}.{object_id}: content must be an object with a 'position' field")
+            object_spec = {k: v for k, v in spec.items() if k != "position"}
+            position = normalize_position(spec["position"], f"{where}.{object_id}")[1:]
+            contents[object_id] = (*normalize_object(object_id, object_spec, f"{where}.{object_id}"), position)
+        return ("contents", contents)
+
+    normalized_objects = {
+        object_id: normalize_object(object_id, spec, f"objects.{object_id}")
+        for object_id, spec in raw["objects"].items()
+    }
+
+    normalized_rooms = {}
+    for room_id, room in raw["rooms"].items():
+        normalized_room = {}
+        for object_id, position in room.items():
+            where = f"rooms.{room_id}.{object_id}"
+            check_placed(object_id, where)
+            normalized_room[object_id] = normalize_position(position, where)[1:]
+        normalized_rooms[room_id] = normalized_room
+
+    inventory = list(raw.get("inventory", []))
+    for object_id in inventory:
+        check_placed(object_id, "inventory")
+    check_ref("room_id", raw["first_room"], "first_room")
+
+    normalized_timers = {}
+    for timer_id, spec in raw.get("timers", {}).items():
+        where = f"timers.{timer_id}"
+        if not isinstance(spec, dict) or "command" not in spec:
+            raise ValueError(f"{where}: timer must be an object with a 'command' field")
+        start = spec.get("start")
+        if start is not None and not isinstance(start, int | float):
+            raise ValueError(f"{where}: invalid start {start!r}")
+        normalized_timers[timer_id] = (normalize_command(spec["command"], f"{where}.command"), start)
+
+    return {
+        "objects": normalized_objects,
+        "rooms": normalized_rooms,
+        "inventory": inventory,
+        "first_room": raw["first_room"],
+        "timers": normalized_timers,
+    }
+
+
+def build_game(definition: _Normalized, game_type: type[Game] = Game) -> Game:
+    """Instantiate a fresh Game (or `game_type`, e.g. a ReadOnlyGame mirror) from a normalized definition."""
+
+    def build_object(type_name: str, kwargs: dict) -> object:
+        return OBJECT_TYPES[type_name](**{k: build_value(v) for k, v in kwargs.items()})
+
+    def build_value(value: Any) -> Any:
+        match value:
+            case ("command", name, kwargs):
+                if name == "combine":
+                    return commands.combine(*(build_value(c) for c in kwargs["commands"]))
+                return COMMANDS[name](**{k: build_value(v) for k, v in kwargs.items()})
+            case ("position", x, y):
+                return Position(x=x, y=y)
+            case ("contents", contents):
+                # Contents are built when their container opens
+                return {
+                    object_id: (partial(build_object, type_name, kwargs), Position(x=x, y=y))
+                    for object_id, (type_name, kwargs, (x, y)) in contents.items()
+                }
+            case _:
+                return value
+
+    game = game_type(
+        objects={
+            object_id: build_object(type_name, kwargs)
+            for object_id, (type_name, kwargs) in definition["objects"].items()
+        },
+        rooms={
+            room_id: {object_id: Position(x=x, y=y) for object_id, (x, y) in room.items()}
+            for room_id, room in definition["rooms"].items()
+        },
+        inventory=list(definition["inventory"]),
+        first_room_id=definition["first_room"],
+    )
+    for timer_id, (command, start) in definition["timers"].items():
+        game.scheduler.define(timer_id, build_value(command))
+        if start is not None:
+            game.scheduler.start(timer_id, start)
+    return game
+
+
+class DefinitionFactory:
+    """Picklable game factory for a definition file.
+
+    The definition is loaded on the first call in each process, so the factory
+    can be sent to worker processes cheaply.
+    """
+
+    def __init__(self, path: str | Path, cache_dir: str | Path | None = None):
+        self.path = Path(path)
+        self.cache_dir = cache_dir
+        self._definition: _Normalized | None = None
+
+    def __call__(self) -> Game:
+        if self._definition is None:
+            self._definition = load_definition(self.path, self.cache_dir)
+        return build_game(self._definition)
+
+    def __getstate__(self) -> dict:
+        return {"path": self.path, "cache_dir": self.cache_dir, "_definition": None}
+
+
+def _check_signature(factory: Callable, args: dict, where: str) -> None:
+    try:
+        inspect.signature(factory).bind(**args)
+    except TypeError as e:
+        raise ValueError(f"{where}: {e}") from None
+
+
+def _parse(path: Path, source: bytes) -> dict:
+    if path.suffix == ".toml":
+        return tomllib.loads(source.decode())
+    return json.loads(source)
+
+
+def _read_cache(path: Path) -> _Normalized | None:
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Unreadable, corrupted or stale (e.g. pickled by an older escapy) entries are rebuilt
+        return None
+
+
+def _write_cache(path: Path, definition: _Normalized) -> None:
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a concurrent reader never sees a partial entry.
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(definition, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        # The cache is only a speedup: unwritable directories and unpicklable
+        # definitions leave the definition uncached
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,142 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Optional interaction metrics.
+
+Set `game.metrics = Metrics()` to count interactions per object, emitted
+events per object and event type, and to record latency histograms for the
+Game entry points and for every command run by `combine`, `cond` and `chain`.
+Results are available as a snapshot dict or in the Prometheus text format.
+"""
+
+import os
+import tempfile
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+
+from .game_events import GameEvent
+
+# Upper bounds in seconds, from 10us to 1s.
+DEFAULT_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # One count per bucket plus the +Inf bucket, not cumulative
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return (upper bound, cumulative count) pairs, ending with +Inf."""
+        total = 0
+        result = []
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class Metrics:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets = buckets
+        self.interactions: Counter[tuple[str, str | None]] = Counter()
+        self.events: Counter[tuple[str | None, str]] = Counter()
+        self.call_latency: dict[str, Histogram] = {}
+        self.command_latency: dict[str, Histogram] = {}
+
+    def observe_call(self, op: str, object_id: str | None, seconds: float, events: list[GameEvent]) -> None:
+        """Record a Game entry point (`interact`, `interact_inventory` or `insert_code`) call."""
+        self.interactions[op, object_id] += 1
+        for event in events:
+            # Events without an object (e.g. WrongCodeEvent) are counted against the object interacted with
+            self.events[getattr(event, "object_id", object_id), type(event).__name__] += 1
+        self._histogram(self.call_latency, op).observe(seconds)
+
+    def observe_command(self, name: str, seconds: float) -> None:
+        self._histogram(self.command_latency, name).observe(seconds)
+
+    def snapshot(self) -> dict:
+        def histograms(source: dict[str, Histogram]) -> dict:
+            return {
+                name: {"count": h.count, "sum": h.sum, "buckets": {str(b): c for b, c in h.cumulative()}}
+                for name, h in source.items()
+            }
+
+        return {
+            "interactions": [{"op": op, "object": o, "count": c} for (op, o), c in self.interactions.items()],
+            "events": [{"object": o, "event": e, "count": c} for (o, e), c in self.events.items()],
+            "call_latency": histograms(self.call_latency),
+            "command_latency": histograms(self.command_latency),
+        }
+
+    def to_prometheus(self) -> str:
+        lines = ["# TYPE escapy_interactions_total counter"]
+        for (op, object_id), count in sorted(self.interactions.items(), key=str):
+            lines.append(f"escapy_interactions_total{_labels(op=op, object=object_id)} {count}")
+
+        lines.append("# TYPE escapy_events_total counter")
+        for (object_id, event), count in sorted(self.events.items(), key=str):
+            lines.append(f"escapy_events_total{_labels(object=object_id, event=event)} {count}")
+
+        for metric, label, source in (
+            ("escapy_call_duration_seconds", "op", self.call_latency),
+            ("escapy_command_duration_seconds", "command", self.command_latency),
+        ):
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(source.items()):
+                for bound, count in histogram.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{metric}_bucket{_labels(**{label: name, 'le': le})} {count}")
+                lines.append(f"{metric}_sum{_labels(**{label: name})} {histogram.sum}")
+                lines.append(f"{metric}_count{_labels(**{label: name})} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path) -> None:
+        """Write the Prometheus text exposition to `path`, atomically."""
+        path = Path(path)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+    def _histogram(self, source: dict[str, Histogram], name: str) -> Histogram:
+        histogram = source.get(name)
+        if histogram is None:
+            histogram = source[name] = Histogram(self._buckets)
+        return histogram
+
+
+def command_name(command: object) -> str:
+    """Name a command after the factory that built it, e.g. `key_lock` for `key_lock(...)`."""
+    qualname = getattr(command, "__qualname__", type(command).__qualname__)
+    return qualname.split(".<locals>", 1)[0]
+
+
+def _labels(**labels: str | None) -> str:
+    def escape(value: str | None) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels.items()) + "}"
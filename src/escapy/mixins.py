@@ -23,6 +23,7 @@ from .protocols import Decodable, Unlockable
 class UnlockableMixin:
     def unlock(self: Unlockable, game: Game) -> list[GameEvent]:
         self.state = "unlocked"
+        game.notify("locks", game.object_id_of(self))
         return self.on_unlock(game)
 
 
@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with escapy. If not, see <https://www.gnu.org/licenses/>.
 
+from typing import Callable
+
 from .commands import (
     Command,
     add_to_inventory,
@@ -26,11 +28,14 @@ from .commands import (
     key_lock,
     locked,
     move_to_room,
+    open_container,
     pick,
     put_in_hand,
     simple_lock,
 )
+from .game import Game
 from .game_events import UnlockedEvent
+from .game_types import Position
 from .mixins import DecodableMixin, UnlockableMixin
 from .protocols import (
     Decodable,
@@ -40,6 +45,9 @@ from .protocols import (
     Unlockable,
 )
 
+# A content of a container: a factory building the object, and where it is revealed
+type Content = tuple[Callable[[], object], Position]
+
 
 class PickableObject(Interactable, InventoryInteractable, Placeable):
     def __init__(
@@ -96,11 +104,62 @@ class SelfAskCodeLock(UnlockableMixin, DecodableMixin, Interactable, Unlockable,
         self.state = "locked"
         self.on_unlock = on_unlock
         self.code = code
-        self.on_decode = self.unlock
+        # Through simple_lock, so the right code emits UnlockedEvent like the other locks
+        self.on_decode = simple_lock(id)
         self.width = width
         self.height = height
 
 
+class Container(UnlockableMixin, DecodableMixin, Interactable, Unlockable, Decodable, Placeable):
+    """A chest, safe or box whose contents only become objects of the game when it is opened.
+
+    It opens with the key `key_id` in hand, with `code`, or on interaction if it has neither. The
+    contents are then built and revealed in its room, so containers nested in it, and whatever they
+    hold, cost nothing until the player gets to them.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        contents: dict[str, Content],
+        width: float,
+        height: float,
+        key_id: str | None = None,
+        code: str | None = None,
+        on_unlock: Command | None = None,
+    ):
+        if code is not None:
+            self.interact = cond((lambda: self.state == "locked", ask_for_code(id)))
+        else:
+            self.interact = chain(
+                (lambda _events: True, simple_lock(id) if key_id is None else key_lock(id, key_id=key_id)),
+                (
+                    lambda events: (
+                        self.state == "locked"
+                        and not any(isinstance(e, UnlockedEvent) and e.object_id == id for e in events)
+                    ),
+                    locked(id),
+                ),
+            )
+        self.state = "locked"
+        self.on_unlock = open_container(id) if on_unlock is None else combine(open_container(id), on_unlock)
+        self.code = code
+        # Unlocking with the code emits UnlockedEvent too, which spectator mirrors open it on
+        self.on_decode = simple_lock(id)
+        self.contents = contents
+        self.width = width
+        self.height = height
+
+    def materialize(self, game: Game) -> dict[str, Position]:
+        """Add freshly built contents to the objects of `game` and return where each is revealed."""
+        for object_id, (build, _position) in self.contents.items():
+            game.objects[object_id] = build()
+        return self.content_positions()
+
+    def content_positions(self) -> dict[str, Position]:
+        return {object_id: position for object_id, (_build, position) in self.contents.items()}
+
+
 class MoveToRoom(Interactable, Placeable):
     def __init__(self, room_id: str, width: float, height: float):
         self.interact = move_to_room(room_id)
@@ -17,9 +17,12 @@
 
 """pygame submodule for escapy.
 
-This submodule contains the PyGameUi implementation.
+This submodule contains the PyGameUi implementation and its off-screen
+variant, HeadlessPyGameUi.
 """
 
+from .headless import FrameBatch, HeadlessPyGameUi, compare_golden, diff_frames
+from .hot_reload import HotReloader
 from .pygame_ui import PyGameUi
 
-__all__ = ["PyGameUi"]
+__all__ = ["PyGameUi", "HeadlessPyGameUi", "FrameBatch", "HotReloader", "compare_golden", "diff_frames"]
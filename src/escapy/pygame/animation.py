@@ -0,0 +1,202 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Sprite animations and tweens for PyGameUi.
+
+Two kinds of animation are configured in the UI config:
+
+    "animations": {
+        "a2-poster:unlocked": {"frames": ["door-1.png", "door-2.png", "door-3.png"], "fps": 12},
+        "candle": {"frames": ["candle-1.png", "candle-2.png"], "fps": 6, "loop": true}
+    },
+    "tweens": {
+        "RevealedEvent": {"alpha": [0, 255], "duration": 0.4},
+        "UnlockedEvent": {"scale": [1.2, 1.0], "duration": 0.25, "ease": "out"}
+    }
+
+Frame sequences belong to an `id` or `id:state` image key. Looping sequences
+play whenever the key is drawn; the others play once, ending on the key's
+image, when an event concerns the object. Tweens animate the alpha, scale or
+offset (in screens) of the object an event concerns.
+
+The Animator advances everything in one `update(dt)` per tick and costs
+nothing when no animation is running. Animated objects are left out of the
+cached room layer and drawn over it.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import pygame
+
+_EASINGS: dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "in": lambda t: t * t,
+    "out": lambda t: 1 - (1 - t) * (1 - t),
+}
+
+# Pose attributes tweens can animate
+_TWEEN_PROPERTIES = {"alpha", "scale", "offset"}
+
+
+@dataclass
+class Sequence:
+    frames: list[pygame.Surface]
+    fps: float = 12.0
+    loop: bool = False
+
+    @property
+    def duration(self) -> float:
+        return len(self.frames) / self.fps
+
+    def frame(self, elapsed: float) -> pygame.Surface:
+        index = int(elapsed * self.fps)
+        return self.frames[index % len(self.frames) if self.loop else min(index, len(self.frames) - 1)]
+
+
+@dataclass
+class Tween:
+    property: str
+    start: float | tuple[float, float]
+    end: float | tuple[float, float]
+    duration: float
+    ease: Callable[[float], float]
+    elapsed: float = 0.0
+
+    @property
+    def done(self) -> bool:
+        return self.elapsed >= self.duration
+
+    def value(self) -> float | tuple[float, float]:
+        t = self.ease(min(1.0, self.elapsed / self.duration)) if self.duration > 0 else 1.0
+        if isinstance(self.start, tuple):
+            return tuple(a + (b - a) * t for a, b in zip(self.start, self.end))
+        return self.start + (self.end - self.start) * t
+
+
+@dataclass
+class Pose:
+    """How an animated object is drawn this frame."""
+
+    image: pygame.Surface | None = None
+    alpha: float = 255.0
+    scale: float = 1.0
+    offset: tuple[float, float] = (0.0, 0.0)
+
+
+@dataclass
+class _Playback:
+    key: str
+    elapsed: float = 0.0
+
+
+class Animator:
+    def __init__(self, sequences: dict[str, Sequence] | None = None, tween_specs: dict[str, dict] | None = None):
+        self.sequences = sequences or {}
+        # Event class name -> {property: [from, to], "duration": seconds, "ease": name}
+        self.tween_specs = tween_specs or {}
+        # Called with an object id when it starts or stops being animated
+        self.on_change: Callable[[str], None] = lambda object_id: None
+        self.time = 0.0
+        self._playing: dict[str, _Playback] = {}
+        self._tweens: dict[str, list[Tween]] = {}
+
+    @classmethod
+    def from_config(cls, config: dict, load: Callable[[str], pygame.Surface]) -> "Animator":
+        sequences = {
+            key: Sequence([load(frame) for frame in spec["frames"]], spec.get("fps", 12.0), spec.get("loop", False))
+            for key, spec in config.get("animations", {}).items()
+        }
+        for event_name, spec in config.get("tweens", {}).items():
+            valid = (
+                "duration" in spec
+                and set(spec) <= {*_TWEEN_PROPERTIES, "duration", "ease"}
+                and spec.get("ease", "linear") in _EASINGS
+                and all(len(spec[name]) == 2 for name in _TWEEN_PROPERTIES & set(spec))
+            )
+            if not valid:
+                raise ValueError(f"tweens.{event_name}: invalid tween {spec!r}")
+        return cls(sequences, config.get("tweens", {}))
+
+    @property
+    def active(self) -> bool:
+        return bool(self._playing or self._tweens)
+
+    def loops(self, key: str) -> bool:
+        sequence = self.sequences.get(key)
+        return sequence is not None and sequence.loop
+
+    def is_animated(self, object_id: str, key: str) -> bool:
+        return object_id in self._playing or object_id in self._tweens or self.loops(key)
+
+    def trigger(self, event: object, object_id: str, key: str) -> None:
+        """Start the animations an event concerning `object_id`, now drawn as `key`, triggers."""
+        was_animated = object_id in self._playing or object_id in self._tweens
+        sequence = self.sequences.get(key)
+        if sequence is not None and not sequence.loop:
+            self._playing[object_id] = _Playback(key)
+
+        spec = self.tween_specs.get(type(event).__name__)
+        if spec is not None:
+            ease = _EASINGS[spec.get("ease", "linear")]
+            tweens = [
+                Tween(name, _value(spec[name][0]), _value(spec[name][1]), spec["duration"], ease)
+                for name in _TWEEN_PROPERTIES & set(spec)
+            ]
+            # A new tween of a property replaces the running one
+            running = [tween for tween in self._tweens.get(object_id, []) if tween.property not in spec]
+            self._tweens[object_id] = running + tweens
+
+        if not was_animated and (object_id in self._playing or object_id in self._tweens):
+            self.on_change(object_id)
+
+    def update(self, dt: float) -> None:
+        """Advance every running animation by `dt` seconds."""
+        self.time += dt
+        if not self.active:
+            return
+        finished = set()
+        for object_id, playback in list(self._playing.items()):
+            playback.elapsed += dt
+            if playback.elapsed >= self.sequences[playback.key].duration:
+                del self._playing[object_id]
+                finished.add(object_id)
+        for object_id, tweens in list(self._tweens.items()):
+            for tween in tweens:
+                tween.elapsed += dt
+            tweens[:] = [tween for tween in tweens if not tween.done]
+            if not tweens:
+                del self._tweens[object_id]
+                finished.add(object_id)
+        for object_id in finished:
+            if object_id not in self._playing and object_id not in self._tweens:
+                self.on_change(object_id)
+
+    def pose(self, object_id: str, key: str) -> Pose:
+        pose = Pose()
+        playback = self._playing.get(object_id)
+        if playback is not None and playback.key == key:
+            pose.image = self.sequences[key].frame(playback.elapsed)
+        elif self.loops(key):
+            pose.image = self.sequences[key].frame(self.time)
+        for tween in self._tweens.get(object_id, []):
+            setattr(pose, tween.property, tween.value())
+        return pose
+
+
+def _value(value: float | list[float]) -> float | tuple[float, float]:
+    return tuple(value) if isinstance(value, list) else float(value)
@@ -0,0 +1,194 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Pre-built asset packs for PyGameUi.
+
+A pack holds every image of a UI config as raw 32-bit pixels, already scaled
+to the sizes the UI draws them at for the config's resolution and layout:
+rooms at the size they are drawn at, objects at their size in the room and in
+the inventory. The original images are kept too, for inspection overlays and
+for layouts the pack was not built for.
+
+Build one with:
+
+    python -m escapy.pygame.asset_pack config.json game.json -o assets.pack
+
+and set `"asset_pack": "assets.pack"` in the UI config. PyGameUi then maps the
+file into memory and wraps its pixels in surfaces without decoding or copying
+anything, so startup does not depend on the number of images.
+
+File layout: the magic bytes, the format version and the index length as
+little-endian u32, the JSON index, then the pixel data, starting at the next
+multiple of 64 bytes and with every image aligned to 64 bytes. Offsets in the
+index are relative to the start of the pixel data. Pixels are stored as BGRA
+bytes, the layout of the usual 32-bit display formats, and identical images
+are stored once.
+"""
+
+import argparse
+import json
+import mmap
+import struct
+from pathlib import Path
+
+import pygame
+
+from ..game import Game
+from ..protocols import InventoryInteractable, Placeable
+
+_MAGIC = b"ESCAPYPK"
+_VERSION = 2
+_HEADER = struct.Struct("<II")
+_ALIGNMENT = 64
+
+# An image in the index: offset of its pixels, width, height and whether it has per-pixel alpha
+type _Entry = tuple[int, int, int, bool]
+
+
+class AssetPack:
+    def __init__(self, path: str | Path):
+        with open(path, "rb") as f:
+            # Private mapping: pages are shared with the file until a surface is drawn on
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        if self._map[: len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not an asset pack")
+        version, index_length = _HEADER.unpack_from(self._map, len(_MAGIC))
+        if version != _VERSION:
+            raise ValueError(f"{path}: unsupported asset pack version {version}")
+        start = len(_MAGIC) + _HEADER.size
+        self.index = json.loads(self._map[start : start + index_length])
+        self._data_start = _aligned(start + index_length)
+        self.layout: list = self.index["layout"]
+
+    def rooms(self) -> dict[str, pygame.Surface]:
+        return {room: self._surface(entry) for room, entry in self.index["rooms"].items()}
+
+    def objects(self) -> dict[str, pygame.Surface]:
+        return {key: self._surface(entry) for key, entry in self.index["objects"].items()}
+
+    def scaled_rooms(self) -> dict[str, pygame.Surface]:
+        return {room: self._surface(entry) for room, entry in self.index["scaled_rooms"].items()}
+
+    def scaled_objects(self) -> dict[tuple[str, int, int], pygame.Surface]:
+        return {
+            (key, width, height): self._surface(entry) for key, width, height, entry in self.index["scaled_objects"]
+        }
+
+    def _surface(self, entry: _Entry) -> pygame.Surface:
+        offset, width, height, alpha = entry
+        start = self._data_start + offset
+        surface = pygame.image.frombuffer(
+            memoryview(self._map)[start : start + width * height * 4], (width, height), "BGRA"
+        )
+        if not alpha:
+            # Opaque images are blitted as plain copies
+            surface.set_alpha(None)
+        return surface
+
+
+class _PackWriter:
+    def __init__(self):
+        self.data = bytearray()
+        self._offsets: dict[bytes, int] = {}
+
+    def add(self, surface: pygame.Surface, alpha: bool) -> _Entry:
+        pixels = pygame.image.tobytes(surface, "BGRA")
+        offset = self._offsets.get(pixels)
+        if offset is None:
+            self.data.extend(bytes(_aligned(len(self.data)) - len(self.data)))
+            offset = self._offsets[pixels] = len(self.data)
+            self.data.extend(pixels)
+        width, height = surface.get_size()
+        return (offset, width, height, alpha)
+
+
+def build_pack(config: dict, game: Game, output: str | Path) -> None:
+    """Write the asset pack for the UI `config` and the objects of `game` to `output`."""
+    # The UI computes the layout and scales the images, so the pack has the exact pixels it draws.
+    # Imported here because pygame_ui imports this module.
+    from .headless import HeadlessPyGameUi
+
+    ui = HeadlessPyGameUi({**config, "asset_pack": None}, lambda event: None)
+    writer = _PackWriter()
+    game_area_size = ui.game_area.get_size()
+
+    index: dict = {
+        "layout": ui._layout_signature(),
+        "rooms": {room: writer.add(image, alpha=False) for room, image in ui.room_images.items()},
+        "objects": {key: writer.add(image, alpha=True) for key, image in ui.object_images.items()},
+        "scaled_rooms": {
+            room: writer.add(ui._mip(image).scaled(ui._room_pixel_size(room)), alpha=False)
+            for room, image in ui.room_images.items()
+        },
+        "scaled_objects": [],
+    }
+
+    objects = _all_objects(game)
+    for key, image in ui.object_images.items():
+        object = objects.get(key.split(":")[0])
+        sizes = set()
+        if isinstance(object, Placeable):
+            sizes.add(pygame.Rect(0, 0, object.width * game_area_size[0], object.height * game_area_size[1]).size)
+        if isinstance(object, InventoryInteractable):
+            sizes.add(pygame.Rect(0, 0, ui.inventory_object_size, ui.inventory_object_size).size)
+        for size in sorted(sizes):
+            entry = writer.add(ui._mip(image).scaled(size), alpha=True)
+            index["scaled_objects"].append([key, *size, entry])
+
+    encoded = json.dumps(index).encode()
+    header_size = len(_MAGIC) + _HEADER.size + len(encoded)
+    with open(output, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(_VERSION, len(encoded)))
+        f.write(encoded)
+        f.write(bytes(_aligned(header_size) - header_size))
+        f.write(writer.data)
+
+
+def _all_objects(game: Game) -> dict[str, object]:
+    """Return the objects of `game` and, built for their sizes, the contents of its containers."""
+    objects = dict(game.objects)
+    pending = list(objects.values())
+    while pending:
+        for object_id, (build, _position) in getattr(pending.pop(), "contents", {}).items():
+            pending.append(objects.setdefault(object_id, build()))
+    return objects
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the asset pack for a UI config and a game definition.")
+    parser.add_argument("config", type=Path, help="JSON file with the UI config under 'ui'")
+    parser.add_argument("definition", type=Path, help="declarative game definition")
+    parser.add_argument("-o", "--output", type=Path, default=Path("assets.pack"))
+    args = parser.parse_args()
+
+    # Only the command line reads game definitions
+    from ..loader import load_game
+
+    with open(args.config) as f:
+        config = json.load(f)["ui"]
+    config["assets_dir"] = str(args.config.parent / config["assets_dir"])
+    build_pack(config, load_game(args.definition), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Image loading with deduplication and texture atlases.
+
+UI configs map many keys to the same file (every state of a prop, identical
+props in several rooms). `ImageFiles` loads and converts each distinct file
+content once, so those keys share one surface.
+
+`pack_atlases` then copies small sprites into a few large atlas surfaces with
+a shelf packer, and replaces them with subsurfaces: regions of the atlas that
+draw like the original images without owning any pixels.
+"""
+
+import hashlib
+import io
+from collections.abc import Callable
+from pathlib import Path
+
+import pygame
+
+
+class ImageFiles:
+    def __init__(self, assets_dir: str | Path, convert: Callable[[pygame.Surface, bool], pygame.Surface]):
+        """`convert(image, alpha)` turns a loaded image into the surface to draw."""
+        self.assets_dir = Path(assets_dir)
+        self.convert = convert
+        self._by_name: dict[tuple[str, bool], pygame.Surface] = {}
+        self._by_content: dict[tuple[bytes, bool], pygame.Surface] = {}
+
+    def load(self, name: str, alpha: bool) -> pygame.Surface:
+        image = self._by_name.get((name, alpha))
+        if image is None:
+            data = (self.assets_dir / name).read_bytes()
+            key = (hashlib.sha256(data).digest(), alpha)
+            image = self._by_content.get(key)
+            if image is None:
+                image = self._by_content[key] = self.convert(pygame.image.load(io.BytesIO(data), name), alpha)
+            self._by_name[(name, alpha)] = image
+        return image
+
+
+def pack_atlases(images: dict[str, pygame.Surface], size: int = 1024) -> dict[str, pygame.Surface]:
+    """Return `images` with the sprites up to half of `size` moved into `size`-wide atlases.
+
+    Keys sharing a surface share its region. Larger images are returned as they are.
+    """
+    sprites = {id(image): image for image in images.values() if max(image.get_size()) <= size // 2}
+
+    # Shelf packing, tallest first: each shelf is as tall as its first sprite
+    placements: dict[int, tuple[int, int, int]] = {}
+    heights = [0]
+    x = shelf_y = shelf_height = 0
+    for sprite_id, sprite in sorted(sprites.items(), key=lambda item: item[1].get_height(), reverse=True):
+        width, height = sprite.get_size()
+        if x + width > size:
+            x, shelf_y, shelf_height = 0, shelf_y + shelf_height, 0
+        if shelf_y + height > size:
+            heights.append(0)
+            x = shelf_y = shelf_height = 0
+        placements[sprite_id] = (len(heights) - 1, x, shelf_y)
+        x += width
+        shelf_height = max(shelf_height, height)
+        heights[-1] = max(heights[-1], shelf_y + height)
+
+    atlases = [pygame.Surface((size, height), pygame.SRCALPHA, 32) for height in heights if height > 0]
+    regions: dict[int, pygame.Surface] = {}
+    for sprite_id, (atlas, x, y) in placements.items():
+        sprite = sprites[sprite_id]
+        # The atlas starts fully transparent, so the max blend copies pixels and alpha exactly
+        atlases[atlas].blit(sprite, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        regions[sprite_id] = atlases[atlas].subsurface(pygame.Rect((x, y), sprite.get_size()))
+
+    return {key: regions.get(id(image), image) for key, image in images.items()}
@@ -0,0 +1,151 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Sound effects and music for PyGameUi.
+
+Both are configured in the UI config:
+
+    "sounds": {
+        "UnlockedEvent(object_id='a2-poster')": "door.ogg",
+        "PickedUpEvent": "pickup.ogg"
+    },
+    "music": {"room1": "study.ogg"}
+
+Effects are keyed like `messages`, by the repr of an event, or by its class
+name to cover every event of a kind. Effects are decoded into memory ahead of
+playing them, so no frame waits for a decode: those for every event of a kind
+when the UI starts, and those for events about a room or its objects when the
+room is entered (or an object is revealed). At most `sound_cache_size` are
+kept, evicting the least recently played; an effect evicted before it plays
+is decoded again when played. Music plays per room and is streamed from disk
+by the mixer, so long tracks are never decoded whole.
+
+Nothing here waits on playback: effects start on a free channel, or are
+dropped when all `sound_channels` are busy, and the mixer runs on its own
+thread. Without an audio device the UI stays silent; SDL's dummy driver
+(`SDL_AUDIODRIVER=dummy`) plays everything without one.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+
+import pygame
+
+from ..game_events import GameEvent, RevealedEvent
+
+# Quoted ids in an event repr, e.g. 'a2-poster' in UnlockedEvent(object_id='a2-poster')
+_KEY_IDS = re.compile(r"='([^']*)'")
+
+
+class Audio:
+    def __init__(
+        self,
+        assets_dir: str | Path,
+        sounds: dict[str, str],
+        music: dict[str, str],
+        cache_size: int = 32,
+        channels: int = 8,
+        fade_ms: int = 500,
+    ):
+        self.assets_dir = Path(assets_dir)
+        self.sounds = sounds
+        self.music = music
+        self.cache_size = cache_size
+        self.fade_ms = fade_ms
+        # Decoded effects, least recently played first
+        self._cache: OrderedDict[str, pygame.mixer.Sound] = OrderedDict()
+        self._track: str | None = None
+        # Effects by the object and room ids in their keys, decoded when those come in reach
+        self._sounds_by_id: dict[str, list[str]] = {}
+        general = []
+        for key, name in sounds.items():
+            ids = _KEY_IDS.findall(key)
+            for id in ids:
+                self._sounds_by_id.setdefault(id, []).append(name)
+            if not ids:
+                general.append(name)
+        self.enabled = bool(sounds or music) and _init_mixer()
+        if self.enabled:
+            pygame.mixer.set_num_channels(channels)
+            for name in list(dict.fromkeys(general))[:cache_size]:
+                self._sound(name)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "Audio":
+        return cls(
+            config["assets_dir"],
+            config.get("sounds", {}),
+            config.get("music", {}),
+            cache_size=config.get("sound_cache_size", 32),
+            channels=config.get("sound_channels", 8),
+        )
+
+    def handle(self, event: GameEvent) -> None:
+        """Play the effect configured for `event`, and decode those of an object it reveals."""
+        if not self.enabled:
+            return
+        name = self.sounds.get(repr(event)) or self.sounds.get(type(event).__name__)
+        if name is not None:
+            self._sound(name).play()
+        if isinstance(event, RevealedEvent):
+            self.preload([event.object_id])
+
+    def enter_room(self, room_id: str, object_ids: Iterable[str] = ()) -> None:
+        """Fade to the music of `room_id`, or out if it has none; the same track keeps playing.
+
+        Also decodes the effects for the room and for `object_ids`, the objects in reach there.
+        """
+        if not self.enabled:
+            return
+        self.preload([room_id, *object_ids])
+        track = self.music.get(room_id)
+        if track == self._track:
+            return
+        self._track = track
+        if track is None:
+            pygame.mixer.music.fadeout(self.fade_ms)
+        else:
+            pygame.mixer.music.load(self.assets_dir / track)
+            pygame.mixer.music.play(loops=-1, fade_ms=self.fade_ms)
+
+    def preload(self, ids: Iterable[str]) -> None:
+        """Decode the effects for events about `ids` now rather than on the frame that plays them."""
+        for id in ids:
+            for name in self._sounds_by_id.get(id, ()):
+                self._sound(name)
+
+    def _sound(self, name: str) -> pygame.mixer.Sound:
+        sound = self._cache.get(name)
+        if sound is None:
+            sound = self._cache[name] = pygame.mixer.Sound(self.assets_dir / name)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(name)
+        return sound
+
+
+def _init_mixer() -> bool:
+    """Initialize the mixer, unless it already is, returning whether audio is available."""
+    if pygame.mixer.get_init() is None:
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            return False
+    return True
@@ -0,0 +1,234 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Off-screen rendering for visual regression tests and thumbnails.
+
+`HeadlessPyGameUi` draws exactly like PyGameUi, but into an in-memory surface:
+no window is opened and no display driver is needed, so many of them can live
+in one process. Input comes from events posted by scripts (`click_object`,
+`type_text`, ...) instead of the pygame event queue, and `tick` advances the
+game clock by a fixed step, so scripted runs render the same frames every time.
+
+`frame` returns the screen pixels as a memoryview over the surface, without
+copying. The view locks the surface, so release it (or use it in a `with`
+block) before rendering again.
+
+`FrameBatch` renders the frames of many sessions, e.g. the sessions of a
+GameServer, sharing one copy of the images.
+"""
+
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+import pygame
+
+from ..game import Game
+from ..game_events import GameEvent
+from ..messages import MessageProvider
+from .pygame_ui import _INPUT_EVENTS, PyGameUi
+
+
+class HeadlessPyGameUi(PyGameUi):
+    def __init__(self, config: dict, message_provider: MessageProvider, assets_from: PyGameUi | None = None) -> None:
+        """`assets_from` shares the images already loaded by another UI with the same config."""
+        self._assets_from = assets_from
+        self._posted: list[pygame.event.Event] = []
+        super().__init__(config, message_provider)
+
+    def _init_pygame(self) -> None:
+        # No display: only text rendering is needed
+        pygame.font.init()
+
+    def _create_screen(self, config: dict) -> pygame.Surface:
+        """Create the off-screen surface drawn in place of the window."""
+        return pygame.Surface((config["width"], config["height"]), depth=32)
+
+    def _resize_screen(self, size: tuple[int, int]) -> pygame.Surface:
+        return pygame.Surface(size, depth=32)
+
+    def _load_assets(self, config: dict) -> None:
+        if self._assets_from is not None:
+            self.room_images = self._assets_from.room_images
+            self.object_images = self._assets_from.object_images
+            self._scaled_rooms = self._assets_from._scaled_rooms
+            self._scaled_objects = self._assets_from._scaled_objects
+            return
+        super()._load_assets(config)
+
+    def _convert_image(self, image: pygame.Surface, alpha: bool) -> pygame.Surface:
+        # Converting needs a display, so images are drawn as loaded, except that opaque images lose their
+        # alpha channel as convert() would drop it
+        if alpha or not image.get_flags() & pygame.SRCALPHA:
+            return image
+        return pygame.image.frombuffer(pygame.image.tobytes(image, "RGBX"), image.get_size(), "RGBX")
+
+    def tick(self, dt: float | None = None) -> None:
+        """Advance the game clock by `dt` seconds, one frame at the configured fps by default."""
+        dt = 1 / self.fps if dt is None else dt
+        self._timer_events.extend(self.game.advance(dt))
+        self.animator.update(dt)
+
+    def _poll_events(self) -> list[pygame.event.Event]:
+        events = [event for event in self._posted if event.type in self._allowed or event.type not in _INPUT_EVENTS]
+        self._posted = []
+        return events
+
+    def _restrict_input(self, allowed: list[int], text: bool) -> None:
+        # Posted events are filtered like the pygame queue would
+        self._allowed = set(allowed)
+
+    def _update_cursor(self) -> None:
+        pass
+
+    def _present(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        # pygame stays initialized for the other UIs in the process
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self.profiler.enabled and self._profiler_output:
+            self.profiler.dump(self._profiler_output)
+        self.is_running = False
+
+    def post(self, event: pygame.event.Event) -> None:
+        """Queue an input event for the next `input`."""
+        self._posted.append(event)
+
+    def click(self, pos: tuple[int, int]) -> None:
+        self.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+    def click_object(self, object_id: str) -> None:
+        """Click the center of an object in the current room or in the inventory."""
+        self._update_objects()
+        if object_id in self.objects:
+            rect = self.objects[object_id].move(self.game_area.get_abs_offset())
+        elif object_id in self.inventory:
+            rect = self.inventory[object_id].move(self.inventory_area.get_abs_offset())
+        else:
+            raise ValueError(f"object '{object_id}' is not on screen")
+        self.click(rect.center)
+
+    def press(self, key: int, unicode: str = "") -> None:
+        self.post(pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0))
+
+    def type_text(self, text: str, submit: bool = True) -> None:
+        """Type `text`, e.g. a code, and press return if `submit`."""
+        for char in text:
+            self.post(pygame.event.Event(pygame.TEXTINPUT, text=char))
+        if submit:
+            self.press(pygame.K_RETURN)
+
+    def step(self, dt: float | None = None) -> list[GameEvent]:
+        """Run one frame of the usual loop and return the events it handled."""
+        self.tick(dt)
+        events = self.input()
+        self.handle(events)
+        self.render()
+        return events
+
+    def frame(self, kind: str = "3") -> memoryview:
+        """Return the pixels of the last rendered frame without copying.
+
+        `kind` is a Surface.get_view kind: "3" gives (width, height, RGB) bytes,
+        "2" gives (width, height) mapped pixels.
+        """
+        return memoryview(self.screen.get_view(kind))
+
+    def save_frame(self, path: str | Path) -> None:
+        pygame.image.save(self.screen, path)
+
+
+def diff_frames(frame: pygame.Surface, golden: pygame.Surface, tolerance: float = 0.0) -> int:
+    """Count the pixels of `frame` that differ from `golden`.
+
+    `tolerance` is the color distance, from 0 to 1, under which pixels still
+    count as equal. Identical frames are detected with a single memory compare.
+    """
+    if frame.get_size() != golden.get_size():
+        raise ValueError(f"frame size {frame.get_size()} does not match golden size {golden.get_size()}")
+    if golden.get_bitsize() != frame.get_bitsize() or golden.get_masks() != frame.get_masks():
+        # Surface.convert needs a display, so blit into a surface of the frame's format instead
+        converted = pygame.Surface(frame.get_size(), 0, frame)
+        converted.blit(golden, (0, 0))
+        golden = converted
+
+    with memoryview(frame.get_buffer()) as a, memoryview(golden.get_buffer()) as b:
+        if a == b:
+            return 0
+
+    with pygame.PixelArray(frame) as a, pygame.PixelArray(golden) as b:
+        # Matching pixels come out white and differing ones black
+        comparison = a.compare(b, distance=tolerance).make_surface()
+    return pygame.mask.from_threshold(comparison, (0, 0, 0), (1, 1, 1, 255)).count()
+
+
+def compare_golden(
+    frame: pygame.Surface,
+    path: str | Path,
+    tolerance: float = 0.0,
+    update: bool = False,
+) -> int:
+    """Compare `frame` with the golden image at `path` and return the number of differing pixels.
+
+    A missing golden image, or `update`, saves `frame` as the new golden image.
+    """
+    path = Path(path)
+    if update or not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pygame.image.save(frame, path)
+        return 0
+    return diff_frames(frame, pygame.image.load(path), tolerance)
+
+
+class FrameBatch:
+    """Renders frames for many sessions, with one UI per session sharing the images."""
+
+    def __init__(self, config: dict, message_provider: MessageProvider) -> None:
+        self.config = config
+        self.message_provider = message_provider
+        self.uis: dict[str, HeadlessPyGameUi] = {}
+        self._assets: HeadlessPyGameUi | None = None
+
+    def ui(self, session_id: str, game: Game) -> HeadlessPyGameUi:
+        """Return the UI of a session, following `game` if the session was started again."""
+        ui = self.uis.get(session_id)
+        if ui is None:
+            ui = HeadlessPyGameUi(self.config, self.message_provider, assets_from=self._assets)
+            self._assets = self._assets or ui
+            self.uis[session_id] = ui
+        if getattr(ui, "game", None) is not game:
+            ui.init(game)
+        return ui
+
+    def handle(self, session_id: str, game: Game, events: list[GameEvent]) -> None:
+        """Pass events emitted by a session, e.g. in a server reply, to its UI for messages and overlays."""
+        self.ui(session_id, game).handle(events)
+
+    def render(self, games: Mapping[str, Game]) -> dict[str, pygame.Surface]:
+        """Render the current frame of every session and return their screens."""
+        frames = {}
+        for session_id, game in games.items():
+            ui = self.ui(session_id, game)
+            ui.render()
+            frames[session_id] = ui.screen
+        return frames
+
+    def drop(self, session_ids: Iterable[str]) -> None:
+        for session_id in session_ids:
+            self.uis.pop(session_id, None)
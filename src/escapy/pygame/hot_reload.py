@@ -0,0 +1,188 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Hot reloading of images and messages while authoring rooms.
+
+A `HotReloader` watches the config file and every image it references:
+
+    ui = PyGameUi(config["ui"], message_provider)
+    reloader = HotReloader(ui, "config.json")
+    ui.init(game)
+    while ui.is_running:
+        ui.tick()
+        reloader.poll()
+        ...
+
+When an image file changes, or the config points a room or object key at
+another file, only the images of the affected keys are reloaded and only
+their cached scaled copies and room layers are dropped. Changed, added and
+removed message entries take effect on the next event. The game keeps its
+state. Other UI settings, tiled backgrounds and animations still need a
+restart.
+
+Files are checked by polling their modification times every `interval`
+seconds, which costs a few stat calls and needs no extra dependency. A file
+that cannot be read yet, e.g. saved halfway or briefly missing during an
+atomic rename, is logged and tried again on the next poll, keeping what was
+loaded before.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from time import monotonic
+
+import pygame
+
+from ..messages import dict_message_provider
+from .pygame_ui import PyGameUi, _room_image
+
+logger = logging.getLogger(__name__)
+
+
+class HotReloader:
+    def __init__(self, ui: PyGameUi, config_path: str | Path, interval: float = 0.5):
+        """Watch `config_path`, holding the config of `ui` under 'ui' and the messages, from now on.
+
+        The UI's message provider is replaced by one reading the watched messages.
+        """
+        self.ui = ui
+        self.config_path = Path(config_path)
+        self.interval = interval
+        with open(self.config_path) as f:
+            config = json.load(f)
+        self._ui_config: dict = config["ui"]
+        self.messages: dict[str, str] = dict(config.get("messages", {}))
+        ui._get_event_message = dict_message_provider(self.messages)
+        self._mtimes = self._stat_files()
+        self._checked_at = monotonic()
+
+    def poll(self) -> list[str]:
+        """Reload what changed since the last check, at most every `interval` seconds.
+
+        Returns the keys of the reloaded images and messages.
+        """
+        now = monotonic()
+        if now - self._checked_at < self.interval:
+            return []
+        self._checked_at = now
+
+        mtimes = self._stat_files()
+        changed = {path for path, mtime in mtimes.items() if mtime is not None and self._mtimes.get(path) != mtime}
+        self._mtimes = mtimes
+        if not changed:
+            return []
+
+        old_rooms = self._room_files()
+        old_objects = self._object_files()
+        reloaded = []
+        if self.config_path in changed:
+            try:
+                with open(self.config_path) as f:
+                    config = json.load(f)
+                if not isinstance(config, dict) or "ui" not in config:
+                    raise ValueError("no 'ui' config")
+            except (OSError, ValueError) as e:
+                # Saved halfway: the next save changes the modification time again
+                logger.warning("cannot reload %s: %s", self.config_path, e)
+                config = None
+            if config is not None:
+                self._ui_config = config["ui"]
+                reloaded.extend(self._update_messages(config.get("messages", {})))
+                # Newly referenced files are watched from now on
+                self._mtimes = self._stat_files()
+
+        assets_dir = Path(self._ui_config["assets_dir"])
+        images: dict[tuple[str, bool], pygame.Surface | None] = {}
+
+        def load(name: str, alpha: bool) -> pygame.Surface | None:
+            # Keys sharing a file share the reloaded surface, like ImageFiles does
+            if (name, alpha) not in images:
+                path = assets_dir / name
+                try:
+                    images[(name, alpha)] = self.ui._convert_image(pygame.image.load(path), alpha)
+                except (pygame.error, OSError) as e:
+                    logger.warning("cannot reload %s: %s", path, e)
+                    images[(name, alpha)] = None
+                    # Seen as changed on the next poll
+                    self._mtimes[path] = None
+            return images[(name, alpha)]
+
+        for room, name in self._room_files().items():
+            if old_rooms.get(room) != name or assets_dir / name in changed:
+                if (image := load(name, alpha=False)) is not None:
+                    self._replace_room(room, image)
+                    reloaded.append(room)
+        for key, name in self._object_files().items():
+            if old_objects.get(key) != name or assets_dir / name in changed:
+                if (image := load(name, alpha=True)) is not None:
+                    self._replace_object(key, image)
+                    reloaded.append(key)
+        return reloaded
+
+    def _update_messages(self, messages: dict[str, str]) -> list[str]:
+        """Apply the entries of `messages` that differ, in place, and return their keys."""
+        changed = [key for key in self.messages.keys() | messages.keys() if self.messages.get(key) != messages.get(key)]
+        for key in changed:
+            if key in messages:
+                self.messages[key] = messages[key]
+            else:
+                del self.messages[key]
+        return changed
+
+    def _replace_room(self, room: str, image: pygame.Surface) -> None:
+        ui = self.ui
+        old = ui.room_images.get(room)
+        if old is not None:
+            ui._mips.pop(id(old), None)
+        ui.room_images[room] = image
+        ui._scaled_rooms.pop(room, None)
+        ui._room_layers.pop(room, None)
+
+    def _replace_object(self, key: str, image: pygame.Surface) -> None:
+        ui = self.ui
+        old = ui.object_images.get(key)
+        if old is not None:
+            ui._mips.pop(id(old), None)
+        ui.object_images[key] = image
+        for scaled_key in [scaled_key for scaled_key in ui._scaled_objects if scaled_key[0] == key]:
+            del ui._scaled_objects[scaled_key]
+        ui._invalidate_object_layers(key.split(":")[0])
+
+    def _room_files(self) -> dict[str, str]:
+        return {
+            room: image for room, spec in self._ui_config["rooms"].items() if (image := _room_image(spec)) is not None
+        }
+
+    def _object_files(self) -> dict[str, str]:
+        return dict(self._ui_config["objects"])
+
+    def _stat_files(self) -> dict[Path, int | None]:
+        """Return the modification time of the config and of every image, None for missing files."""
+        assets_dir = Path(self._ui_config["assets_dir"])
+        paths = [
+            self.config_path,
+            *{assets_dir / name for name in [*self._room_files().values(), *self._object_files().values()]},
+        ]
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                mtimes[path] = None
+        return mtimes
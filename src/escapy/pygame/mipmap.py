@@ -0,0 +1,69 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Mip chains: an image with successively halved copies.
+
+Scaling an image far down in one step skips most of its pixels, which looks
+noisy and costs the same as scaling the full image. A MipChain scales from the
+smallest level that is still at least as large as the target, so every scale
+reads about as many pixels as it writes and each level has been filtered from
+the one above it. Scaled results can be cached until the next resize.
+"""
+
+import pygame
+
+
+class MipChain:
+    def __init__(self, image: pygame.Surface, min_size: int = 8):
+        self.levels = [image]
+        self.min_size = min_size
+        self._scaled: dict[tuple[int, int], pygame.Surface] = {}
+
+    def scaled(self, size: tuple[int, int], cache: bool = True) -> pygame.Surface:
+        """Return the image scaled to `size`, from the nearest larger level."""
+        scaled = self._scaled.get(size)
+        if scaled is None:
+            scaled = self._scale(size)
+            if cache:
+                self._scaled[size] = scaled
+        return scaled
+
+    def forget_scaled(self) -> None:
+        self._scaled.clear()
+
+    def _scale(self, size: tuple[int, int]) -> pygame.Surface:
+        i = 0
+        while True:
+            width, height = self.levels[i].get_size()
+            if width // 2 < max(size[0], self.min_size) or height // 2 < max(size[1], self.min_size):
+                break
+            i += 1
+            if i == len(self.levels):
+                self.levels.append(_halve(self.levels[-1]))
+
+        level = self.levels[i]
+        return level if level.get_size() == size else pygame.transform.scale(level, size)
+
+
+def _halve(image: pygame.Surface) -> pygame.Surface:
+    size = (image.get_width() // 2, image.get_height() // 2)
+    try:
+        # Averages each 2x2 block
+        return pygame.transform.smoothscale(image, size)
+    except ValueError:
+        # smoothscale only handles 24 and 32 bit images
+        return pygame.transform.scale(image, size)
@@ -0,0 +1,90 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+from collections import deque
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from time import perf_counter
+
+# Shared by every phase when profiling is off, so a disabled phase costs one
+# method call and an empty with block.
+_DISABLED = nullcontext()
+
+
+class _Phase:
+    __slots__ = ("_samples", "_start")
+
+    def __init__(self, samples: deque[float]):
+        self._samples = samples
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, *_exc) -> None:
+        self._samples.append(perf_counter() - self._start)
+
+
+class FrameProfiler:
+    """Rolling per-phase timings of the UI loop.
+
+    Each phase keeps the durations of its last `window` runs, in seconds.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 300):
+        self.enabled = enabled
+        self.window = window
+        self.samples: dict[str, deque[float]] = {}
+        self._phases: dict[str, _Phase] = {}
+
+    def phase(self, name: str) -> AbstractContextManager:
+        """Return a context manager timing one run of phase `name`."""
+        if not self.enabled:
+            return _DISABLED
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = self._phases[name] = _Phase(self._samples(name))
+        return phase
+
+    def record(self, name: str, seconds: float) -> None:
+        if self.enabled:
+            self._samples(name).append(seconds)
+
+    def percentiles(self, name: str) -> dict[str, float]:
+        """Return p50, p95, p99 and max of phase `name`, in milliseconds."""
+        values = sorted(self.samples.get(name, ()))
+        if not values:
+            return {}
+
+        def at(q: float) -> float:
+            return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+        return {"p50": at(0.50), "p95": at(0.95), "p99": at(0.99), "max": values[-1] * 1000}
+
+    def report(self) -> dict[str, dict[str, float]]:
+        return {name: self.percentiles(name) for name in self.samples}
+
+    def dump(self, path: str | Path) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def _samples(self, name: str) -> deque[float]:
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.window)
+        return samples
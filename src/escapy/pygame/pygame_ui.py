@@ -15,21 +15,41 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with escapy. If not, see <https://www.gnu.org/licenses/>.
 
+import math
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from time import perf_counter
 
 import pygame
 
-from ..game import Game
+from ..columnar_room import ColumnarRoom
+from ..game import Game, GameAspect
 from ..game_events import (
     AskedForCodeEvent,
     GameEndedEvent,
     GameEvent,
     InspectedEvent,
+    MovedToRoomEvent,
 )
 from ..messages import MessageProvider
 from ..protocols import InventoryInteractable, Placeable, Unlockable
 from ..ui import GameUi
+from .animation import Animator
+from .asset_pack import AssetPack
+from .atlas import ImageFiles, pack_atlases
+from .audio import Audio
+from .mipmap import MipChain
+from .profiler import FrameProfiler
+from .tiles import TiledBackground
+
+# Camera moves, in scroll steps, for the arrow keys
+_SCROLL_KEYS = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
 
 
 @dataclass
@@ -57,18 +77,68 @@ class _InspectState:
     rect: pygame.Rect
 
 
+# Keyboard, mouse, touch and text input; window, timer and user events always reach the queue
+_INPUT_EVENTS = frozenset(
+    {
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING,
+    }
+)
+
+# Input each state handles, on top of keys; other input is kept out of the queue
+_STATE_INPUT = {
+    _NormalState: [pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL, pygame.MOUSEMOTION],
+    _InsertCodeState: [pygame.TEXTINPUT],
+    _InspectState: [pygame.MOUSEBUTTONDOWN],
+}
+
+
 type _UIState = _NormalState | _InsertCodeState | _InspectState
 
 
+def _room_image(spec: str | dict) -> str | None:
+    """Return the image file of a room in the UI config, None for tiled rooms."""
+    return spec if isinstance(spec, str) else spec.get("image")
+
+
+def _room_size(spec: str | dict) -> tuple[float, float]:
+    """Return the size of a room in the UI config, in screens."""
+    if isinstance(spec, str):
+        return (1.0, 1.0)
+    return (spec.get("width", 1.0), spec.get("height", 1.0))
+
+
+def _coalesce_input(events: list[pygame.event.Event]) -> list[pygame.event.Event]:
+    """Merge runs of text input into one event and keep only the last mouse motion, moved to the end."""
+    coalesced: list[pygame.event.Event] = []
+    motion = None
+    for event in events:
+        if event.type == pygame.MOUSEMOTION:
+            motion = event
+        elif event.type == pygame.TEXTINPUT and coalesced and coalesced[-1].type == pygame.TEXTINPUT:
+            coalesced[-1] = pygame.event.Event(pygame.TEXTINPUT, text=coalesced[-1].text + event.text)
+        else:
+            coalesced.append(event)
+    if motion is not None:
+        coalesced.append(motion)
+    return coalesced
+
+
 class PyGameUi(GameUi):
     def __init__(self, config: dict, message_provider: MessageProvider) -> None:
-        pygame.init()
-        pygame.display.set_caption(config["title"])
+        self._init_pygame()
 
         # Initialize display
-        width = config["width"]
-        height = config["height"]
-        self.screen = pygame.display.set_mode((width, height))
+        self.screen = self._create_screen(config)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont(None, 28)
         self.fps = config["fps"]
@@ -82,20 +152,136 @@ class PyGameUi(GameUi):
         # Calculate initial layout
         self._calculate_layout()
 
+        # Rooms are one screen unless configured larger; larger rooms scroll, see _scroll
+        self.room_sizes = {room: _room_size(spec) for room, spec in config["rooms"].items()}
+        self.scroll_step = config.get("scroll_step", 0.25)
+        self._cameras: dict[str, tuple[float, float]] = {}
+
         # Load assets
-        assets_dir = Path(config["assets_dir"])
-        self.room_images = {
-            room: pygame.image.load(assets_dir / image).convert() for room, image in config["rooms"].items()
-        }
-        self.object_images = {
-            object: pygame.image.load(assets_dir / image).convert_alpha() for object, image in config["objects"].items()
+        self._load_assets(config)
+        self._tiled_rooms = {
+            room: TiledBackground(
+                Path(config["assets_dir"]) / spec["tiles"],
+                lambda path: self._convert_image(pygame.image.load(path), False),
+                cache_size=config.get("tile_cache_size", 64),
+            )
+            for room, spec in config["rooms"].items()
+            if isinstance(spec, dict) and "tiles" in spec
         }
 
+        # Sprite animations and tweens, see Animator
+        frames = ImageFiles(config["assets_dir"], self._convert_image)
+        self.animator = Animator.from_config(config, lambda name: frames.load(name, alpha=True))
+        self.animator.on_change = self._invalidate_object_layers
+
+        # Sound effects for events and music per room, see Audio
+        self.audio = Audio.from_config(config)
+
+        # Mip chains of the loaded images, by surface id since keys can share a surface
+        self._mips: dict[int, MipChain] = {}
+
+        # Room backgrounds with their objects drawn on, the camera offset they were drawn at and the
+        # animated objects left out. Rebuilt when the game reports a change to the room or the camera moves.
+        self._room_layers: dict[str, tuple[tuple[int, int], pygame.Surface, list[str]]] = {}
+        self._unsubscribe: Callable[[], None] | None = None
+
         self.is_running = False
-        self._state: _UIState = _NormalState()
+        self._set_state(_NormalState())
         self.messages: list[str] = []
         self._get_event_message = message_provider
 
+        # Timer shown as a mm:ss countdown in the top right corner of the room, if any
+        self.countdown_timer: str | None = config.get("countdown_timer")
+        # Events of timers that expired during tick, returned by the next input
+        self._timer_events: list[GameEvent] = []
+
+        # Object under the mouse, as (area, id), updated once per frame
+        self.hovered: tuple[str, str] | None = None
+        # Clicks on the object clicked less than this many seconds before are ignored
+        self.click_debounce = config.get("click_debounce", 0.25)
+        self._last_click: tuple[tuple[str, str] | None, float] = (None, 0.0)
+
+        # Frame profiler, see FrameProfiler
+        profiler_config = config.get("profiler", {})
+        self.profiler = FrameProfiler(
+            enabled=profiler_config.get("enabled", False),
+            window=profiler_config.get("window", 300),
+        )
+        self._profiler_output = profiler_config.get("output")
+        # A key name, resolved when pressed: key codes can only be looked up once pygame is initialized
+        self._profiler_toggle_key: str = profiler_config.get("toggle_key", "f3")
+        self._show_profiler = False
+        self._profiler_lines: list[pygame.Surface] = []
+        self._profiler_refreshed_at = 0.0
+        self._last_tick: float | None = None
+
+    def _init_pygame(self) -> None:
+        """Start the pygame subsystems the UI uses; Audio starts the mixer if sounds are configured."""
+        pygame.display.init()
+        pygame.font.init()
+
+    def _create_screen(self, config: dict) -> pygame.Surface:
+        """Open the window, whose surface is the screen."""
+        pygame.display.set_caption(config["title"])
+        self._display_flags = pygame.RESIZABLE if config.get("resizable", False) else 0
+        return pygame.display.set_mode((config["width"], config["height"]), self._display_flags)
+
+    def _resize_screen(self, size: tuple[int, int]) -> pygame.Surface:
+        return pygame.display.set_mode(size, self._display_flags)
+
+    def resize(self, size: tuple[int, int]) -> None:
+        """Resize the screen and lay the UI out again for the new size."""
+        self.screen = self._resize_screen(size)
+        self._calculate_layout()
+        self._room_layers.clear()
+        self._scaled_objects.clear()
+        for chain in self._mips.values():
+            chain.forget_scaled()
+        if isinstance(self._state, _InspectState):
+            self._show_inspect(self._state.object_id)
+
+    def _load_assets(self, config: dict) -> None:
+        """Load room and object images, converted to the display format, or map them from an asset pack."""
+        # Images already scaled to the size they are drawn at, see AssetPack
+        self._scaled_rooms: dict[str, pygame.Surface] = {}
+        self._scaled_objects: dict[tuple[str, int, int], pygame.Surface] = {}
+        if config.get("asset_pack") is not None:
+            self._load_asset_pack(config["asset_pack"])
+            return
+
+        files = ImageFiles(config["assets_dir"], self._convert_image)
+        self.room_images = {
+            room: files.load(image, alpha=False)
+            for room, spec in config["rooms"].items()
+            if (image := _room_image(spec)) is not None
+        }
+        self.object_images = {object: files.load(image, alpha=True) for object, image in config["objects"].items()}
+        atlas_size = config.get("atlas_size", 1024)
+        if atlas_size is not None:
+            self.object_images = pack_atlases(self.object_images, atlas_size)
+
+    def _convert_image(self, image: pygame.Surface, alpha: bool) -> pygame.Surface:
+        return image.convert_alpha() if alpha else image.convert()
+
+    def _load_asset_pack(self, path: str) -> None:
+        """Wrap the images of an asset pack in surfaces, using its scaled images if it matches the layout."""
+        pack = AssetPack(path)
+        self.room_images = pack.rooms()
+        self.object_images = pack.objects()
+        if pack.layout == self._layout_signature():
+            self._scaled_rooms = pack.scaled_rooms()
+            self._scaled_objects = pack.scaled_objects()
+
+    def _layout_signature(self) -> list:
+        """Everything the drawn size of images depends on."""
+        return [
+            *self.screen.get_size(),
+            self.game_area_horizontal_fraction,
+            self.game_area_vertical_fraction,
+            self.inventory_columns,
+            self.inventory_spacing_fraction,
+        ]
+
     def _calculate_layout(self) -> None:
         """Calculate all layout dimensions based on current screen size and fractions."""
         screen_width, screen_height = self.screen.get_size()
@@ -120,19 +306,44 @@ class PyGameUi(GameUi):
         self.inventory_object_size = available_width / self.inventory_columns
 
     def init(self, game: Game):
+        if self._unsubscribe is not None:
+            self._unsubscribe()
         self.game = game
+        self._room_layers.clear()
+        self._unsubscribe = game.subscribe(self._invalidate_room_layers, "rooms", "locks")
         self._update_objects()
+        self._enter_room(game.current_room_id)
         self.is_running = True
 
     def tick(self):
-        self.clock.tick(self.fps)
+        dt = self.clock.tick(self.fps)
+        self._timer_events.extend(self.game.advance(dt / 1000))
+        self.animator.update(dt / 1000)
+        if self.profiler.enabled:
+            now = perf_counter()
+            if self._last_tick is not None:
+                self.profiler.record("frame", now - self._last_tick)
+            self._last_tick = now
 
     def input(self) -> list[GameEvent]:
-        events: list[GameEvent] = []
+        with self.profiler.phase("input"):
+            return self._input()
+
+    def _input(self) -> list[GameEvent]:
+        events = self._timer_events
+        self._timer_events = []
 
-        for event in pygame.event.get():
+        for event in _coalesce_input(self._poll_events()):
             if event.type == pygame.QUIT:
                 events = self.game.quit()
+            elif event.type == pygame.VIDEORESIZE:
+                self.resize(event.size)
+            elif (
+                self.profiler.enabled
+                and event.type == pygame.KEYDOWN
+                and event.key == pygame.key.key_code(self._profiler_toggle_key)
+            ):
+                self._show_profiler = not self._show_profiler
             elif isinstance(self._state, _InspectState):
                 events.extend(self._handle_inspect_input(event))
             elif isinstance(self._state, _InsertCodeState):
@@ -142,11 +353,81 @@ class PyGameUi(GameUi):
 
         return events
 
+    def _poll_events(self) -> list[pygame.event.Event]:
+        return pygame.event.get()
+
+    def _set_state(self, state: _UIState) -> None:
+        """Switch to `state`, letting only the input it handles into the event queue."""
+        self._state = state
+        allowed = [pygame.KEYDOWN, *_STATE_INPUT[type(state)]]
+        self._restrict_input(allowed, text=isinstance(state, _InsertCodeState))
+
+    def _restrict_input(self, allowed: list[int], text: bool) -> None:
+        """Block the input event types not in `allowed`, and enable text input if `text`."""
+        pygame.event.set_allowed(None)
+        pygame.event.set_blocked([event_type for event_type in _INPUT_EVENTS if event_type not in allowed])
+        if text:
+            pygame.key.start_text_input()
+        else:
+            pygame.key.stop_text_input()
+
+    def _object_at(self, pos: tuple[int, int]) -> tuple[str, str] | None:
+        """Return the area ("room" or "inventory") and id of the topmost object at screen position `pos`."""
+        for area, name, rects in (
+            (self.game_area, "room", self.objects),
+            (self.inventory_area, "inventory", self.inventory),
+        ):
+            offset = area.get_abs_offset()
+            if area.get_rect(topleft=offset).collidepoint(pos):
+                for object_id, rect in reversed(rects.items()):
+                    if rect.move(offset).collidepoint(pos):
+                        return (name, object_id)
+        return None
+
+    def _hover(self, pos: tuple[int, int]) -> None:
+        hovered = self._object_at(pos)
+        if hovered != self.hovered:
+            self.hovered = hovered
+            self._update_cursor()
+
+    def _update_cursor(self) -> None:
+        """Show a hand over objects."""
+        try:
+            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_HAND if self.hovered else pygame.SYSTEM_CURSOR_ARROW)
+        except pygame.error:
+            # Not every video driver has system cursors
+            pass
+
+    def _is_repeated_click(self, pos: tuple[int, int]) -> bool:
+        """Whether a click at `pos` hits the object clicked last, within `click_debounce` seconds."""
+        target = self._object_at(pos)
+        now = self.game.scheduler.time
+        last_target, last_time = self._last_click
+        self._last_click = (target, now)
+        return target is not None and target == last_target and now - last_time < self.click_debounce
+
     def _handle_normal_input(self, event: pygame.event.Event) -> list[GameEvent]:
         """Handle input when in NORMAL state."""
         events: list[GameEvent] = []
 
-        if event.type == pygame.MOUSEBUTTONDOWN and not self.game.is_finished:
+        if event.type == pygame.MOUSEMOTION:
+            self._hover(event.pos)
+        elif event.type == pygame.KEYDOWN and event.key in _SCROLL_KEYS:
+            self._scroll(*_SCROLL_KEYS[event.key])
+        elif event.type == pygame.MOUSEWHEEL:
+            if self.room_sizes[self.game.current_room_id][1] > 1:
+                self._scroll(event.x, -event.y)
+            else:
+                # Rooms that only scroll sideways take the vertical wheel too
+                self._scroll(event.x - event.y, 0)
+
+        # Buttons 4 and 5 are the wheel
+        if (
+            event.type == pygame.MOUSEBUTTONDOWN
+            and event.button not in (4, 5)
+            and not self.game.is_finished
+            and not self._is_repeated_click(event.pos)
+        ):
             click_pos = event.pos
 
             # Determine which area was clicked
@@ -156,23 +437,38 @@ class PyGameUi(GameUi):
             inventory_offset = self.inventory_area.get_abs_offset()
             inventory_abs_rect = self.inventory_area.get_rect(topleft=inventory_offset)
 
-            if game_area_abs_rect.collidepoint(click_pos):
+            room = self.game.rooms[self.game.current_room_id]
+            if game_area_abs_rect.collidepoint(click_pos) and isinstance(room, ColumnarRoom):
+                # Columnar rooms hit test all objects at once, in room fractions
+                camera_x, camera_y = self._camera_offset()
+                object_id = room.hit_test(
+                    (click_pos[0] - game_area_offset[0] + camera_x) / self.game_area.get_width(),
+                    (click_pos[1] - game_area_offset[1] + camera_y) / self.game_area.get_height(),
+                )
+                if object_id is not None:
+                    with self.profiler.phase("interact"):
+                        events = self.game.interact(object_id)
+
+            elif game_area_abs_rect.collidepoint(click_pos):
                 # Click in game area - check objects
                 for object_id, object_rect in self.objects.items():
                     abs_rect = object_rect.move(game_area_offset)
                     if abs_rect.collidepoint(click_pos):
-                        events = self.game.interact(object_id)
+                        with self.profiler.phase("interact"):
+                            events = self.game.interact(object_id)
 
             elif inventory_abs_rect.collidepoint(click_pos):
                 # Click in inventory area - check inventory objects
                 for object_id, object_rect in self.inventory.items():
                     abs_rect = object_rect.move(inventory_offset)
                     if abs_rect.collidepoint(click_pos):
-                        events = self.game.interact_inventory(object_id)
+                        with self.profiler.phase("interact"):
+                            events = self.game.interact_inventory(object_id)
                         break
                 else:
                     # Clicked in inventory area but not on any object
-                    events = self.game.interact_inventory(None)
+                    with self.profiler.phase("interact"):
+                        events = self.game.interact_inventory(None)
 
             # Clicks in message area are ignored
 
@@ -187,65 +483,170 @@ class PyGameUi(GameUi):
 
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
-                events = self.game.insert_code(self._state.object_id, self._state.text)
-                self._state = _NormalState()
+                with self.profiler.phase("interact"):
+                    events = self.game.insert_code(self._state.object_id, self._state.text)
+                self._set_state(_NormalState())
             elif event.key == pygame.K_ESCAPE:
-                self._state = _NormalState()
+                self._set_state(_NormalState())
             elif event.key == pygame.K_BACKSPACE:
                 self._state.text = self._state.text[:-1]
-            elif event.unicode and event.unicode.isprintable():
-                self._state.text += event.unicode
+        elif event.type == pygame.TEXTINPUT:
+            self._state.text += "".join(char for char in event.text if char.isprintable())
 
         return events
 
     def _handle_inspect_input(self, event: pygame.event.Event) -> list[GameEvent]:
         """Handle input when in INSPECT state."""
         if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
-            self._state = _NormalState()
+            self._set_state(_NormalState())
 
         return []
 
     def render(self):
-        self._update_objects()
+        profiler = self.profiler
 
-        # Draw room
-        game_area_size = (self.game_area.get_width(), self.game_area.get_height())
-        room_image = pygame.transform.scale(
-            self.room_images[self.game.current_room_id],
-            game_area_size,
-        )  # TODO: remove transform from game loop if too slow
-        self.game_area.blit(room_image, (0, 0))
-
-        # Draw objects
-        for object_id, rect in self.objects.items():
-            image = pygame.transform.scale(
-                self.object_images[self._get_repr(object_id)],
-                (rect.width, rect.height),
-            )  # TODO: remove transform from game loop if too slow
-            self.game_area.blit(image, rect)
+        with profiler.phase("update_objects"):
+            self._update_objects()
+
+        # Draw room and objects
+        with profiler.phase("render.room"):
+            layer, animated = self._room_layer()
+            self.game_area.blit(layer, (0, 0))
+
+        if animated:
+            with profiler.phase("render.animations"):
+                self._render_animated(animated)
 
         # Draw inventory
-        self.inventory_area.fill(pygame.Color(0, 0, 0))
-        for object_id, rect in self.inventory.items():
-            image = pygame.transform.scale(
-                self.object_images[self._get_repr(object_id)],
-                (rect.width, rect.height),
-            )  # TODO: remove transform from game loop if too slow
-            self.inventory_area.blit(image, rect)
-            if object_id == self.game.in_hand_object_id:
-                pygame.draw.rect(self.inventory_area, pygame.Color(255, 255, 255), rect, 3)
-            else:
-                pygame.draw.rect(self.inventory_area, pygame.Color(0, 0, 0), rect, 3)
+        with profiler.phase("render.inventory"):
+            self.inventory_area.fill(pygame.Color(0, 0, 0))
+            for object_id, rect in self.inventory.items():
+                self.inventory_area.blit(self._object_image(self._get_repr(object_id), rect.size), rect)
+                if object_id == self.game.in_hand_object_id:
+                    pygame.draw.rect(self.inventory_area, pygame.Color(255, 255, 255), rect, 3)
+                else:
+                    pygame.draw.rect(self.inventory_area, pygame.Color(0, 0, 0), rect, 3)
 
         # Draw message box
-        self._render_messages()
+        with profiler.phase("render.messages"):
+            self._render_messages()
 
         # Render state-specific overlays
-        if isinstance(self._state, _InsertCodeState):
-            self._render_insert_code_overlay()
-        elif isinstance(self._state, _InspectState):
-            self._render_inspect_overlay()
-
+        with profiler.phase("render.overlays"):
+            if isinstance(self._state, _InsertCodeState):
+                self._render_insert_code_overlay()
+            elif isinstance(self._state, _InspectState):
+                self._render_inspect_overlay()
+            if self.countdown_timer is not None:
+                self._render_countdown()
+
+        if self._show_profiler:
+            self._render_profiler_overlay()
+
+        with profiler.phase("flip"):
+            self._present()
+
+    def _room_layer(self) -> tuple[pygame.Surface, list[str]]:
+        """Return the current room's background with its static objects, composing it if it changed.
+
+        Also returns the animated objects, which are drawn separately every frame.
+        """
+        room_id = self.game.current_room_id
+        game_area_size = self.game_area.get_size()
+        offset = self._camera_offset()
+        cached = self._room_layers.get(room_id)
+        if cached is not None and cached[0] == offset and cached[1].get_size() == game_area_size:
+            return cached[1], cached[2]
+
+        with self.profiler.phase("render.compose"):
+            layer = pygame.Surface(game_area_size, 0, self.screen)
+            animated = []
+            self._room_layers[room_id] = (offset, layer, animated)
+            room_size = self._room_pixel_size(room_id)
+            if room_id in self._tiled_rooms:
+                self._tiled_rooms[room_id].draw(layer, offset, room_size)
+            else:
+                room_image = self._scaled_rooms.get(room_id)
+                if room_image is None or room_image.get_size() != room_size:
+                    # Scrolling rooms are composed again on every camera move, so keep their scaled image
+                    scrolls = room_size != game_area_size
+                    room_image = self._mip(self.room_images[room_id]).scaled(room_size, cache=scrolls)
+                layer.blit(room_image, (-offset[0], -offset[1]))
+            view = layer.get_rect()
+            for object_id, rect in self.objects.items():
+                key = self._get_repr(object_id)
+                if self.animator.is_animated(object_id, key):
+                    animated.append(object_id)
+                elif rect.colliderect(view):
+                    layer.blit(self._object_image(key, rect.size), rect)
+        return layer, animated
+
+    def _render_animated(self, object_ids: list[str]) -> None:
+        """Draw animated objects in their current pose over the room layer."""
+        for object_id in object_ids:
+            rect = self.objects[object_id]
+            key = self._get_repr(object_id)
+            pose = self.animator.pose(object_id, key)
+            size = (max(1, round(rect.width * pose.scale)), max(1, round(rect.height * pose.scale)))
+            # Frames are scaled once and cached; sizes of a scale tween are not worth keeping
+            image = self._mip(pose.image or self.object_images[key]).scaled(size, cache=pose.scale == 1.0)
+            if pose.alpha < 255:
+                image = image.copy()
+                image.set_alpha(max(0, round(pose.alpha)))
+            dest = image.get_rect(center=rect.center).move(
+                pose.offset[0] * self.game_area.get_width(),
+                pose.offset[1] * self.game_area.get_height(),
+            )
+            self.game_area.blit(image, dest)
+
+    def _room_pixel_size(self, room_id: str) -> tuple[int, int]:
+        width, height = self.room_sizes[room_id]
+        return (round(width * self.game_area.get_width()), round(height * self.game_area.get_height()))
+
+    def _camera_offset(self) -> tuple[int, int]:
+        """Return the pixel of the current room shown at the top left corner of the game area."""
+        x, y = self._cameras.get(self.game.current_room_id, (0.0, 0.0))
+        return (round(x * self.game_area.get_width()), round(y * self.game_area.get_height()))
+
+    def _scroll(self, dx: float, dy: float) -> None:
+        """Move the camera of the current room by `dx`, `dy` scroll steps, keeping it inside the room."""
+        room_id = self.game.current_room_id
+        width, height = self.room_sizes[room_id]
+        x, y = self._cameras.get(room_id, (0.0, 0.0))
+        x = min(max(x + dx * self.scroll_step, 0.0), width - 1)
+        y = min(max(y + dy * self.scroll_step, 0.0), height - 1)
+        self._cameras[room_id] = (x, y)
+
+    def _invalidate_room_layers(self, aspect: GameAspect, id: str | None) -> None:
+        """Drop the layers of the rooms a game change touches."""
+        if id is None:
+            self._room_layers.clear()
+        elif aspect == "rooms":
+            self._room_layers.pop(id, None)
+        else:
+            # A lock changed state: its object may be in any room
+            self._invalidate_object_layers(id)
+
+    def _invalidate_object_layers(self, object_id: str) -> None:
+        """Drop the layers of the rooms holding `object_id`."""
+        for room_id in [room_id for room_id in self._room_layers if object_id in self.game.rooms[room_id]]:
+            del self._room_layers[room_id]
+
+    def _object_image(self, key: str, size: tuple[int, int]) -> pygame.Surface:
+        """Return the image of `key` scaled to `size`."""
+        image = self._scaled_objects.get((key, *size))
+        if image is None:
+            image = self._mip(self.object_images[key]).scaled(size)
+        return image
+
+    def _mip(self, image: pygame.Surface) -> MipChain:
+        """Return the mip chain of a loaded image."""
+        chain = self._mips.get(id(image))
+        if chain is None:
+            chain = self._mips[id(image)] = MipChain(image)
+        return chain
+
+    def _present(self) -> None:
         pygame.display.flip()
 
     def _render_messages(self) -> None:
@@ -271,6 +672,17 @@ class PyGameUi(GameUi):
             self.message_area.blit(text_surface, (padding, y_offset))
             y_offset += line_height
 
+    def _render_countdown(self) -> None:
+        """Render the remaining time of the countdown timer."""
+        remaining = self.game.scheduler.remaining(self.countdown_timer)
+        if remaining is None:
+            return
+        minutes, seconds = divmod(math.ceil(remaining), 60)
+        text_surface = self.font.render(f"{minutes:02}:{seconds:02}", True, pygame.Color(255, 255, 255))
+        background = text_surface.get_rect(topright=(self.game_area.get_width() - 10, 10)).inflate(10, 6)
+        pygame.draw.rect(self.game_area, pygame.Color(0, 0, 0), background)
+        self.game_area.blit(text_surface, text_surface.get_rect(center=background.center))
+
     def _render_insert_code_overlay(self) -> None:
         """Render the code insertion overlay."""
         if not isinstance(self._state, _InsertCodeState):
@@ -318,12 +730,39 @@ class PyGameUi(GameUi):
         self.screen.blit(overlay, (0, 0))
         self.screen.blit(self._state.surface, self._state.rect)
 
+    def _render_profiler_overlay(self) -> None:
+        """Render the frame profiler percentiles in the top-left corner."""
+        # Percentiles are recomputed twice a second, not every frame
+        now = perf_counter()
+        if now - self._profiler_refreshed_at > 0.5:
+            self._profiler_refreshed_at = now
+            self._profiler_lines = [
+                self.font.render(
+                    f"{name:<18} p50 {p['p50']:6.2f}  p95 {p['p95']:6.2f}  p99 {p['p99']:6.2f} ms",
+                    True,
+                    pygame.Color(255, 255, 0),
+                    pygame.Color(0, 0, 0),
+                )
+                for name, p in sorted(self.profiler.report().items())
+                if p
+            ]
+
+        y_offset = 5
+        for line in self._profiler_lines:
+            self.screen.blit(line, (5, y_offset))
+            y_offset += line.get_height()
+
     def handle(self, events: list[GameEvent]) -> None:
+        with self.profiler.phase("handle"):
+            self._handle(events)
+
+    def _handle(self, events: list[GameEvent]) -> None:
         for event in events:
             # Get configured message for this event
             message = self._get_event_message(event)
             if message:
                 self.add_message(message)
+            self.audio.handle(event)
 
             # Handle state changes
             match event:
@@ -331,13 +770,27 @@ class PyGameUi(GameUi):
                     self.is_running = False
                 case AskedForCodeEvent(object_id=object_id):
                     prompt = message
-                    self._state = _InsertCodeState(object_id=object_id, prompt=prompt)
+                    self._set_state(_InsertCodeState(object_id=object_id, prompt=prompt))
                 case InspectedEvent(object_id=id):
                     self._show_inspect(id)
+                case MovedToRoomEvent(room_id=room_id):
+                    self._enter_room(room_id)
                 case _:
                     pass
 
+            object_id = getattr(event, "object_id", None)
+            if object_id in self.game.objects:
+                self.animator.trigger(event, object_id, self._get_repr(object_id))
+
+    def _enter_room(self, room_id: str) -> None:
+        self.audio.enter_room(room_id, [*self.game.rooms[room_id], *self.game.inventory])
+
     def quit(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self.profiler.enabled and self._profiler_output:
+            self.profiler.dump(self._profiler_output)
         pygame.quit()
 
     def add_message(self, message: str) -> None:
@@ -355,16 +808,24 @@ class PyGameUi(GameUi):
         game_area_width = self.game_area.get_width()
         game_area_height = self.game_area.get_height()
 
-        for id, position in self.game.rooms[self.game.current_room_id].items():
-            object = self.game.objects[id]
-            if not isinstance(object, Placeable):
-                raise ValueError("object is not placeable")
-            self.objects[id] = pygame.Rect(
-                position.x * game_area_width,
-                position.y * game_area_height,
-                object.width * game_area_width,
-                object.height * game_area_height,
-            )
+        # Positions are in room space: subtract the camera offset
+        camera_x, camera_y = self._camera_offset()
+        room = self.game.rooms[self.game.current_room_id]
+        if isinstance(room, ColumnarRoom):
+            # Sizes are already validated and stored by the room, scale all columns at once
+            for id, x, y, w, h in zip(room.ids, *room.scaled(game_area_width, game_area_height)):
+                self.objects[id] = pygame.Rect(x - camera_x, y - camera_y, w, h)
+        else:
+            for id, position in room.items():
+                object = self.game.objects[id]
+                if not isinstance(object, Placeable):
+                    raise ValueError("object is not placeable")
+                self.objects[id] = pygame.Rect(
+                    position.x * game_area_width - camera_x,
+                    position.y * game_area_height - camera_y,
+                    object.width * game_area_width,
+                    object.height * game_area_height,
+                )
 
         self.inventory: dict[str, pygame.Rect] = {}
         for i, id in enumerate(self.game.inventory):
@@ -396,4 +857,4 @@ class PyGameUi(GameUi):
         surface = pygame.transform.smoothscale(image, (target_w, target_h))
         rect = surface.get_rect(center=(screen_w // 2, screen_h // 2))
 
-        self._state = _InspectState(object_id=object_id, surface=surface, rect=rect)
+        self._set_state(_InspectState(object_id=object_id, surface=surface, rect=rect))
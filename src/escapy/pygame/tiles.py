@@ -0,0 +1,137 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Tiled backgrounds for rooms larger than the screen.
+
+A large background is split once into a directory of tiles:
+
+    python -m escapy.pygame.tiles hall.png assets/hall-tiles --tile-size 512
+
+which holds `index.json` (image size and tile size) and one `COL_ROW.png` per
+tile. `TiledBackground` draws the part of the background in view, loading the
+tiles it needs on demand, prefetching a ring of tiles around the view and
+evicting the least recently used ones, so only a few screens' worth of pixels
+is ever in memory.
+"""
+
+import argparse
+import json
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+
+import pygame
+
+
+class TiledBackground:
+    def __init__(
+        self,
+        directory: str | Path,
+        load: Callable[[Path], pygame.Surface] = pygame.image.load,
+        cache_size: int = 64,
+        prefetch_per_draw: int = 2,
+    ):
+        self.directory = Path(directory)
+        index = json.loads((self.directory / "index.json").read_text())
+        self.width: int = index["width"]
+        self.height: int = index["height"]
+        self.tile_size: int = index["tile_size"]
+        self.columns = math.ceil(self.width / self.tile_size)
+        self.rows = math.ceil(self.height / self.tile_size)
+        self.load = load
+        self.cache_size = cache_size
+        self.prefetch_per_draw = prefetch_per_draw
+        # Tiles scaled for the current draw size, least recently used first
+        self._tiles: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+        self._size: tuple[int, int] | None = None
+
+    def draw(self, surface: pygame.Surface, offset: tuple[int, int], size: tuple[int, int]) -> None:
+        """Draw the background scaled to `size`, with its pixel at `offset` on the top left corner of `surface`."""
+        if size != self._size:
+            self._tiles.clear()
+            self._size = size
+
+        view = pygame.Rect(offset, surface.get_size())
+        visible = self._tiles_in(view)
+        for col, row in visible:
+            rect = self._tile_rect(col, row)
+            surface.blit(self._tile(col, row), (rect.x - offset[0], rect.y - offset[1]))
+
+        # Load a few tiles of the ring around the view, so scrolling rarely waits for a load
+        margin = self._tile_rect(0, 0).size
+        ring = self._tiles_in(view.inflate(margin[0] * 2, margin[1] * 2))
+        missing = [tile for tile in ring if tile not in self._tiles]
+        for col, row in missing[: self.prefetch_per_draw]:
+            self._tile(col, row)
+
+        while len(self._tiles) > max(self.cache_size, len(visible)):
+            self._tiles.popitem(last=False)
+
+    def _tiles_in(self, rect: pygame.Rect) -> list[tuple[int, int]]:
+        scale_x = self._size[0] / self.width
+        scale_y = self._size[1] / self.height
+        first_col = max(0, int(rect.left / scale_x) // self.tile_size)
+        last_col = min(self.columns - 1, int((rect.right - 1) / scale_x) // self.tile_size)
+        first_row = max(0, int(rect.top / scale_y) // self.tile_size)
+        last_row = min(self.rows - 1, int((rect.bottom - 1) / scale_y) // self.tile_size)
+        return [(col, row) for row in range(first_row, last_row + 1) for col in range(first_col, last_col + 1)]
+
+    def _tile_rect(self, col: int, row: int) -> pygame.Rect:
+        """Return where a tile lands on the scaled background; edges are rounded so neighbours meet exactly."""
+        scale_x = self._size[0] / self.width
+        scale_y = self._size[1] / self.height
+        left = math.floor(col * self.tile_size * scale_x)
+        top = math.floor(row * self.tile_size * scale_y)
+        right = math.floor(min((col + 1) * self.tile_size, self.width) * scale_x)
+        bottom = math.floor(min((row + 1) * self.tile_size, self.height) * scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def _tile(self, col: int, row: int) -> pygame.Surface:
+        tile = self._tiles.get((col, row))
+        if tile is None:
+            image = self.load(self.directory / f"{col}_{row}.png")
+            tile = self._tiles[(col, row)] = pygame.transform.scale(image, self._tile_rect(col, row).size)
+        else:
+            self._tiles.move_to_end((col, row))
+        return tile
+
+
+def split_image(image_path: str | Path, directory: str | Path, tile_size: int = 512) -> None:
+    """Split the image at `image_path` into a tile directory for TiledBackground."""
+    image = pygame.image.load(image_path)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    width, height = image.get_size()
+    for row in range(math.ceil(height / tile_size)):
+        for col in range(math.ceil(width / tile_size)):
+            rect = pygame.Rect(col * tile_size, row * tile_size, tile_size, tile_size).clip(image.get_rect())
+            pygame.image.save(image.subsurface(rect), directory / f"{col}_{row}.png")
+    (directory / "index.json").write_text(json.dumps({"width": width, "height": height, "tile_size": tile_size}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split a large room background into tiles.")
+    parser.add_argument("image", type=Path)
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--tile-size", type=int, default=512)
+    args = parser.parse_args()
+    split_image(args.image, args.directory, args.tile_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Named timers running commands at future game times.
+
+Every Game has a Scheduler with its own clock, advanced by `Game.advance`
+(PyGameUi does it on every tick). Timers are named, and each name is bound to
+a command with `define`, so the scheduler state is plain data that snapshots
+can hold. Pending timers sit in a heap: starting, restarting and expiring a
+timer cost O(log n), and advancing the clock only looks at due timers.
+"""
+
+import heapq
+from typing import TYPE_CHECKING
+
+from .game_events import GameEvent, TimerExpiredEvent
+
+if TYPE_CHECKING:
+    from .commands import Command
+    from .game import Game
+
+
+class Scheduler:
+    def __init__(self):
+        self.time = 0.0
+        self.commands: dict[str, Command] = {}
+        # name -> due time of the pending timer; heap entries not matching it are stale
+        self._due: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    def define(self, name: str, command: "Command") -> None:
+        self.commands[name] = command
+
+    def start(self, name: str, delay: float) -> None:
+        """Start timer `name`, or restart it if it is already pending."""
+        if name not in self.commands:
+            raise ValueError(f"unknown timer '{name}'")
+        due = self.time + delay
+        self._due[name] = due
+        heapq.heappush(self._heap, (due, name))
+
+    def cancel(self, name: str) -> None:
+        # The heap entry is left behind and skipped when it comes up
+        self._due.pop(name, None)
+
+    def remaining(self, name: str) -> float | None:
+        """Seconds until timer `name` expires, or None if it is not pending."""
+        due = self._due.get(name)
+        return None if due is None else max(0.0, due - self.time)
+
+    def next_due(self) -> float | None:
+        """Game time of the next expiry, or None when no timer is pending."""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def advance(self, game: "Game", dt: float) -> list[GameEvent]:
+        """Move the clock forward by `dt` seconds and run every timer that expires."""
+        self.time += dt
+        events: list[GameEvent] = []
+        while (due := self.next_due()) is not None and due <= self.time:
+            _, name = heapq.heappop(self._heap)
+            del self._due[name]
+            events.append(TimerExpiredEvent(timer_id=name))
+            events.extend(self.commands[name](game))
+        return events
+
+    def snapshot(self) -> dict:
+        return {"time": self.time, "timers": dict(self._due)}
+
+    def restore(self, state: dict) -> None:
+        self.time = state["time"]
+        self._due = dict(state["timers"])
+        self._heap = [(due, name) for name, due in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
@@ -0,0 +1,62 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Compact, JSON-compatible encoding of GameEvents.
+
+An event is encoded as a list holding its class name followed by its field
+values in declaration order, with positions as [x, y]:
+
+    PickedUpEvent(object_id="a1-knife")  ->  ["PickedUpEvent", "a1-knife"]
+"""
+
+from dataclasses import fields
+from typing import get_args
+
+from .game_events import GameEvent
+from .game_types import Position
+
+EVENT_TYPES: dict[str, type] = {cls.__name__: cls for cls in get_args(GameEvent)}
+
+_FIELDS: dict[type, tuple[str, ...]] = {cls: tuple(f.name for f in fields(cls)) for cls in EVENT_TYPES.values()}
+
+
+def encode_event(event: GameEvent) -> list:
+    values = [type(event).__name__]
+    for name in _FIELDS[type(event)]:
+        value = getattr(event, name)
+        values.append([value.x, value.y] if isinstance(value, Position) else value)
+    return values
+
+
+def decode_event(data: list) -> GameEvent:
+    name, *values = data
+    cls = EVENT_TYPES.get(name)
+    if cls is None:
+        raise ValueError(f"unknown event type '{name}'")
+    kwargs = dict(zip(_FIELDS[cls], values, strict=True))
+    if "position" in kwargs:
+        x, y = kwargs["position"]
+        kwargs["position"] = Position(x=x, y=y)
+    return cls(**kwargs)
+
+
+def encode_events(events: list[GameEvent]) -> list[list]:
+    return [encode_event(event) for event in events]
+
+
+def decode_events(data: list[list]) -> list[GameEvent]:
+    return [decode_event(item) for item in data]
@@ -0,0 +1,352 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Asyncio server hosting many game sessions in one process.
+
+Clients talk newline-delimited JSON over TCP or a Unix socket. Each request
+names a session, which is created from `game_factory` on first use:
+
+    {"id": 1, "session": "tablet-3", "op": "interact", "object": "a1-knife"}
+    {"id": 2, "session": "tablet-3", "op": "inventory", "object": null}
+    {"id": 3, "session": "tablet-3", "op": "code", "object": "safe", "code": "1234"}
+    {"id": 4, "session": "tablet-3", "op": "quit"}
+    {"id": 5, "session": "tablet-3", "op": "spectate"}
+
+and every request gets one reply with the emitted events in the compact
+encoding of escapy.serialization, or an error:
+
+    {"id": 1, "events": [["PickedUpEvent", "a1-knife"]]}
+    {"id": 6, "error": "unknown op 'jump'"}
+
+With an AnalyticsSink (`--analytics-dir`), every event of every session is
+also recorded for escapy.analytics.
+
+After `spectate`, the connection also receives the session's sync messages
+(see escapy.sync), starting with a keyframe, as `{"sync": message}` lines.
+With `run_timers` running, keyframes keep coming every `keyframe_interval`
+seconds while the session is quiet.
+
+Session clocks follow wall-clock time: before a request is applied, the
+session's timers are advanced by the time elapsed since its last request, and
+the events of expired timers come first in the reply. With `run_timers`
+running, timers also fire on time between requests, and their events are
+pushed to the connections that used the session as
+`{"session": id, "events": [...]}` lines, as are those of timers that expired
+before a request that failed. One heap holds the next expiry of every
+session, so the task only wakes up when a timer is due.
+
+Game operations are short and synchronous, and every connection runs in its
+own task, so a busy session only ever delays others by one operation. Pushed
+lines are not waited for: a client that lets more than `max_write_buffer`
+bytes pile up unread is disconnected.
+
+Run a server for a declarative definition with:
+
+    python -m escapy.server game.json --port 8765
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from .analytics import AnalyticsSink
+from .game import Game
+from .game_events import GameEvent
+from .loader import build_game, load_definition
+from .serialization import encode_events
+from .sync import SyncEncoder, SyncMessage
+
+_SEPARATORS = (",", ":")
+
+
+class GameServer:
+    def __init__(
+        self,
+        game_factory: Callable[[], Game],
+        analytics: AnalyticsSink | None = None,
+        max_write_buffer: int = 1 << 20,
+        keyframe_interval: float = 5.0,
+    ):
+        self.game_factory = game_factory
+        self.analytics = analytics
+        self.max_write_buffer = max_write_buffer
+        self.keyframe_interval = keyframe_interval
+        self.sessions: dict[str, Game] = {}
+        self._spectators: dict[str, tuple[SyncEncoder, set[asyncio.StreamWriter]]] = {}
+        self._clients: dict[str, set[asyncio.StreamWriter]] = {}
+        # Wall-clock time each session's clock was last advanced to
+        self._advanced_at: dict[str, float] = {}
+        # session -> wall-clock time of its next timer; heap entries not matching it are stale
+        self._wakeups: dict[str, float] = {}
+        self._wakeup_heap: list[tuple[float, str]] = []
+        self._wakeups_changed = asyncio.Event()
+
+    def session(self, session_id: str) -> Game:
+        game = self.sessions.get(session_id)
+        if game is None:
+            game = self.sessions[session_id] = self.game_factory()
+            self._advanced_at[session_id] = time.monotonic()
+        return game
+
+    def handle_request(self, request: dict) -> dict:
+        """Apply one request and return its reply."""
+        reply: dict = {"id": request.get("id")}
+        timer_events: list[GameEvent] = []
+        try:
+            timer_events = self._advance(request["session"])
+            events = timer_events + self._apply(request)
+        except (KeyError, TypeError, ValueError) as e:
+            if timer_events:
+                # The timers have fired and left the scheduler even though the request failed
+                self._publish(request["session"], timer_events)
+                self._schedule_wakeup(request["session"])
+            reply["error"] = str(e) if isinstance(e, ValueError) else f"bad request: {e!r}"
+            return reply
+
+        reply["events"] = encode_events(events)
+        if self.analytics is not None:
+            self.analytics.record(request["session"], events)
+        if request["session"] in self._spectators:
+            self._broadcast(request["session"], events)
+        self._schedule_wakeup(request["session"])
+        return reply
+
+    async def run_timers(self) -> None:
+        """Fire session timers as they expire, pushing their events to the session's connections.
+
+        Also sends spectators the keyframes that fall due between requests.
+        """
+        while True:
+            self._wakeups_changed.clear()
+            now = time.monotonic()
+            while self._wakeup_heap and self._wakeup_heap[0][0] <= now:
+                due, session_id = heapq.heappop(self._wakeup_heap)
+                if self._wakeups.get(session_id) != due:
+                    continue
+                del self._wakeups[session_id]
+                events = self._advance(session_id)
+                if events:
+                    self._publish(session_id, events)
+                self._schedule_wakeup(session_id)
+
+            keyframe_due = self._send_keyframes()
+            dues = [self._wakeup_heap[0][0]] if self._wakeup_heap else []
+            if keyframe_due is not None:
+                dues.append(keyframe_due)
+            timeout = max(0.0, min(dues) - now) if dues else None
+            try:
+                await asyncio.wait_for(self._wakeups_changed.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    def _advance(self, session_id: str) -> list[GameEvent]:
+        """Advance the clock of a running session to the current time."""
+        game = self.sessions.get(session_id)
+        if game is None:
+            return []
+        now = time.monotonic()
+        elapsed = now - self._advanced_at[session_id]
+        self._advanced_at[session_id] = now
+        return game.advance(elapsed)
+
+    def _schedule_wakeup(self, session_id: str) -> None:
+        game = self.sessions.get(session_id)
+        due = game.scheduler.next_due() if game is not None else None
+        if due is None:
+            self._wakeups.pop(session_id, None)
+            return
+        wakeup = self._advanced_at[session_id] + due - game.scheduler.time
+        if self._wakeups.get(session_id) == wakeup:
+            return
+        self._wakeups[session_id] = wakeup
+        heapq.heappush(self._wakeup_heap, (wakeup, session_id))
+        if self._wakeup_heap[0][1] == session_id:
+            self._wakeups_changed.set()
+
+    def _publish(self, session_id: str, events: list[GameEvent]) -> None:
+        """Send events that no request asked for, such as expired timers."""
+        message = {"session": session_id, "events": encode_events(events)}
+        if self.analytics is not None:
+            self.analytics.record(session_id, events)
+        self._send(self._clients.get(session_id, set()), message)
+        if session_id in self._spectators:
+            self._broadcast(session_id, events)
+
+    def spectate(self, session_id: str, writer: asyncio.StreamWriter) -> None:
+        """Stream the sync messages of a session to `writer`, starting with a keyframe."""
+        self._write(writer, {"sync": self._join(session_id, writer)})
+
+    def _join(self, session_id: str, writer: asyncio.StreamWriter) -> SyncMessage:
+        """Add `writer` to the spectators of a session and return the keyframe it starts from."""
+        game = self.session(session_id)
+        if session_id not in self._spectators:
+            self._spectators[session_id] = (SyncEncoder(game, self.keyframe_interval), set())
+            # run_timers schedules its keyframes
+            self._wakeups_changed.set()
+        encoder, writers = self._encoder(session_id)
+        writers.add(writer)
+        return encoder.join_keyframe()
+
+    def _broadcast(self, session_id: str, events: list[GameEvent]) -> None:
+        encoder, writers = self._encoder(session_id)
+        for message in encoder.encode(events):
+            self._send(writers, {"sync": message})
+
+    def _send_keyframes(self) -> float | None:
+        """Send spectators the keyframes that are due and return when the next one is."""
+        next_due = None
+        for session_id in list(self._spectators):
+            encoder, writers = self._encoder(session_id)
+            for message in encoder.tick():
+                self._send(writers, {"sync": message})
+            due = encoder.next_keyframe_at()
+            next_due = due if next_due is None else min(next_due, due)
+        return next_due
+
+    def _encoder(self, session_id: str) -> tuple[SyncEncoder, set[asyncio.StreamWriter]]:
+        encoder, writers = self._spectators[session_id]
+        game = self.sessions.get(session_id)
+        if game is not None and game is not encoder.game:
+            # The session was quit and started again
+            encoder.rebind(game)
+        return encoder, writers
+
+    def _send(self, writers: set[asyncio.StreamWriter], message: dict) -> None:
+        for writer in list(writers):
+            if not self._write(writer, message):
+                writers.discard(writer)
+
+    def _write(self, writer: asyncio.StreamWriter, message: dict) -> bool:
+        """Queue `message` on `writer`, or drop the client if it is closed or too slow; return whether it was sent."""
+        if writer.is_closing():
+            return False
+        if writer.transport.get_write_buffer_size() > self.max_write_buffer:
+            # The client does not keep up with what is pushed to it; abort discards the buffer
+            writer.transport.abort()
+            return False
+        writer.write(json.dumps(message, separators=_SEPARATORS).encode() + b"\n")
+        return True
+
+    def _forget(self, writer: asyncio.StreamWriter, session_ids: set[str]) -> None:
+        """Stop pushing to a closed connection, which used or spectated `session_ids`."""
+        for session_id in session_ids:
+            clients = self._clients.get(session_id)
+            if clients is not None:
+                clients.discard(writer)
+                if not clients:
+                    del self._clients[session_id]
+            spectating = self._spectators.get(session_id)
+            if spectating is not None:
+                spectating[1].discard(writer)
+                if not spectating[1]:
+                    del self._spectators[session_id]
+
+    def _apply(self, request: dict) -> list[GameEvent]:
+        session_id = request["session"]
+        match request["op"]:
+            case "interact":
+                return self.session(session_id).interact(request["object"])
+            case "inventory":
+                return self.session(session_id).interact_inventory(request.get("object"))
+            case "code":
+                return self.session(session_id).insert_code(request["object"], request["code"])
+            case "quit":
+                game = self.sessions.pop(session_id, None)
+                self._advanced_at.pop(session_id, None)
+                return game.quit() if game is not None else []
+            case op:
+                raise ValueError(f"unknown op '{op}'")
+
+    async def serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # Sessions this connection receives pushed lines for
+        session_ids: set[str] = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    request = None
+                    self._write(writer, {"id": None, "error": f"invalid json: {e}"})
+
+                if request is None:
+                    pass
+                elif not isinstance(request, dict):
+                    self._write(writer, {"id": None, "error": "request must be an object"})
+                elif request.get("op") == "spectate":
+                    # Spectating needs the connection, so it is handled here rather than in handle_request
+                    session_id = request.get("session")
+                    if not isinstance(session_id, str):
+                        self._write(writer, {"id": request.get("id"), "error": "bad request: session must be a string"})
+                    else:
+                        keyframe = self._join(session_id, writer)
+                        self._write(writer, {"id": request.get("id"), "events": []})
+                        self._write(writer, {"sync": keyframe})
+                        session_ids.add(session_id)
+                else:
+                    self._write(writer, self.handle_request(request))
+                    if isinstance(request.get("session"), str):
+                        self._clients.setdefault(request["session"], set()).add(writer)
+                        session_ids.add(request["session"])
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._forget(writer, session_ids)
+            writer.close()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        return await asyncio.start_server(self.serve_client, host, port)
+
+    async def start_unix(self, path: str | Path) -> asyncio.Server:
+        return await asyncio.start_unix_server(self.serve_client, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve game sessions for a declarative game definition.")
+    parser.add_argument("definition", type=Path)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", type=Path, help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--cache-dir", type=Path)
+    parser.add_argument("--analytics-dir", type=Path, help="record every session's events there")
+    args = parser.parse_args()
+
+    definition = load_definition(args.definition, args.cache_dir)
+    analytics = AnalyticsSink(args.analytics_dir) if args.analytics_dir else None
+    server = GameServer(lambda: build_game(definition), analytics)
+
+    async def serve() -> None:
+        if args.unix:
+            listener = await server.start_unix(args.unix)
+        else:
+            listener = await server.start_tcp(args.host, args.port)
+        async with listener:
+            await asyncio.gather(listener.serve_forever(), server.run_timers())
+
+    try:
+        asyncio.run(serve())
+    finally:
+        if analytics is not None:
+            analytics.close()
+
+
+if __name__ == "__main__":
+    main()
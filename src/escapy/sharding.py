@@ -0,0 +1,212 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Game sessions sharded across worker processes.
+
+`ShardedSessions` hashes session ids onto a pool of worker processes, each
+owning the Games of its sessions and running the same request format as
+escapy.server. Requests are routed in batches over pipes, one round trip per
+worker per batch, with all workers processing their part in parallel.
+
+When `state_dir` is set, every worker persists a snapshot of each session it
+touched at the end of a batch. A crashed worker is restarted, reloads its
+sessions from those snapshots, and the interrupted batch is sent again. If the
+batch crashes the restarted worker too, its requests get error replies instead.
+Without `state_dir`, nothing survives a crash: the sessions of a restarted
+worker start over from `game_factory` on their next request. Sessions can also
+be moved between workers with `migrate`.
+
+`game_factory` is sent to the workers, so it must be picklable: a module-level
+function or a `loader.DefinitionFactory`.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+import tempfile
+import zlib
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+from .game import Game
+from .server import GameServer
+from .snapshot import Snapshot, restore, snapshot
+
+
+def _session_path(state_dir: Path, session_id: str) -> Path:
+    # Session ids come from clients, so they are hashed rather than used as file names
+    return state_dir / f"{hashlib.sha256(session_id.encode()).hexdigest()}.json"
+
+
+def _persist(state_dir: Path, session_id: str, state: Snapshot) -> None:
+    fd, tmp = tempfile.mkstemp(dir=state_dir, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump({"session": session_id, "state": state}, f)
+    os.replace(tmp, _session_path(state_dir, session_id))
+
+
+def _worker_main(conn: Connection, game_factory: Callable[[], Game], state_dir: Path | None) -> None:
+    server = GameServer(game_factory)
+
+    def restored(session_id: str, state: Snapshot) -> None:
+        game = server.session(session_id)
+        restore(game, state)
+
+    while True:
+        message = conn.recv()
+        match message:
+            case ("batch", requests):
+                replies = [server.handle_request(request) for request in requests]
+                if state_dir is not None:
+                    for session_id in {request.get("session") for request in requests}:
+                        if session_id in server.sessions:
+                            _persist(state_dir, session_id, snapshot(server.sessions[session_id]))
+                        else:
+                            _session_path(state_dir, session_id).unlink(missing_ok=True)
+                conn.send(replies)
+            case ("load", session_ids):
+                for session_id in session_ids:
+                    path = _session_path(state_dir, session_id) if state_dir is not None else None
+                    if path is not None and path.exists():
+                        restored(session_id, json.loads(path.read_text())["state"])
+                conn.send(None)
+            case ("snapshot", session_id):
+                game = server.sessions.get(session_id)
+                conn.send(snapshot(game) if game is not None else None)
+            case ("restore", session_id, state):
+                restored(session_id, state)
+                conn.send(None)
+            case ("drop", session_id):
+                server.sessions.pop(session_id, None)
+                conn.send(None)
+            case ("stop",):
+                conn.close()
+                return
+
+
+class ShardedSessions:
+    def __init__(
+        self,
+        game_factory: Callable[[], Game],
+        workers: int | None = None,
+        state_dir: str | Path | None = None,
+    ):
+        self.game_factory = game_factory
+        self.state_dir = Path(state_dir) if state_dir is not None else None
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+
+        count = workers or os.cpu_count() or 1
+        self._processes: list[multiprocessing.Process] = [None] * count
+        self._connections: list[Connection] = [None] * count
+        # Sessions owned by each worker, for restarts, and sessions moved away from their hashed worker
+        self._owned: list[set[str]] = [set() for _ in range(count)]
+        self._placement: dict[str, int] = {}
+        for worker in range(count):
+            self._start(worker)
+
+    def worker_for(self, session_id: str) -> int:
+        worker = self._placement.get(session_id)
+        if worker is None:
+            worker = zlib.crc32(session_id.encode()) % len(self._processes)
+        return worker
+
+    def submit(self, requests: list[dict]) -> list[dict]:
+        """Apply a batch of requests and return their replies, in request order."""
+        batches: dict[int, list[int]] = {}
+        for i, request in enumerate(requests):
+            batches.setdefault(self.worker_for(request["session"]), []).append(i)
+
+        for worker, indices in batches.items():
+            self._send(worker, ("batch", [requests[i] for i in indices]))
+
+        replies: list[dict] = [{}] * len(requests)
+        for worker, indices in batches.items():
+            batch = [requests[i] for i in indices]
+            try:
+                worker_replies = self._connections[worker].recv()
+            except EOFError, OSError:
+                # The worker died mid-batch: its sessions are back at their state before the batch
+                self._restart(worker)
+                try:
+                    worker_replies = self._call(worker, ("batch", batch))
+                except EOFError, OSError:
+                    # The batch itself crashes the worker, so it is not sent a third time
+                    self._restart(worker)
+                    for i, request in zip(indices, batch):
+                        replies[i] = {"id": request.get("id"), "error": "worker crashed"}
+                    continue
+
+            for i, reply in zip(indices, worker_replies):
+                replies[i] = reply
+            for request in batch:
+                if request.get("op") == "quit":
+                    self._owned[worker].discard(request["session"])
+                    self._placement.pop(request["session"], None)
+                else:
+                    self._owned[worker].add(request["session"])
+        return replies
+
+    def migrate(self, session_id: str, worker: int) -> None:
+        """Move a session to `worker`, carrying its state over in a snapshot."""
+        source = self.worker_for(session_id)
+        if source == worker:
+            return
+        state = self._call(source, ("snapshot", session_id))
+        if state is not None:
+            self._call(worker, ("restore", session_id, state))
+            self._owned[worker].add(session_id)
+        self._call(source, ("drop", session_id))
+        self._owned[source].discard(session_id)
+        self._placement[session_id] = worker
+
+    def close(self) -> None:
+        for worker, process in enumerate(self._processes):
+            if process.is_alive():
+                self._connections[worker].send(("stop",))
+            process.join()
+
+    def _start(self, worker: int) -> None:
+        parent, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(
+            target=_worker_main,
+            args=(child, self.game_factory, self.state_dir),
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        self._processes[worker] = process
+        self._connections[worker] = parent
+
+    def _restart(self, worker: int) -> None:
+        self._processes[worker].join(timeout=1)
+        self._connections[worker].close()
+        self._start(worker)
+        self._call(worker, ("load", sorted(self._owned[worker])))
+
+    def _send(self, worker: int, message: tuple) -> None:
+        try:
+            self._connections[worker].send(message)
+        except OSError:
+            self._restart(worker)
+            self._connections[worker].send(message)
+
+    def _call(self, worker: int, message: tuple):
+        self._send(worker, message)
+        return self._connections[worker].recv()
@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Snapshots of the mutable state of a Game.
+
+A snapshot is a JSON-compatible dict holding what commands change at runtime:
+room contents, current room, inventory, hand, lock states, pending timers and
+whether the game is finished. Objects and their commands are not included, so a snapshot is
+restored onto a Game built from the same definition.
+"""
+
+from .game import Game
+from .game_types import Position
+
+Snapshot = dict
+
+
+def snapshot(game: Game) -> Snapshot:
+    return {
+        "rooms": {
+            room_id: {object_id: [position.x, position.y] for object_id, position in room.items()}
+            for room_id, room in game.rooms.items()
+        },
+        "current_room": game.current_room_id,
+        "inventory": list(game.inventory),
+        "in_hand": game.in_hand_object_id,
+        # Runtime protocol checks are slow on large games, locks are found by their state attribute
+        "locks": {object_id: state for object_id, obj in game.objects.items() if (state := _lock_state(obj))},
+        "is_finished": game.is_finished,
+        "timers": game.scheduler.snapshot(),
+    }
+
+
+def _lock_state(obj: object) -> str | None:
+    state = getattr(obj, "state", None)
+    return state if state is not None and hasattr(obj, "unlock") else None
+
+
+def restore(game: Game, snapshot: Snapshot) -> None:
+    """Overwrite the state of `game` with `snapshot` and notify observers of every aspect."""
+    # Locks come first: the contents of the open containers are built again, and the rooms may
+    # hold them. Containers precede their contents in `locks`, as they were built before them.
+    for obj in list(game.objects.values()):
+        for object_id in getattr(obj, "contents", ()):
+            game.objects.pop(object_id, None)
+    for object_id, state in snapshot["locks"].items():
+        obj = game.objects[object_id]
+        obj.state = state
+        if state == "unlocked" and hasattr(obj, "materialize"):
+            obj.materialize(game)
+
+    for room_id, positions in snapshot["rooms"].items():
+        # Rooms are cleared in place, so room implementations such as ColumnarRoom are kept
+        room = game.rooms[room_id]
+        room.clear()
+        for object_id, (x, y) in positions.items():
+            room[object_id] = Position(x=x, y=y)
+
+    game.inventory[:] = snapshot["inventory"]
+    game.is_finished = snapshot["is_finished"]
+    if "timers" in snapshot:
+        game.scheduler.restore(snapshot["timers"])
+
+    game.current_room_id = snapshot["current_room"]
+    game.in_hand_object_id = snapshot["in_hand"]
+    game.notify("rooms")
+    game.notify("inventory")
+    game.notify("locks")
@@ -0,0 +1,219 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Delta-encoded state sync for spectator displays.
+
+`SyncEncoder` turns the events emitted by a live session into sync messages,
+and `SyncMirror` applies them to a read-only copy of the game, built from the
+same definition, which any GameUi can render.
+
+Messages are JSON-compatible dicts with a sequence number and either a
+keyframe (a full snapshot) or a list of deltas:
+
+    {"seq": 0, "k": {...snapshot...}}
+    {"seq": 1, "d": [["p", "a1-knife"], ["h", "a1-knife"]]}
+
+Deltas are short lists keyed by one letter:
+
+    ["p", id]                   picked up from the current room into the inventory
+    ["a", id]                   added to the inventory
+    ["h", id | None]            put in hand / off hand
+    ["u", id]                   unlocked
+    ["r", id, room, x, y]       revealed in a room
+    ["m", room]                 moved to room
+    ["e"]                       game ended
+    ["x", *encoded event]       event without state change, for messages
+
+A keyframe is sent first and then every `keyframe_interval` seconds: with the
+deltas of `encode`, or from `tick` while the game is quiet, so a mirror that
+missed a message catches up without waiting for the next player action
+(GameServer.run_timers ticks the encoders of spectated sessions). A mirror
+that sees a gap in sequence numbers ignores deltas until the next keyframe.
+Mirrors joining later start from `join_keyframe()`, which is tagged with the
+last sequence number sent, so the mirrors already following see no gap.
+"""
+
+import time
+
+from .game import Game
+from .game_events import (
+    AddedToInventoryEvent,
+    GameEndedEvent,
+    GameEvent,
+    MovedToRoomEvent,
+    PickedUpEvent,
+    PutInHandEvent,
+    PutOffHandEvent,
+    RevealedEvent,
+    UnlockedEvent,
+)
+from .game_types import Position
+from .serialization import decode_event, encode_event
+from .snapshot import restore, snapshot
+
+SyncMessage = dict
+
+
+class ReadOnlyGame(Game):
+    """A Game that ignores player interactions, for mirrors of remote sessions."""
+
+    def interact(self, object_id: str) -> list[GameEvent]:
+        return []
+
+    def interact_inventory(self, object_id: str | None) -> list[GameEvent]:
+        return []
+
+    def insert_code(self, object_id: str, code: str) -> list[GameEvent]:
+        return []
+
+    def advance(self, dt: float) -> list[GameEvent]:
+        # The clock runs for countdown displays, but timers only fire in the live session
+        self.scheduler.time += dt
+        return []
+
+
+def encode_delta(event: GameEvent) -> list:
+    match event:
+        case PickedUpEvent(object_id=id):
+            return ["p", id]
+        case AddedToInventoryEvent(object_id=id):
+            return ["a", id]
+        case PutInHandEvent(object_id=id):
+            return ["h", id]
+        case PutOffHandEvent():
+            return ["h", None]
+        case UnlockedEvent(object_id=id):
+            return ["u", id]
+        case RevealedEvent(object_id=id, room_id=room_id, position=position):
+            return ["r", id, room_id, position.x, position.y]
+        case MovedToRoomEvent(room_id=room_id):
+            return ["m", room_id]
+        case GameEndedEvent():
+            return ["e"]
+        case _:
+            return ["x", *encode_event(event)]
+
+
+class SyncEncoder:
+    def __init__(self, game: Game, keyframe_interval: float = 5.0, include_transient: bool = True):
+        self.game = game
+        self.keyframe_interval = keyframe_interval
+        self.include_transient = include_transient
+        self.seq = 0
+        self._last_keyframe: float | None = None
+
+    def rebind(self, game: Game) -> None:
+        """Follow another game, e.g. a restarted session; the next encode sends a keyframe."""
+        self.game = game
+        self._last_keyframe = None
+
+    def keyframe(self) -> SyncMessage:
+        self._last_keyframe = time.monotonic()
+        return self._message("k", snapshot(self.game))
+
+    def join_keyframe(self) -> SyncMessage:
+        """Return a keyframe for one new mirror, without taking a sequence number from the others."""
+        return {"seq": self.seq - 1, "k": snapshot(self.game)}
+
+    def encode(self, events: list[GameEvent]) -> list[SyncMessage]:
+        """Return the messages describing `events`, which the game has just emitted."""
+        messages = []
+        deltas = [encode_delta(event) for event in events]
+        if not self.include_transient:
+            deltas = [delta for delta in deltas if delta[0] != "x"]
+        if deltas:
+            messages.append(self._message("d", deltas))
+        return messages + self.tick()
+
+    def tick(self) -> list[SyncMessage]:
+        """Return a keyframe if one is due, else nothing."""
+        due = self.next_keyframe_at()
+        return [self.keyframe()] if due is None or time.monotonic() >= due else []
+
+    def next_keyframe_at(self) -> float | None:
+        """The time.monotonic() time the next keyframe is due, None if it is due now."""
+        return None if self._last_keyframe is None else self._last_keyframe + self.keyframe_interval
+
+    def _message(self, kind: str, payload) -> SyncMessage:
+        message = {"seq": self.seq, kind: payload}
+        self.seq += 1
+        return message
+
+
+class SyncMirror:
+    def __init__(self, game: Game):
+        self.game = game
+        self._next_seq: int | None = None
+
+    def apply(self, message: SyncMessage) -> list[GameEvent]:
+        """Apply a sync message and return the events it stands for, to pass to GameUi.handle.
+
+        The end of the game is applied but not returned, so spectator UIs keep running.
+        """
+        seq = message["seq"]
+        if "k" in message:
+            restore(self.game, message["k"])
+            self._next_seq = seq + 1
+            return []
+
+        if seq != self._next_seq:
+            # Missed a message: wait for the next keyframe
+            self._next_seq = None
+            return []
+        self._next_seq = seq + 1
+
+        return [event for delta in message["d"] if (event := self._apply_delta(delta)) is not None]
+
+    def _apply_delta(self, delta: list) -> GameEvent | None:
+        game = self.game
+        match delta:
+            case ["p", id]:
+                game.rooms[game.current_room_id].pop(id, None)
+                game.inventory.append(id)
+                game.notify("rooms", game.current_room_id)
+                game.notify("inventory", id)
+                return PickedUpEvent(object_id=id)
+            case ["a", id]:
+                game.inventory.append(id)
+                game.notify("inventory", id)
+                return AddedToInventoryEvent(object_id=id)
+            case ["h", id]:
+                game.in_hand_object_id = id
+                return PutInHandEvent(object_id=id) if id is not None else PutOffHandEvent()
+            case ["u", id]:
+                obj = game.objects[id]
+                obj.state = "unlocked"
+                if hasattr(obj, "materialize"):
+                    # The reveal deltas that follow place the contents
+                    obj.materialize(game)
+                game.notify("locks", id)
+                return UnlockedEvent(object_id=id)
+            case ["r", id, room_id, x, y]:
+                position = Position(x=x, y=y)
+                game.rooms[room_id][id] = position
+                game.notify("rooms", room_id)
+                return RevealedEvent(object_id=id, room_id=room_id, position=position)
+            case ["m", room_id]:
+                game.current_room_id = room_id
+                return MovedToRoomEvent(room_id=room_id)
+            case ["e"]:
+                game.is_finished = True
+                return None
+            case ["x", *event]:
+                return decode_event(event)
+            case _:
+                raise ValueError(f"unknown delta {delta!r}")
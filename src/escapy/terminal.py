@@ -0,0 +1,270 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+"""Text-mode GameUi for terminals.
+
+TerminalUi lists the current room's objects and the inventory with curses and
+reads commands typed at a prompt:
+
+    3       interact with object 3 of the room
+    i2      use object 2 of the inventory: put it in hand, or take it off
+    -       empty the hand
+    quit    quit the game
+
+Object ids work in place of numbers. When the game asks for a
+code, the next line typed is the code; an empty line cancels.
+
+It takes the same UI config as PyGameUi, using only `title`, `fps` and
+`countdown_timer`, plus optional `labels` naming objects. Waiting for keys is
+what paces the loop and the screen is only redrawn when something changed, so
+an idle game uses next to no CPU. No display, SDL or images are needed, which
+also makes it a quick way to play through a game definition:
+
+    python -m escapy.terminal game.example.json --config config.json
+"""
+
+import argparse
+import curses
+import json
+import math
+from pathlib import Path
+from time import monotonic
+
+from .game import Game
+from .game_events import AskedForCodeEvent, GameEndedEvent, GameEvent
+from .loader import load_game
+from .messages import MessageProvider, dict_message_provider
+from .protocols import Unlockable
+from .ui import GameUi
+
+_BACKSPACE = (curses.KEY_BACKSPACE, "\b", "\x7f")
+_ENTER = (curses.KEY_ENTER, "\n", "\r")
+_ESCAPE = "\x1b"
+
+
+class TerminalUi(GameUi):
+    def __init__(self, config: dict, message_provider: MessageProvider, screen: curses.window | None = None) -> None:
+        """`screen` is the curses window to draw in, e.g. from curses.wrapper; by default the UI opens one."""
+        self._owns_screen = screen is None
+        if screen is None:
+            screen = curses.initscr()
+            curses.noecho()
+            curses.cbreak()
+            screen.keypad(True)
+        self.screen = screen
+        self.title = config.get("title", "escapy")
+        self.fps = config.get("fps", 10)
+        self.screen.timeout(1000 // self.fps)
+        self.labels: dict[str, str] = config.get("labels", {})
+        self.countdown_timer: str | None = config.get("countdown_timer")
+
+        self.is_running = False
+        self.messages: list[str] = []
+        self._get_event_message = message_provider
+        # Text typed at the prompt, and the object and prompt of the code being asked for, if any
+        self.line = ""
+        self.code_request: tuple[str, str | None] | None = None
+
+        self._unsubscribe = None
+        self._timer_events: list[GameEvent] = []
+        self._last_tick: float | None = None
+        self._countdown = ""
+        self._dirty = True
+
+    def init(self, game: Game) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+        self.game = game
+        self._unsubscribe = game.subscribe(self._invalidate)
+        self._dirty = True
+        self.is_running = True
+
+    def tick(self) -> None:
+        now = monotonic()
+        dt = 0.0 if self._last_tick is None else now - self._last_tick
+        self._last_tick = now
+        self._timer_events.extend(self.game.advance(dt))
+        countdown = self._countdown_text()
+        if countdown != self._countdown:
+            self._countdown = countdown
+            self._dirty = True
+
+    def input(self) -> list[GameEvent]:
+        events = self._timer_events
+        self._timer_events = []
+
+        # Wait up to one frame for the first key, then take the ones already typed
+        try:
+            while True:
+                key = self.screen.get_wch()
+                self.screen.timeout(0)
+                self._dirty = True
+                if key in _ENTER:
+                    line, self.line = self.line, ""
+                    events.extend(self._submit(line))
+                elif key in _BACKSPACE:
+                    self.line = self.line[:-1]
+                elif key == _ESCAPE:
+                    self.line = ""
+                    self.code_request = None
+                elif isinstance(key, str) and key.isprintable():
+                    self.line += key
+        except curses.error:
+            pass
+        finally:
+            self.screen.timeout(1000 // self.fps)
+
+        return events
+
+    def _submit(self, line: str) -> list[GameEvent]:
+        """Run a line typed at the prompt."""
+        if self.code_request is not None:
+            object_id, _ = self.code_request
+            self.code_request = None
+            return self.game.insert_code(object_id, line) if line else []
+
+        command = line.strip()
+        if command == "quit":
+            return self.game.quit()
+        if self.game.is_finished or not command:
+            return []
+
+        room_objects = list(self.game.rooms[self.game.current_room_id])
+        if command == "-":
+            return self.game.interact_inventory(None)
+        if command.isdigit() and 1 <= int(command) <= len(room_objects):
+            return self.game.interact(room_objects[int(command) - 1])
+        index = command.removeprefix("i")
+        if command.startswith("i") and index.isdigit() and 1 <= int(index) <= len(self.game.inventory):
+            return self.game.interact_inventory(self.game.inventory[int(index) - 1])
+        if command in room_objects:
+            return self.game.interact(command)
+        if command in self.game.inventory:
+            return self.game.interact_inventory(command)
+
+        self.add_message(f"? {command}")
+        return []
+
+    def handle(self, events: list[GameEvent]) -> None:
+        for event in events:
+            self._dirty = True
+            message = self._get_event_message(event)
+            if message:
+                self.add_message(message)
+
+            match event:
+                case GameEndedEvent():
+                    self.is_running = False
+                case AskedForCodeEvent(object_id=object_id):
+                    self.code_request = (object_id, message)
+                case _:
+                    pass
+
+    def render(self) -> None:
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        height, width = self.screen.getmaxyx()
+        room_id = self.game.current_room_id
+        lines = [f"{self.title} - {self.labels.get(room_id, room_id)}".ljust(width - 6) + self._countdown, ""]
+        for i, object_id in enumerate(self.game.rooms[room_id], 1):
+            lines.append(f"  {i}. {self._label(object_id)}")
+        lines.append("")
+        lines.append("Inventory:")
+        for i, object_id in enumerate(self.game.inventory, 1):
+            in_hand = " (in hand)" if object_id == self.game.in_hand_object_id else ""
+            lines.append(f"  i{i}. {self._label(object_id)}{in_hand}")
+        lines.append("-" * width)
+
+        # Messages take the rows left above the prompt, newest last
+        rows = max(0, height - len(lines) - 1)
+        lines.extend(self.messages[-rows:] if rows else [])
+
+        if self.code_request is not None:
+            prompt = f"{self.code_request[1] or 'Code'}: {self.line}"
+        else:
+            prompt = f"> {self.line}"
+
+        self.screen.erase()
+        for y, line in enumerate(lines[: height - 1]):
+            self.screen.addnstr(y, 0, line, width)
+        # The last cell of the screen cannot be written without scrolling
+        self.screen.addnstr(height - 1, 0, prompt, width - 1)
+        self.screen.refresh()
+
+    def quit(self) -> None:
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._owns_screen:
+            self.screen.keypad(False)
+            curses.nocbreak()
+            curses.echo()
+            curses.endwin()
+
+    def add_message(self, message: str) -> None:
+        self.messages.append(message)
+        self._dirty = True
+
+    def _label(self, object_id: str) -> str:
+        label = self.labels.get(object_id, object_id)
+        object = self.game.objects[object_id]
+        if isinstance(object, Unlockable):
+            return f"{label} ({object.state})"
+        return label
+
+    def _countdown_text(self) -> str:
+        if self.countdown_timer is None:
+            return ""
+        remaining = self.game.scheduler.remaining(self.countdown_timer)
+        if remaining is None:
+            return ""
+        minutes, seconds = divmod(math.ceil(remaining), 60)
+        return f"{minutes:02}:{seconds:02}"
+
+    def _invalidate(self, aspect: str, id: str | None) -> None:
+        self._dirty = True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a declarative game in the terminal.")
+    parser.add_argument("definition", type=Path, help="declarative game definition")
+    parser.add_argument("--config", type=Path, help="JSON file with the UI config under 'ui' and the messages")
+    args = parser.parse_args()
+
+    config = {}
+    if args.config is not None:
+        with open(args.config) as f:
+            config = json.load(f)
+    game = load_game(args.definition)
+
+    def run(screen: curses.window) -> None:
+        ui = TerminalUi(config.get("ui", {}), dict_message_provider(config.get("messages", {})), screen)
+        ui.init(game)
+        while ui.is_running:
+            ui.tick()
+            events = ui.input()
+            ui.handle(events)
+            ui.render()
+        ui.quit()
+
+    curses.wrapper(run)
+
+
+if __name__ == "__main__":
+    main()
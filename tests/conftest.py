@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+
+import pytest
+
+# pygame tests render off-screen and play no sound
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def example_path() -> str:
+    return os.path.join(ROOT, "game.example.json")
+
+
+@pytest.fixture
+def ui_config(tmp_path) -> dict:
+    """The UI config of config.json, with generated images for the example game in `tmp_path`."""
+    pygame = pytest.importorskip("pygame")
+    with open(os.path.join(ROOT, "config.json")) as f:
+        config = json.load(f)["ui"]
+    # The door back from room2 has no image in config.json
+    config["objects"]["calendar-2"] = "calendar.png"
+
+    def write(name: str, size: tuple[int, int], color: tuple[int, ...]) -> None:
+        image = pygame.Surface(size, pygame.SRCALPHA, 32)
+        image.fill(color)
+        # A gradient band, so scaling shows in the pixels
+        for x in range(0, size[0], 4):
+            pygame.draw.line(image, (x % 256, 255 - x % 256, 128, color[3]), (x, 0), (x, size[1] // 2))
+        pygame.image.save(image, tmp_path / name)
+
+    write("study.png", (640, 480), (90, 60, 30, 255))
+    write("room-2.jpg", (640, 480), (30, 60, 90, 255))
+    for i, name in enumerate(sorted(set(config["objects"].values()))):
+        write(name, (96, 80), (40 * i % 256, 200, 100, 200))
+    return {**config, "assets_dir": str(tmp_path)}
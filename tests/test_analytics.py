@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+from escapy.analytics import AnalyticsSink, aggregate, read_records
+from escapy.game_events import PickedUpEvent
+from escapy.loader import build_game, compile_definition
+
+
+def _code_locks_game():
+    safe = {"type": "SelfAskCodeLock", "on_unlock": {"command": "no_op"}, "width": 0.1, "height": 0.1}
+    return build_game(
+        compile_definition(
+            {
+                "first_room": "room",
+                "inventory": [],
+                "objects": {"safe-1": {**safe, "code": "1234"}, "safe-2": {**safe, "code": "0000"}},
+                "rooms": {"room": {"safe-1": [0.2, 0.2], "safe-2": [0.6, 0.6]}},
+            }
+        )
+    )
+
+
+def test_funnel_counts_solved_and_failed_code_puzzles(tmp_path):
+    sink = AnalyticsSink(tmp_path, flush_interval=0)
+    game = _code_locks_game()
+    for action in [
+        lambda g: g.interact("safe-1"),
+        lambda g: g.insert_code("safe-1", "1111"),
+        lambda g: g.interact("safe-1"),
+        lambda g: g.insert_code("safe-1", "1234"),
+        lambda g: g.interact("safe-2"),
+        lambda g: g.insert_code("safe-2", "9999"),
+    ]:
+        sink.record("tablet-1", action(game))
+    sink.close()
+    assert game.objects["safe-1"].state == "unlocked"
+
+    report = aggregate(sorted(tmp_path.glob("*.jsonl.gz")))
+    assert report["sessions"] == 1
+    solved, failed = report["puzzles"]["safe-1"], report["puzzles"]["safe-2"]
+    assert (solved["sessions"], solved["unlocked"], solved["wrong_codes"]) == (1, 1, 1)
+    assert solved["wrong_code_rate"] == 0.5
+    assert solved["time_to_solve"]["count"] == 1
+    assert (failed["sessions"], failed["unlocked"], failed["wrong_codes"]) == (1, 0, 1)
+    assert failed["wrong_code_rate"] == 1.0
+    assert failed["time_to_unlock"]["count"] == 0
+
+
+class _UnknownEvent:
+    """An event escapy.serialization cannot encode."""
+
+
+def test_sink_survives_records_it_cannot_write(tmp_path, monkeypatch):
+    sink = AnalyticsSink(tmp_path, max_records=1, flush_interval=0)
+    # The second file, for the second event, cannot be created, as if the disk went away
+    paths = iter(tmp_path / name for name in ["1.jsonl.gz", "missing/2.jsonl.gz", "3.jsonl.gz"])
+    monkeypatch.setattr(sink, "_next_path", lambda: next(paths))
+
+    sink.record("s", [_UnknownEvent(), PickedUpEvent(object_id="a1-knife")])
+    sink.record("s", [PickedUpEvent(object_id="a2-key")])
+    sink.record("s", [PickedUpEvent(object_id="a3-chest")])
+    sink.close()
+
+    assert sink.dropped == 2
+    assert [record["e"] for record in read_records(sorted(tmp_path.glob("*.jsonl.gz")))] == [
+        ["PickedUpEvent", "a1-knife"],
+        ["PickedUpEvent", "a3-chest"],
+    ]
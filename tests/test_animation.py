@@ -0,0 +1,117 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.game_events import RevealedEvent, UnlockedEvent  # noqa: E402
+from escapy.game_types import Position  # noqa: E402
+from escapy.pygame.animation import Animator, Sequence  # noqa: E402
+
+
+def _frames(count: int) -> list[pygame.Surface]:
+    return [pygame.Surface((1, 1)) for _ in range(count)]
+
+
+def test_sequence_plays_once_or_loops():
+    frames = _frames(3)
+    once = Sequence(frames, fps=10)
+    assert once.duration == pytest.approx(0.3)
+    assert [once.frame(t) for t in (0, 0.15, 0.25, 1.0)] == [frames[0], frames[1], frames[2], frames[2]]
+    looping = Sequence(frames, fps=10, loop=True)
+    assert [looping.frame(t) for t in (0.05, 0.35)] == [frames[0], frames[0]]
+
+
+def test_one_shot_sequence_runs_on_trigger_and_ends():
+    frames = _frames(2)
+    animator = Animator({"door:unlocked": Sequence(frames, fps=10)})
+    changes = []
+    animator.on_change = changes.append
+
+    assert not animator.is_animated("door", "door:unlocked")
+    assert animator.pose("door", "door:unlocked").image is None
+
+    animator.trigger(UnlockedEvent("door"), "door", "door:unlocked")
+    assert changes == ["door"]
+    assert animator.is_animated("door", "door:unlocked")
+    animator.update(0.15)
+    assert animator.pose("door", "door:unlocked").image is frames[1]
+
+    animator.update(0.1)
+    assert not animator.active
+    assert changes == ["door", "door"]
+    assert animator.pose("door", "door:unlocked").image is None
+
+
+def test_looping_sequence_follows_the_clock():
+    frames = _frames(2)
+    animator = Animator({"candle": Sequence(frames, fps=2, loop=True)})
+    assert animator.is_animated("candle", "candle")
+    # Looping keys need no trigger and keep nothing running
+    assert not animator.active
+    animator.update(0.6)
+    assert animator.pose("candle", "candle").image is frames[1]
+
+
+def test_tweens_interpolate_and_replace_running_ones():
+    animator = Animator(
+        tween_specs={
+            "RevealedEvent": {"alpha": [0, 255], "offset": [[0, 0.5], [0, 0]], "duration": 1.0},
+            "UnlockedEvent": {"alpha": [100, 200], "duration": 2.0, "ease": "in"},
+        }
+    )
+    changes = []
+    animator.on_change = changes.append
+
+    animator.trigger(RevealedEvent("key", "room", Position(0, 0)), "key", "key")
+    animator.update(0.5)
+    pose = animator.pose("key", "key")
+    assert pose.alpha == pytest.approx(127.5)
+    assert pose.offset == pytest.approx((0, 0.25))
+    assert pose.scale == 1.0
+
+    animator.trigger(UnlockedEvent("key"), "key", "key")
+    # Triggered while animated, the object was already out of the room layer
+    assert changes == ["key"]
+    animator.update(1.0)
+    pose = animator.pose("key", "key")
+    assert pose.alpha == pytest.approx(100 + 100 * 0.25)
+    # The offset tween finished on its own
+    assert pose.offset == (0.0, 0.0)
+
+    animator.update(1.0)
+    assert not animator.active
+    assert changes == ["key", "key"]
+
+
+def test_from_config_rejects_invalid_tweens():
+    def load(name: str) -> pygame.Surface:
+        return pygame.Surface((1, 1))
+
+    animator = Animator.from_config(
+        {"animations": {"candle": {"frames": ["a.png", "b.png"], "loop": True}}, "tweens": {}}, load
+    )
+    assert animator.loops("candle")
+    assert animator.sequences["candle"].fps == 12.0
+    for spec in [
+        {"alpha": [0, 255]},
+        {"alpha": [0, 255], "duration": 1, "ease": "bounce"},
+        {"tint": [0, 1], "duration": 1},
+    ]:
+        with pytest.raises(ValueError, match="tweens.RevealedEvent"):
+            Animator.from_config({"tweens": {"RevealedEvent": spec}}, load)
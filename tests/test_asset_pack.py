@@ -0,0 +1,49 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi  # noqa: E402
+from escapy.pygame.asset_pack import AssetPack, build_pack  # noqa: E402
+
+
+def _frames(config: dict, example_path: str) -> list[bytes]:
+    ui = HeadlessPyGameUi(config, dict_message_provider({}))
+    ui.init(load_game(example_path))
+    ui.step()
+    frames = [pygame.image.tobytes(ui.screen, "RGB")]
+    for object_id in ["a1-knife", "a1-knife", "a2-poster", "a2-key", "calendar-1"]:
+        ui.click_object(object_id)
+        ui.step()
+        frames.append(pygame.image.tobytes(ui.screen, "RGB"))
+    ui.quit()
+    return frames
+
+
+def test_pack_frames_match_loose_file_frames(ui_config, example_path, tmp_path):
+    pack_path = tmp_path / "assets.pack"
+    build_pack(ui_config, load_game(example_path), pack_path)
+    assert AssetPack(pack_path).index["scaled_objects"]
+
+    loose = _frames(ui_config, example_path)
+    packed = _frames({**ui_config, "asset_pack": str(pack_path)}, example_path)
+    for i, (expected, frame) in enumerate(zip(loose, packed)):
+        assert frame == expected, f"frame {i} differs"
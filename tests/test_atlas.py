@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame.atlas import ImageFiles, pack_atlases  # noqa: E402
+
+
+def _sprite(size: tuple[int, int], seed: int) -> pygame.Surface:
+    """A sprite with random, partly transparent pixels."""
+    rng = random.Random(seed)
+    sprite = pygame.Surface(size, pygame.SRCALPHA, 32)
+    for x in range(size[0]):
+        for y in range(size[1]):
+            sprite.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    return sprite
+
+
+def _pixels(surface: pygame.Surface) -> bytes:
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def test_image_files_load_each_content_once(tmp_path):
+    for name, seed in [("a.png", 1), ("copy-of-a.png", 1), ("b.png", 2)]:
+        pygame.image.save(_sprite((8, 6), seed), tmp_path / name)
+    converted = []
+
+    def convert(image: pygame.Surface, alpha: bool) -> pygame.Surface:
+        converted.append(alpha)
+        return image
+
+    files = ImageFiles(tmp_path, convert)
+    a = files.load("a.png", alpha=True)
+    assert files.load("copy-of-a.png", alpha=True) is a
+    assert files.load("a.png", alpha=True) is a
+    assert files.load("b.png", alpha=True) is not a
+    # Converted without alpha, the same content is another surface
+    assert files.load("a.png", alpha=False) is not a
+    assert converted == [True, True, False]
+
+
+def test_atlases_hold_exact_copies_of_the_sprites():
+    rng = random.Random(5)
+    images = {f"s{i}": _sprite((rng.randint(4, 60), rng.randint(4, 60)), i) for i in range(40)}
+    images["alias"] = images["s0"]
+    images["large"] = _sprite((70, 10), 99)
+
+    packed = pack_atlases(images, size=128)
+
+    assert packed["large"] is images["large"]
+    assert packed["alias"] is packed["s0"]
+    atlases = {id(packed[key].get_parent()) for key in images if key != "large"}
+    # 40 sprites of up to 60x60 px cannot fit in one 128 px atlas
+    assert 1 < len(atlases) < 40
+
+    regions: dict[int, list[pygame.Rect]] = {}
+    for key, image in images.items():
+        if key in ("alias", "large"):
+            continue
+        region = packed[key]
+        assert region.get_size() == image.get_size()
+        assert _pixels(region) == _pixels(image)
+        rect = pygame.Rect(region.get_offset(), region.get_size())
+        assert not any(rect.colliderect(other) for other in regions.get(id(region.get_parent()), []))
+        regions.setdefault(id(region.get_parent()), []).append(rect)
@@ -0,0 +1,61 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import wave
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi  # noqa: E402
+
+
+@pytest.fixture
+def sound_config(ui_config, tmp_path) -> dict:
+    for name in ["pick.wav", "door.wav", "room1.wav", "calendar.wav"]:
+        with wave.open(str(tmp_path / name), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(22050)
+            f.writeframes(bytes(2205 * 2))
+    sounds = {
+        "PickedUpEvent": "pick.wav",
+        "UnlockedEvent(object_id='a2-poster')": "door.wav",
+        "MovedToRoomEvent(room_id='room1')": "room1.wav",
+        "InspectedEvent(object_id='calendar-2')": "calendar.wav",
+    }
+    return {**ui_config, "sounds": sounds}
+
+
+def test_effects_are_decoded_before_they_play(sound_config, example_path):
+    ui = HeadlessPyGameUi(sound_config, dict_message_provider({}))
+    if not ui.audio.enabled:
+        pytest.skip("no audio driver")
+    assert list(ui.audio._cache) == ["pick.wav"]
+
+    ui.init(load_game(example_path))
+    # Effects for the objects of room1, and for room1 itself
+    assert set(ui.audio._cache) == {"pick.wav", "door.wav", "room1.wav"}
+
+    ui.click_object("calendar-1")
+    ui.step()
+    assert ui.game.current_room_id == "room2"
+    # calendar-2 is in room2
+    assert "calendar.wav" in ui.audio._cache
+    ui.quit()
@@ -0,0 +1,113 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+from escapy import columnar_room
+from escapy.columnar_room import ColumnarRoom
+from escapy.game_types import Position
+from escapy.objects import PickableObject
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run with NumPy when installed, and with the pure Python passes."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(columnar_room, "_numpy", lambda: None)
+    return request.param
+
+
+@pytest.fixture
+def objects() -> dict[str, object]:
+    rng = random.Random(7)
+    return {f"o{i}": PickableObject(f"o{i}", rng.uniform(0.05, 0.3), rng.uniform(0.05, 0.3)) for i in range(40)}
+
+
+def _positions(objects, seed: int) -> dict[str, Position]:
+    rng = random.Random(seed)
+    return {object_id: Position(x=rng.random(), y=rng.random()) for object_id in objects}
+
+
+def _hit(room: dict[str, Position], objects, x: float, y: float) -> str | None:
+    """The topmost object of a dict room containing (x, y)."""
+    hit = None
+    for object_id, p in room.items():
+        obj = objects[object_id]
+        if p.x <= x < p.x + obj.width and p.y <= y < p.y + obj.height:
+            hit = object_id
+    return hit
+
+
+def test_behaves_like_a_dict_room(objects, backend):
+    reference = _positions(objects, 1)
+    room = ColumnarRoom(objects, reference)
+    assert list(room) == list(reference) and dict(room.items()) == reference
+
+    # Moving keeps the placement order, deleting and placing again moves to the top
+    room["o3"] = reference["o3"] = Position(x=0.5, y=0.5)
+    for object_id in ["o0", "o17", "o39"]:
+        del room[object_id]
+        del reference[object_id]
+    room["o0"] = reference["o0"] = Position(x=0.1, y=0.2)
+
+    assert list(room) == list(reference)
+    assert dict(room.items()) == reference
+    assert len(room) == len(reference) and "o17" not in room and "o0" in room
+    with pytest.raises(KeyError):
+        room["o17"]
+
+
+def test_hit_test_finds_the_topmost_object(objects, backend):
+    reference = _positions(objects, 2)
+    room = ColumnarRoom(objects, reference)
+    del room["o5"]
+    del reference["o5"]
+
+    rng = random.Random(3)
+    for _ in range(500):
+        x, y = rng.uniform(0, 1.3), rng.uniform(0, 1.3)
+        assert room.hit_test(x, y) == _hit(reference, objects, x, y)
+
+
+def test_scaled_columns(objects, backend):
+    room = ColumnarRoom(objects, _positions(objects, 4))
+    xs, ys, ws, hs = room.scaled(800, 600)
+    for i, (object_id, p) in enumerate(room.items()):
+        assert xs[i] == pytest.approx(p.x * 800) and ys[i] == pytest.approx(p.y * 600)
+        assert ws[i] == pytest.approx(objects[object_id].width * 800)
+        assert hs[i] == pytest.approx(objects[object_id].height * 600)
+
+
+def test_clear_empties_every_column(objects, backend):
+    room = ColumnarRoom(objects, _positions(objects, 5))
+    room.clear()
+    assert len(room) == 0 and list(room) == [] and room.hit_test(0.5, 0.5) is None
+    assert len(room.x) == len(room.y) == len(room.width) == len(room.height) == 0
+
+    room["o1"] = Position(x=0.0, y=0.0)
+    assert dict(room.items()) == {"o1": Position(x=0.0, y=0.0)}
+    assert room.hit_test(0.01, 0.01) == "o1"
+
+
+def test_only_placeable_objects_can_be_placed():
+    room = ColumnarRoom({"note": object()})
+    with pytest.raises(ValueError):
+        room["note"] = Position(x=0.0, y=0.0)
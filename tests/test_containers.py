@@ -0,0 +1,189 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import pytest
+
+from escapy.game_events import RevealedEvent
+from escapy.loader import build_game, compile_definition
+from escapy.snapshot import restore, snapshot
+from escapy.sync import ReadOnlyGame, SyncEncoder, SyncMirror
+
+
+def _pickable(**extra) -> dict:
+    return {"type": "PickableObject", "width": 0.04, "height": 0.04, **extra}
+
+
+NESTED = {
+    "first_room": "room1",
+    "inventory": [],
+    "objects": {
+        "key": _pickable(),
+        "chest": {
+            "type": "Container",
+            "key_id": "key",
+            "width": 0.2,
+            "height": 0.15,
+            "contents": {
+                "box": {
+                    "type": "Container",
+                    "code": "1234",
+                    "width": 0.12,
+                    "height": 0.12,
+                    "position": [0.5, 0.6],
+                    "contents": {
+                        "bag": {
+                            "type": "Container",
+                            "width": 0.1,
+                            "height": 0.1,
+                            "position": [0.3, 0.6],
+                            "contents": {"ring": _pickable(position=[0.3, 0.7])},
+                        }
+                    },
+                }
+            },
+        },
+    },
+    "rooms": {"room1": {"key": [0.1, 0.1], "chest": [0.5, 0.5]}, "room2": {}},
+}
+
+
+@pytest.fixture
+def definition():
+    return compile_definition(NESTED)
+
+
+def test_nested_contents_are_built_when_opened(definition):
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+
+    def play(action) -> list:
+        events = action(game)
+        for message in encoder.encode(events):
+            mirror.apply(message)
+        return events
+
+    assert set(game.objects) == {"key", "chest"}
+    play(lambda g: g.interact("chest"))
+    assert set(game.objects) == {"key", "chest"}
+
+    play(lambda g: g.interact("key"))
+    play(lambda g: g.interact_inventory("key"))
+    events = play(lambda g: g.interact("chest"))
+    assert RevealedEvent(object_id="box", room_id="room1", position=game.rooms["room1"]["box"]) in events
+    assert "bag" not in game.objects
+
+    play(lambda g: g.interact("box"))
+    play(lambda g: g.insert_code("box", "1234"))
+    play(lambda g: g.interact("bag"))
+    play(lambda g: g.interact("ring"))
+    assert game.inventory == ["key", "ring"]
+    assert snapshot(mirror.game) == snapshot(game)
+
+
+def test_restore_rebuilds_open_containers(definition):
+    game = build_game(definition)
+    game.interact("key")
+    game.interact_inventory("key")
+    game.interact("chest")
+    before_box = snapshot(game)
+    game.interact("box")
+    game.insert_code("box", "1234")
+    game.interact("bag")
+    after_bag = snapshot(game)
+
+    fresh = build_game(definition)
+    restore(fresh, json.loads(json.dumps(after_bag)))
+    assert snapshot(fresh) == after_bag
+    assert "ring" in fresh.objects
+
+    restore(game, before_box)
+    assert snapshot(game) == before_box
+    assert "bag" not in game.objects
+
+
+def test_containers_opened_before_being_revealed_bring_their_contents():
+    # The lever opens the chest, then reveals it
+    lever_commands = [
+        {"command": "simple_lock", "id": "chest"},
+        {"command": "reveal", "object_id": "chest", "room_id": "room", "position": [0.5, 0.5]},
+    ]
+    definition = compile_definition(
+        {
+            "first_room": "room",
+            "inventory": [],
+            "objects": {
+                "lever": {
+                    "type": "SelfSimpleLock",
+                    "on_unlock": {"command": "combine", "commands": lever_commands},
+                    "width": 0.1,
+                    "height": 0.1,
+                },
+                "chest": {
+                    "type": "Container",
+                    "width": 0.2,
+                    "height": 0.2,
+                    "contents": {"ring": _pickable(position=[0.3, 0.3])},
+                },
+            },
+            "rooms": {"room": {"lever": [0.1, 0.1]}},
+        }
+    )
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+
+    for message in encoder.encode(game.interact("lever")):
+        mirror.apply(message)
+    assert game.objects["chest"].state == "unlocked"
+    assert set(game.rooms["room"]) == {"lever", "chest", "ring"}
+    assert snapshot(mirror.game) == snapshot(game)
+
+    game.interact("ring")
+    assert game.inventory == ["ring"]
+    restored = build_game(definition)
+    restore(restored, snapshot(game))
+    assert snapshot(restored) == snapshot(game)
+
+
+@pytest.mark.parametrize(
+    "objects, rooms",
+    [
+        # Contents need a position
+        ({"c": {"type": "Container", "width": 1, "height": 1, "contents": {"x": _pickable()}}}, {"r": {}}),
+        # Contents cannot be placed in a room too
+        (
+            {"c": {"type": "Container", "width": 1, "height": 1, "contents": {"x": _pickable(position=[0, 0])}}},
+            {"r": {"x": [0, 0]}},
+        ),
+        # Nor share an id with another object
+        (
+            {
+                "x": _pickable(),
+                "c": {"type": "Container", "width": 1, "height": 1, "contents": {"x": _pickable(position=[0, 0])}},
+            },
+            {"r": {}},
+        ),
+    ],
+)
+def test_invalid_contents_are_rejected(objects, rooms):
+    with pytest.raises(ValueError):
+        compile_definition({"first_room": "r", "inventory": [], "objects": objects, "rooms": rooms})
@@ -0,0 +1,88 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy.loader import load_game
+from escapy.snapshot import restore, snapshot
+
+
+@pytest.fixture
+def game(example_path):
+    return load_game(example_path)
+
+
+@pytest.fixture
+def changes(game) -> list[tuple[str, str | None]]:
+    """The (aspect, id) notifications of `game`, in order."""
+    changes = []
+    game.subscribe(lambda aspect, id: changes.append((aspect, id)))
+    return changes
+
+
+def _bumped(game, action) -> dict[str, int]:
+    """Run `action` and return by how much it moved each aspect's version."""
+    before = dict(game.versions)
+    action()
+    return {aspect: version - before[aspect] for aspect, version in game.versions.items() if version != before[aspect]}
+
+
+def test_picking_up_changes_the_room_and_the_inventory(game, changes):
+    assert _bumped(game, lambda: game.interact("a1-knife")) == {"rooms": 1, "inventory": 1}
+    assert changes == [("rooms", "room1"), ("inventory", "a1-knife")]
+
+
+def test_putting_in_hand_changes_the_hand(game, changes):
+    game.interact("a1-knife")
+    changes.clear()
+    assert _bumped(game, lambda: game.interact_inventory("a1-knife")) == {"hand": 1}
+    assert changes == [("hand", "a1-knife")]
+
+
+def test_unlocking_changes_the_lock_then_the_revealed_room(game, changes):
+    game.interact("a1-knife")
+    game.interact_inventory("a1-knife")
+    changes.clear()
+    assert _bumped(game, lambda: game.interact("a2-poster")) == {"locks": 1, "rooms": 1}
+    assert changes == [("locks", "a2-poster"), ("rooms", "room1")]
+
+
+def test_moving_changes_the_current_room(game, changes):
+    assert _bumped(game, lambda: game.interact("calendar-1")) == {"current_room": 1}
+    assert changes == [("current_room", "room2")]
+
+
+def test_restore_changes_every_aspect(game, changes):
+    state = snapshot(game)
+    game.interact("a1-knife")
+    changes.clear()
+    bumped = _bumped(game, lambda: restore(game, state))
+    assert set(bumped) == set(game.versions)
+    assert {aspect for aspect, _id in changes} == set(game.versions)
+
+
+def test_subscriptions_filter_aspects_and_can_be_removed(game):
+    hand = []
+    unsubscribe = game.subscribe(lambda aspect, id: hand.append(id), "hand")
+    game.interact("a1-knife")
+    game.interact_inventory("a1-knife")
+    assert hand == ["a1-knife"]
+
+    unsubscribe()
+    game.interact_inventory(None)
+    assert game.in_hand_object_id is None
+    assert hand == ["a1-knife"]
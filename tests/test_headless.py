@@ -0,0 +1,81 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import warnings
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi, PyGameUi  # noqa: E402
+
+
+def _render(ui: PyGameUi, example_path: str) -> bytes:
+    ui.init(load_game(example_path))
+    ui.handle(ui.input())
+    ui.render()
+    return pygame.image.tobytes(ui.screen, "RGB")
+
+
+def test_headless_frames_match_the_window(ui_config, example_path, tmp_path):
+    # A room image with an alpha channel: the window drops it when converting to the display format
+    room = pygame.Surface((640, 480), pygame.SRCALPHA, 32)
+    room.fill((200, 40, 40, 60))
+    pygame.image.save(room, tmp_path / "study.png")
+
+    window = PyGameUi(ui_config, dict_message_provider({}))
+    expected = _render(window, example_path)
+    window.quit()
+
+    headless = HeadlessPyGameUi(ui_config, dict_message_provider({}))
+    assert _render(headless, example_path) == expected
+    headless.quit()
+
+
+def test_scripted_runs_render_the_same_frames(ui_config, example_path):
+    frames = []
+    for _ in range(2):
+        ui = HeadlessPyGameUi(ui_config, dict_message_provider({}))
+        ui.init(load_game(example_path))
+        ui.step()
+        for object_id in ["a1-knife", "a1-knife", "a2-poster", "a2-key"]:
+            ui.click_object(object_id)
+            ui.step()
+        frames.append(pygame.image.tobytes(ui.screen, "RGB"))
+        assert ui.game.inventory == ["a1-knife", "a2-key"]
+        ui.quit()
+    assert frames[0] == frames[1]
+
+
+def test_profiler_toggle_key_needs_no_early_pygame_init(ui_config, example_path):
+    pygame.quit()
+    config = {**ui_config, "profiler": {"enabled": True, "toggle_key": "f4"}}
+    # Headless UIs never start the display, which key code lookups warn about
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        HeadlessPyGameUi(config, dict_message_provider({})).quit()
+    assert not [w for w in caught if "pygame.init" in str(w.message)]
+
+    ui = PyGameUi(config, dict_message_provider({}))
+    ui.init(load_game(example_path))
+
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F4, mod=0, unicode="", scancode=0))
+    ui.input()
+    assert ui._show_profiler
+    ui.quit()
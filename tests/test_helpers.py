@@ -0,0 +1,74 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy import Game, Position, no_op, pick
+from escapy.helpers import build_entity, build_protocol, make_entity
+from escapy.mixins import UnlockableMixin
+from escapy.protocols import Interactable, Placeable, Unlockable
+
+
+def _protocols(object_id: str, lock: bool) -> list:
+    protocols = [
+        build_protocol("Interactable", interact=pick(object_id)),
+        build_protocol("Placeable", width=0.1, height=0.2),
+    ]
+    if lock:
+        protocols.append(build_protocol("Unlockable", on_unlock=no_op()))
+    return protocols
+
+
+def test_build_protocol_shares_one_class_per_type():
+    first = build_protocol("Placeable", width=0.1, height=0.2)
+    second = build_protocol("Placeable", width=0.3, height=0.4)
+    assert type(first) is type(second)
+    assert (second.width, second.height) == (0.3, 0.4)
+
+
+def test_entities_with_the_same_capabilities_share_a_class():
+    a = make_entity((UnlockableMixin,), _protocols("a", lock=True))
+    b = make_entity((UnlockableMixin,), _protocols("b", lock=True))
+    c = make_entity((), _protocols("c", lock=False))
+    assert type(a) is type(b)
+    assert type(a) is not type(c)
+    assert isinstance(a, Interactable) and isinstance(a, Placeable) and isinstance(a, Unlockable)
+    assert not isinstance(c, Unlockable)
+
+
+def test_entity_attributes_are_per_instance():
+    a = make_entity((UnlockableMixin,), _protocols("a", lock=True))
+    b = make_entity((UnlockableMixin,), _protocols("b", lock=True))
+    room = {"a": Position(x=0.1, y=0.1), "b": Position(x=0.5, y=0.5)}
+    game = Game(objects={"a": a, "b": b}, rooms={"room": room}, inventory=[], first_room_id="room")
+    a.interact(game)
+    assert game.inventory == ["a"]
+    a.unlock(game)
+    assert (a.state, b.state) == ("unlocked", "locked")
+
+
+def test_build_entity_is_deprecated_but_still_returns_a_class():
+    with pytest.deprecated_call():
+        cls = build_entity("Poster", (UnlockableMixin,), _protocols("poster", lock=True))
+    assert isinstance(cls, type) and cls.__name__ == "Poster"
+    assert (cls.width, cls.height, cls.state) == (0.1, 0.2, "locked")
+
+    with pytest.deprecated_call():
+        other = build_entity("Chest", (UnlockableMixin,), _protocols("chest", lock=True))
+    entity = make_entity((UnlockableMixin,), _protocols("door", lock=True))
+    # Both classes derive from the cached class make_entity uses
+    assert cls.__bases__ == other.__bases__ == (type(entity),)
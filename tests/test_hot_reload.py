@@ -0,0 +1,91 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+import os
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+from escapy.game_events import InteractedWithLockedEvent
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi  # noqa: E402
+from escapy.pygame.hot_reload import HotReloader  # noqa: E402
+
+LOCKED = InteractedWithLockedEvent(object_id="a2-poster")
+
+
+@pytest.fixture
+def authoring(ui_config, example_path, tmp_path):
+    """A UI with a reloader watching a config file written in `tmp_path`."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"ui": ui_config, "messages": {repr(LOCKED): "Locked"}}))
+    ui = HeadlessPyGameUi(ui_config, dict_message_provider({}))
+    reloader = HotReloader(ui, config_path, interval=0)
+    ui.init(load_game(example_path))
+    yield ui, reloader, config_path
+    ui.quit()
+
+
+def _touch(path, content: bytes | None = None) -> None:
+    """Rewrite `path` and move its modification time on, as filesystems may not resolve quick saves."""
+    if content is not None:
+        path.write_bytes(content)
+    mtime = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _save(image_path, color: tuple[int, int, int, int]) -> None:
+    image = pygame.Surface((96, 80), pygame.SRCALPHA, 32)
+    image.fill(color)
+    pygame.image.save(image, image_path)
+    _touch(image_path)
+
+
+def test_changed_images_and_messages_are_picked_up(authoring, ui_config, tmp_path):
+    ui, reloader, config_path = authoring
+    assert ui._get_event_message(LOCKED) == "Locked"
+
+    _save(tmp_path / ui_config["objects"]["a1-knife"], (255, 0, 0, 255))
+    config = json.loads(config_path.read_text())
+    config["messages"][repr(LOCKED)] = "Still locked"
+    config_path.write_text(json.dumps(config))
+    _touch(config_path)
+
+    reloaded = reloader.poll()
+    assert "a1-knife" in reloaded and repr(LOCKED) in reloaded
+    assert ui.object_images["a1-knife"].get_at((0, 0)) == (255, 0, 0, 255)
+    assert ui._get_event_message(LOCKED) == "Still locked"
+
+
+def test_unreadable_files_are_retried(authoring, ui_config, tmp_path):
+    ui, reloader, config_path = authoring
+    before = ui.object_images["a1-knife"]
+    image_path = tmp_path / ui_config["objects"]["a1-knife"]
+
+    # Saved halfway, then a config without its UI part
+    _touch(image_path, b"\x89PNG\r\n")
+    _touch(config_path, json.dumps({"messages": {}}).encode())
+    assert reloader.poll() == []
+    assert ui.object_images["a1-knife"] is before
+    assert ui._get_event_message(LOCKED) == "Locked"
+
+    _save(image_path, (0, 0, 255, 255))
+    assert "a1-knife" in reloader.poll()
+    assert ui.object_images["a1-knife"].get_at((0, 0)) == (0, 0, 255, 255)
@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+from escapy.game_events import InteractedWithLockedEvent
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi, PyGameUi  # noqa: E402
+from escapy.pygame.pygame_ui import _coalesce_input, _InsertCodeState  # noqa: E402
+
+
+def _text(text: str) -> pygame.event.Event:
+    return pygame.event.Event(pygame.TEXTINPUT, text=text)
+
+
+def _motion(pos: tuple[int, int]) -> pygame.event.Event:
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))
+
+
+def test_coalesce_input_merges_text_and_keeps_the_last_motion():
+    key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RETURN, mod=0, unicode="\r", scancode=0)
+    events = [_motion((1, 1)), _text("1"), _text("2"), _motion((2, 2)), _text("3"), key, _text("4")]
+
+    coalesced = _coalesce_input(events)
+    types = [event.type for event in coalesced]
+    assert types == [pygame.TEXTINPUT, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.MOUSEMOTION]
+    assert [event.text for event in coalesced if event.type == pygame.TEXTINPUT] == ["123", "4"]
+    assert coalesced[-1].pos == (2, 2)
+
+
+def test_states_only_keep_other_input_out(ui_config, example_path):
+    ui = PyGameUi(ui_config, dict_message_provider({}))
+    ui.init(load_game(example_path))
+    music_end = pygame.event.custom_type()
+    try:
+        pygame.event.clear()
+        for event_type in [pygame.QUIT, pygame.VIDEORESIZE, pygame.WINDOWRESIZED, music_end]:
+            assert not pygame.event.get_blocked(event_type)
+        assert pygame.event.get_blocked(pygame.TEXTINPUT)
+
+        ui._set_state(_InsertCodeState(object_id="a3-chest", prompt=None))
+        pygame.event.post(_motion((5, 5)))
+        pygame.event.post(pygame.event.Event(music_end))
+        pygame.event.post(_text("7"))
+        assert [event.type for event in pygame.event.get()] == [music_end, pygame.TEXTINPUT]
+    finally:
+        ui.quit()
+
+
+def test_repeated_clicks_on_an_object_are_ignored(ui_config, example_path):
+    ui = HeadlessPyGameUi({**ui_config, "click_debounce": 0.25}, dict_message_provider({}))
+    ui.init(load_game(example_path))
+    locked = InteractedWithLockedEvent(object_id="a2-poster")
+
+    ui.click_object("a2-poster")
+    ui.click_object("a2-poster")
+    assert ui.step(0.1).count(locked) == 1
+    # Still within the debounce time of the first click
+    ui.click_object("a2-poster")
+    assert locked not in ui.step(0.1)
+
+    ui.step(0.3)
+    ui.click_object("a2-poster")
+    assert locked in ui.step(0.1)
+    ui.quit()
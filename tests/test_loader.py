@@ -0,0 +1,63 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pickle
+
+from escapy import loader
+from escapy.loader import load_definition, load_game
+
+
+def test_load_game_builds_the_example(example_path):
+    game = load_game(example_path)
+    assert game.current_room_id == "room1"
+    assert set(game.rooms["room1"]) == {"a1-knife", "a2-poster", "a3-chest", "calendar-1"}
+
+
+def test_cache_is_reused(example_path, tmp_path):
+    first = load_definition(example_path, tmp_path)
+    (entry,) = tmp_path.glob("*.pickle")
+    assert load_definition(example_path, tmp_path) == first
+    assert list(tmp_path.glob("*.pickle")) == [entry]
+
+
+class _Gone:
+    pass
+
+
+def test_corrupted_or_stale_cache_is_rebuilt(example_path, tmp_path):
+    expected = load_definition(example_path)
+    load_definition(example_path, tmp_path)
+    (entry,) = tmp_path.glob("*.pickle")
+
+    for content in [b"not a pickle", pickle.dumps(_Gone()).replace(b"_Gone", b"_Nope")]:
+        entry.write_bytes(content)
+        assert load_definition(example_path, tmp_path) == expected
+        assert pickle.loads(entry.read_bytes()) == expected
+
+
+def test_cache_write_failures_still_load(example_path, tmp_path, monkeypatch):
+    expected = load_definition(example_path)
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    assert load_definition(example_path, not_a_directory / "cache") == expected
+
+    compile_definition = loader.compile_definition
+    monkeypatch.setattr(loader, "compile_definition", lambda raw: {**compile_definition(raw), "bad": lambda: None})
+    definition = load_definition(example_path, tmp_path / "cache")
+    assert definition["bad"] is not None
+    # Neither an entry nor the temporary file is left behind
+    assert list((tmp_path / "cache").iterdir()) == []
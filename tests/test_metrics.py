@@ -0,0 +1,94 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy.game_events import PickedUpEvent, WrongCodeEvent
+from escapy.loader import load_game
+from escapy.metrics import Histogram, Metrics
+
+
+def test_histogram_buckets_include_their_upper_bound():
+    histogram = Histogram((0.1, 1.0))
+    for value in [0.05, 0.1, 0.5, 1.0, 1.5, 20.0]:
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 2, 2]
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 4), (float("inf"), 6)]
+    assert histogram.count == 6
+    assert histogram.sum == pytest.approx(23.15)
+
+
+def test_prometheus_text_format():
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe_call("interact", "knife", 0.05, [PickedUpEvent(object_id="knife")])
+    metrics.observe_call("insert_code", 'safe "2"', 2.0, [WrongCodeEvent()])
+    metrics.observe_command("key_lock", 0.5)
+
+    assert metrics.to_prometheus() == (
+        "# TYPE escapy_interactions_total counter\n"
+        'escapy_interactions_total{op="insert_code",object="safe \\"2\\""} 1\n'
+        'escapy_interactions_total{op="interact",object="knife"} 1\n'
+        "# TYPE escapy_events_total counter\n"
+        'escapy_events_total{object="knife",event="PickedUpEvent"} 1\n'
+        'escapy_events_total{object="safe \\"2\\"",event="WrongCodeEvent"} 1\n'
+        "# TYPE escapy_call_duration_seconds histogram\n"
+        'escapy_call_duration_seconds_bucket{op="insert_code",le="0.1"} 0\n'
+        'escapy_call_duration_seconds_bucket{op="insert_code",le="1.0"} 0\n'
+        'escapy_call_duration_seconds_bucket{op="insert_code",le="+Inf"} 1\n'
+        'escapy_call_duration_seconds_sum{op="insert_code"} 2.0\n'
+        'escapy_call_duration_seconds_count{op="insert_code"} 1\n'
+        'escapy_call_duration_seconds_bucket{op="interact",le="0.1"} 1\n'
+        'escapy_call_duration_seconds_bucket{op="interact",le="1.0"} 1\n'
+        'escapy_call_duration_seconds_bucket{op="interact",le="+Inf"} 1\n'
+        'escapy_call_duration_seconds_sum{op="interact"} 0.05\n'
+        'escapy_call_duration_seconds_count{op="interact"} 1\n'
+        "# TYPE escapy_command_duration_seconds histogram\n"
+        'escapy_command_duration_seconds_bucket{command="key_lock",le="0.1"} 0\n'
+        'escapy_command_duration_seconds_bucket{command="key_lock",le="1.0"} 1\n'
+        'escapy_command_duration_seconds_bucket{command="key_lock",le="+Inf"} 1\n'
+        'escapy_command_duration_seconds_sum{command="key_lock"} 0.5\n'
+        'escapy_command_duration_seconds_count{command="key_lock"} 1\n'
+    )
+
+
+def test_write_prometheus_replaces_the_file(tmp_path):
+    metrics = Metrics()
+    path = tmp_path / "escapy.prom"
+    path.write_text("stale")
+    metrics.write_prometheus(path)
+    assert path.read_text() == metrics.to_prometheus()
+    assert [p.name for p in tmp_path.iterdir()] == ["escapy.prom"]
+
+
+def test_games_record_calls_events_and_commands(example_path):
+    game = load_game(example_path)
+    game.metrics = Metrics()
+    game.interact("a1-knife")
+    game.interact_inventory("a1-knife")
+    game.interact("a2-poster")
+
+    snapshot = game.metrics.snapshot()
+    assert {(i["op"], i["object"]) for i in snapshot["interactions"]} == {
+        ("interact", "a1-knife"),
+        ("interact_inventory", "a1-knife"),
+        ("interact", "a2-poster"),
+    }
+    # The key revealed by the poster is counted against the key
+    assert {"object": "a2-key", "event": "RevealedEvent", "count": 1} in snapshot["events"]
+    assert snapshot["call_latency"]["interact"]["count"] == 2
+    assert snapshot["command_latency"]["key_lock"]["count"] == 1
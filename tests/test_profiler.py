@@ -0,0 +1,83 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import json
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi, profiler  # noqa: E402
+from escapy.pygame.profiler import FrameProfiler  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    """A perf_counter that only moves when the test moves it."""
+    now = [0.0]
+    monkeypatch.setattr(profiler, "perf_counter", lambda: now[0])
+    return now
+
+
+def test_disabled_profiler_records_nothing():
+    frames = FrameProfiler()
+    with frames.phase("render"):
+        pass
+    frames.record("frame", 0.016)
+    assert frames.phase("render") is frames.phase("input")
+    assert frames.samples == {} and frames.report() == {}
+
+
+def test_phases_time_each_run_including_nested_ones(clock):
+    frames = FrameProfiler(enabled=True)
+    for _ in range(2):
+        with frames.phase("render"):
+            clock[0] += 0.002
+            with frames.phase("render.room"):
+                clock[0] += 0.003
+    frames.record("frame", 0.016)
+
+    assert list(frames.samples["render"]) == pytest.approx([0.005, 0.005])
+    assert list(frames.samples["render.room"]) == pytest.approx([0.003, 0.003])
+    assert list(frames.samples["frame"]) == [0.016]
+
+
+def test_window_and_percentiles(tmp_path):
+    frames = FrameProfiler(enabled=True, window=100)
+    for ms in range(1, 151):
+        frames.record("frame", ms / 1000)
+
+    # Only the last 100 runs, 51 to 150 ms, are kept
+    assert len(frames.samples["frame"]) == 100
+    assert frames.percentiles("frame") == pytest.approx({"p50": 101, "p95": 146, "p99": 150, "max": 150})
+    assert frames.percentiles("missing") == {}
+
+    frames.dump(tmp_path / "profile.json")
+    assert json.loads((tmp_path / "profile.json").read_text()) == frames.report()
+
+
+def test_ui_frames_are_split_into_phases(ui_config, example_path):
+    ui = HeadlessPyGameUi({**ui_config, "profiler": {"enabled": True}}, dict_message_provider({}))
+    ui.init(load_game(example_path))
+    for _ in range(3):
+        ui.step()
+
+    for phase in ["input", "update_objects", "render.room", "render.inventory", "render.messages"]:
+        assert len(ui.profiler.samples[phase]) == 3, phase
+    ui.quit()
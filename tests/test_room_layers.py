@@ -0,0 +1,104 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy import dict_message_provider, load_game
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame import HeadlessPyGameUi  # noqa: E402
+
+
+@pytest.fixture
+def ui(ui_config, example_path):
+    ui = HeadlessPyGameUi(ui_config, dict_message_provider({}))
+    ui.init(load_game(example_path))
+    ui.step()
+    yield ui
+    ui.quit()
+
+
+def _layer(ui: HeadlessPyGameUi, room_id: str) -> pygame.Surface | None:
+    cached = ui._room_layers.get(room_id)
+    return cached[1] if cached is not None else None
+
+
+def _uncached_game_area(ui: HeadlessPyGameUi, ui_config) -> bytes:
+    """Render the game of `ui` in a new UI, which composes every layer from scratch."""
+    fresh = HeadlessPyGameUi(ui_config, dict_message_provider({}))
+    fresh.init(ui.game)
+    fresh.resize(ui.screen.get_size())
+    fresh.render()
+    pixels = pygame.image.tobytes(fresh.game_area, "RGB")
+    fresh.quit()
+    return pixels
+
+
+def test_unchanged_rooms_reuse_their_layer(ui):
+    layer = _layer(ui, "room1")
+    assert layer is not None
+    ui.step()
+    ui.step()
+    assert _layer(ui, "room1") is layer
+
+
+@pytest.mark.parametrize(
+    "clicks",
+    [
+        # Picking up moves an object out of the room
+        ["a1-knife"],
+        # Unlocking changes the poster's image and reveals the key
+        ["a1-knife", "a1-knife", "a2-poster"],
+        # Picking up the revealed key
+        ["a1-knife", "a1-knife", "a2-poster", "a2-key"],
+    ],
+)
+def test_changed_rooms_are_composed_again(ui, ui_config, clicks):
+    for object_id in clicks:
+        layer = _layer(ui, "room1")
+        ui.click_object(object_id)
+        ui.step()
+    assert _layer(ui, "room1") is not layer
+    assert pygame.image.tobytes(ui.game_area, "RGB") == _uncached_game_area(ui, ui_config)
+
+
+def test_changes_only_drop_the_layers_they_touch(ui):
+    ui.click_object("calendar-1")
+    ui.step()
+    assert ui.game.current_room_id == "room2"
+    room1, room2 = _layer(ui, "room1"), _layer(ui, "room2")
+    assert room1 is not None and room2 is not None
+
+    ui.game.notify("rooms", "room1")
+    assert _layer(ui, "room1") is None and _layer(ui, "room2") is room2
+    ui.step()
+
+    # A lock changing state drops the layers of the rooms holding it
+    ui.game.notify("locks", "calendar-2")
+    assert _layer(ui, "room2") is None
+
+    ui.step()
+    ui.game.notify("rooms")
+    assert ui._room_layers == {}
+
+
+def test_resize_composes_layers_for_the_new_size(ui, ui_config):
+    ui.resize((500, 400))
+    ui.step()
+    assert _layer(ui, "room1").get_size() == ui.game_area.get_size()
+    assert pygame.image.tobytes(ui.game_area, "RGB") == _uncached_game_area(ui, ui_config)
@@ -0,0 +1,68 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import pytest
+
+from escapy.commands import move_to_room
+from escapy.game_events import MovedToRoomEvent, TimerExpiredEvent
+from escapy.loader import load_game
+from escapy.snapshot import restore, snapshot
+
+
+@pytest.fixture
+def game(example_path):
+    game = load_game(example_path)
+    game.scheduler.define("alarm", move_to_room("room2"))
+    game.scheduler.define("bell", move_to_room("room1"))
+    return game
+
+
+def test_timers_fire_in_due_order(game):
+    game.scheduler.start("bell", 2)
+    game.scheduler.start("alarm", 1)
+    assert game.advance(0.5) == []
+    assert game.advance(2) == [
+        TimerExpiredEvent(timer_id="alarm"),
+        MovedToRoomEvent(room_id="room2"),
+        TimerExpiredEvent(timer_id="bell"),
+        MovedToRoomEvent(room_id="room1"),
+    ]
+    assert game.scheduler.next_due() is None
+
+
+def test_restart_and_cancel(game):
+    game.scheduler.start("alarm", 1)
+    game.scheduler.start("alarm", 3)
+    assert game.advance(2) == []
+    assert game.scheduler.remaining("alarm") == pytest.approx(1)
+    game.scheduler.cancel("alarm")
+    assert game.advance(5) == []
+    with pytest.raises(ValueError):
+        game.scheduler.start("missing", 1)
+
+
+def test_pending_timers_are_snapshotted_and_restored(game, example_path):
+    game.scheduler.start("alarm", 10)
+    game.advance(4)
+    state = snapshot(game)
+
+    other = load_game(example_path)
+    other.scheduler.define("alarm", move_to_room("room2"))
+    restore(other, state)
+    assert other.scheduler.remaining("alarm") == pytest.approx(6)
+    assert other.advance(5.9) == []
+    assert other.advance(0.2) == [TimerExpiredEvent(timer_id="alarm"), MovedToRoomEvent(room_id="room2")]
@@ -0,0 +1,209 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import asyncio
+import json
+
+import pytest
+
+from escapy.commands import move_to_room
+from escapy.game_events import GameEndedEvent
+from escapy.loader import DefinitionFactory, build_game, load_definition
+from escapy.server import GameServer
+from escapy.sync import ReadOnlyGame, SyncMirror
+
+
+@pytest.fixture
+def server(example_path) -> GameServer:
+    definition = load_definition(example_path)
+    return GameServer(lambda: build_game(definition))
+
+
+async def _exchange(server: GameServer, lines: list[bytes]) -> list[dict]:
+    """Send request lines to a listening server and return one reply line per request."""
+    listener = await server.start_tcp("127.0.0.1", 0)
+    async with listener:
+        reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+        replies = []
+        for line in lines:
+            writer.write(line + b"\n")
+            replies.append(json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+        # Let the server notice the closed connection
+        await asyncio.sleep(0.05)
+    return replies
+
+
+def test_requests_get_replies(server):
+    replies = asyncio.run(
+        _exchange(
+            server,
+            [
+                b'{"id": 1, "session": "s", "op": "interact", "object": "a1-knife"}',
+                b'{"id": 2, "session": "s", "op": "inventory", "object": "a1-knife"}',
+                b'{"id": 3, "session": "s", "op": "jump"}',
+                b"{not json",
+                b"[1, 2]",
+            ],
+        )
+    )
+    assert replies[0] == {"id": 1, "events": [["PickedUpEvent", "a1-knife"]]}
+    assert replies[1] == {"id": 2, "events": [["PutInHandEvent", "a1-knife"]]}
+    assert replies[2] == {"id": 3, "error": "unknown op 'jump'"}
+    assert replies[3]["id"] is None and replies[3]["error"].startswith("invalid json")
+    assert replies[4] == {"id": None, "error": "request must be an object"}
+
+
+def test_malformed_spectate_requests_get_errors(server):
+    replies = asyncio.run(
+        _exchange(
+            server,
+            [
+                b'{"id": 1, "op": "spectate"}',
+                b'{"id": 2, "session": ["s"], "op": "spectate"}',
+                b'{"id": 3, "session": "s", "op": "spectate"}',
+                # Only to read the line after the reply
+                b'{"id": 4, "session": "s", "op": "jump"}',
+            ],
+        )
+    )
+    assert replies[0] == {"id": 1, "error": "bad request: session must be a string"}
+    assert replies[1] == {"id": 2, "error": "bad request: session must be a string"}
+    # The connection survived, and the keyframe follows the reply
+    assert replies[2] == {"id": 3, "events": []}
+    assert "k" in replies[3]["sync"]
+
+
+def test_sessions_are_independent(server):
+    server.handle_request({"id": 1, "session": "a", "op": "interact", "object": "a1-knife"})
+    assert server.sessions["a"].inventory == ["a1-knife"]
+    reply = server.handle_request({"id": 2, "session": "b", "op": "interact", "object": "a2-poster"})
+    assert reply["events"] == [["InteractedWithLockedEvent", "a2-poster"]]
+    assert server.sessions["b"].inventory == []
+
+
+def test_closed_connections_are_forgotten(server):
+    asyncio.run(
+        _exchange(
+            server,
+            [
+                b'{"id": 1, "session": "s", "op": "interact", "object": "a1-knife"}',
+                b'{"id": 2, "session": "t", "op": "spectate"}',
+            ],
+        )
+    )
+    assert server._clients == {}
+    assert server._spectators == {}
+
+
+class _Transport:
+    def __init__(self):
+        self.buffered = 0
+        self.aborted = False
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffered
+
+    def abort(self) -> None:
+        self.aborted = True
+
+
+class _Writer:
+    def __init__(self):
+        self.transport = _Transport()
+        self.lines: list[dict] = []
+
+    def is_closing(self) -> bool:
+        return self.transport.aborted
+
+    def write(self, data: bytes) -> None:
+        self.lines.append(json.loads(data))
+
+
+def test_slow_clients_are_dropped(example_path):
+    definition = load_definition(example_path)
+    server = GameServer(lambda: build_game(definition), max_write_buffer=100)
+    fast, slow = _Writer(), _Writer()
+    server._clients["s"] = {fast, slow}
+
+    server._publish("s", [GameEndedEvent()])
+    slow.transport.buffered = 101
+    server._publish("s", [GameEndedEvent()])
+
+    assert len(fast.lines) == 2
+    assert len(slow.lines) == 1
+    assert slow.transport.aborted
+    assert server._clients["s"] == {fast}
+
+
+def test_spectators_joining_later_do_not_desync_others(example_path):
+    definition = load_definition(example_path)
+    server = GameServer(lambda: build_game(definition))
+    first, second = _Writer(), _Writer()
+    mirrors = {}
+
+    def sync(writer: _Writer) -> ReadOnlyGame:
+        mirror = mirrors.setdefault(writer, SyncMirror(build_game(definition, ReadOnlyGame)))
+        for line in writer.lines:
+            mirror.apply(line["sync"])
+        writer.lines.clear()
+        return mirror.game
+
+    server.spectate("s", first)
+    server.handle_request({"id": 1, "session": "s", "op": "interact", "object": "a1-knife"})
+    server.spectate("s", second)
+    server.handle_request({"id": 2, "session": "s", "op": "inventory", "object": "a1-knife"})
+
+    live = server.sessions["s"]
+    for writer in (first, second):
+        game = sync(writer)
+        assert game.inventory == live.inventory == ["a1-knife"]
+        assert game.in_hand_object_id == live.in_hand_object_id == "a1-knife"
+
+
+def test_run_timers_sends_keyframes_to_quiet_sessions(example_path):
+    server = GameServer(DefinitionFactory(example_path), keyframe_interval=0.02)
+    spectator = _Writer()
+
+    async def watch() -> None:
+        timers = asyncio.create_task(server.run_timers())
+        server.spectate("s", spectator)
+        await asyncio.sleep(0.1)
+        timers.cancel()
+
+    asyncio.run(watch())
+    keyframes = [line["sync"] for line in spectator.lines if "k" in line["sync"]]
+    # The join keyframe, then the periodic ones with consecutive sequence numbers
+    assert len(keyframes) >= 3
+    assert [keyframe["seq"] for keyframe in keyframes[1:]] == list(range(len(keyframes) - 1))
+
+
+def test_timer_events_survive_a_failed_request(example_path):
+    definition = load_definition(example_path)
+    server = GameServer(lambda: build_game(definition))
+    client = _Writer()
+    game = server.session("s")
+    game.scheduler.define("alarm", move_to_room("room2"))
+    game.scheduler.start("alarm", 0)
+    server._clients["s"] = {client}
+
+    reply = server.handle_request({"id": 1, "session": "s", "op": "jump"})
+
+    assert "error" in reply
+    assert client.lines == [{"session": "s", "events": [["TimerExpiredEvent", "alarm"], ["MovedToRoomEvent", "room2"]]}]
+    assert game.current_room_id == "room2"
@@ -0,0 +1,87 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import os
+
+import pytest
+
+from escapy.loader import DefinitionFactory
+from escapy.sharding import ShardedSessions
+
+
+@pytest.fixture
+def sessions(example_path, tmp_path):
+    sessions = ShardedSessions(DefinitionFactory(example_path), workers=2, state_dir=tmp_path)
+    yield sessions
+    sessions.close()
+
+
+def _interact(session_id: str, object_id: str, request_id: int = 0) -> dict:
+    return {"id": request_id, "session": session_id, "op": "interact", "object": object_id}
+
+
+def _inventory_of(sessions: ShardedSessions, session_id: str) -> list[str]:
+    worker = sessions.worker_for(session_id)
+    return sessions._call(worker, ("snapshot", session_id))["inventory"]
+
+
+def test_replies_come_back_in_request_order(sessions):
+    session_ids = [f"s{i}" for i in range(8)]
+    assert len({sessions.worker_for(s) for s in session_ids}) == 2
+
+    requests = [_interact(s, "a1-knife", i) for i, s in enumerate(session_ids)]
+    replies = sessions.submit(requests)
+    assert [reply["id"] for reply in replies] == list(range(8))
+    assert all(reply["events"] == [["PickedUpEvent", "a1-knife"]] for reply in replies)
+    # The knife is gone from each session's room once picked
+    assert sessions.submit([_interact("s0", "a1-knife")])[0]["events"] == []
+
+
+def test_migrate_carries_the_session_state(sessions):
+    sessions.submit([_interact("moving", "a1-knife")])
+    source = sessions.worker_for("moving")
+    sessions.migrate("moving", 1 - source)
+
+    assert sessions.worker_for("moving") == 1 - source
+    assert _inventory_of(sessions, "moving") == ["a1-knife"]
+    assert sessions._call(source, ("snapshot", "moving")) is None
+
+
+def test_crashed_worker_restarts_from_persisted_state(sessions):
+    sessions.submit([_interact("crash", "a1-knife")])
+    worker = sessions.worker_for("crash")
+    sessions._processes[worker].kill()
+    sessions._processes[worker].join()
+
+    reply = sessions.submit([{"id": 1, "session": "crash", "op": "inventory", "object": "a1-knife"}])[0]
+    assert reply["events"] == [["PutInHandEvent", "a1-knife"]]
+    assert _inventory_of(sessions, "crash") == ["a1-knife"]
+
+
+def _crashing_factory():
+    os._exit(1)
+
+
+def test_batches_crashing_the_restarted_worker_get_errors():
+    sessions = ShardedSessions(_crashing_factory, workers=1)
+    try:
+        replies = sessions.submit([_interact("s", "a1-knife", 1), _interact("t", "a1-knife", 2)])
+        assert replies == [{"id": 1, "error": "worker crashed"}, {"id": 2, "error": "worker crashed"}]
+        # The worker was started again for the next batches
+        assert sessions._processes[0].is_alive()
+    finally:
+        sessions.close()
@@ -0,0 +1,130 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import time
+
+import pytest
+
+from escapy.loader import build_game, compile_definition, load_definition
+from escapy.snapshot import snapshot
+from escapy.sync import ReadOnlyGame, SyncEncoder, SyncMirror
+
+
+@pytest.fixture
+def definition(example_path):
+    return load_definition(example_path)
+
+
+def _play(game, encoder, mirrors, action):
+    messages = encoder.encode(action(game))
+    for mirror in mirrors:
+        for message in messages:
+            mirror.apply(message)
+    return messages
+
+
+def test_mirror_follows_the_live_game(definition):
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+
+    for action in [
+        lambda g: g.interact("a1-knife"),
+        lambda g: g.interact_inventory("a1-knife"),
+        lambda g: g.interact("a2-poster"),
+        lambda g: g.interact("a2-key"),
+        lambda g: g.interact("calendar-1"),
+    ]:
+        messages = _play(game, encoder, [mirror], action)
+        assert all("d" in message for message in messages)
+
+    assert snapshot(mirror.game) == snapshot(game)
+
+
+def test_mirror_waits_for_a_keyframe_after_a_gap(definition):
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+
+    encoder.encode(game.interact("a1-knife"))  # lost
+    _play(game, encoder, [mirror], lambda g: g.interact_inventory("a1-knife"))
+    assert mirror.game.inventory == []
+
+    mirror.apply(encoder.keyframe())
+    assert snapshot(mirror.game) == snapshot(game)
+
+
+def test_join_keyframe_takes_no_sequence_number(definition):
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    first = SyncMirror(build_game(definition, ReadOnlyGame))
+    first.apply(encoder.keyframe())
+    _play(game, encoder, [first], lambda g: g.interact("a1-knife"))
+
+    second = SyncMirror(build_game(definition, ReadOnlyGame))
+    second.apply(encoder.join_keyframe())
+    _play(game, encoder, [first, second], lambda g: g.interact_inventory("a1-knife"))
+
+    assert snapshot(first.game) == snapshot(second.game) == snapshot(game)
+
+
+def test_mirror_follows_a_code_unlock():
+    definition = compile_definition(
+        {
+            "first_room": "room",
+            "inventory": [],
+            "objects": {
+                "safe": {
+                    "type": "SelfAskCodeLock",
+                    "code": "1234",
+                    "on_unlock": {"command": "reveal", "object_id": "key", "room_id": "room", "position": [0.5, 0.5]},
+                    "width": 0.1,
+                    "height": 0.1,
+                },
+                "key": {"type": "PickableObject", "width": 0.05, "height": 0.05},
+            },
+            "rooms": {"room": {"safe": [0.2, 0.2]}},
+        }
+    )
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=3600)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+
+    _play(game, encoder, [mirror], lambda g: g.interact("safe"))
+    _play(game, encoder, [mirror], lambda g: g.insert_code("safe", "1234"))
+    assert mirror.game.objects["safe"].state == "unlocked"
+    _play(game, encoder, [mirror], lambda g: g.interact("key"))
+
+    assert snapshot(mirror.game) == snapshot(game)
+
+
+def test_quiet_games_still_get_keyframes(definition):
+    game = build_game(definition)
+    encoder = SyncEncoder(game, keyframe_interval=0.05)
+    mirror = SyncMirror(build_game(definition, ReadOnlyGame))
+    mirror.apply(encoder.keyframe())
+    assert encoder.tick() == []
+
+    encoder.encode(game.interact("a1-knife"))  # lost
+    time.sleep(0.05)
+    for message in encoder.tick():
+        mirror.apply(message)
+    assert snapshot(mirror.game) == snapshot(game)
+    assert encoder.next_keyframe_at() > time.monotonic()
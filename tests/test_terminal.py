@@ -0,0 +1,80 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import curses
+import json
+
+from escapy.loader import build_game, compile_definition
+from escapy.messages import dict_message_provider
+from escapy.terminal import TerminalUi
+
+
+class _Screen:
+    """A curses window that records what is drawn and types queued keys."""
+
+    def __init__(self, keys: str = "", size: tuple[int, int] = (60, 80)) -> None:
+        self.keys = list(keys)
+        self.size = size
+        self.rows: dict[int, str] = {}
+
+    def timeout(self, delay: int) -> None:
+        pass
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.size
+
+    def get_wch(self) -> str:
+        if not self.keys:
+            raise curses.error("no input")
+        return self.keys.pop(0)
+
+    def erase(self) -> None:
+        self.rows = {}
+
+    def addnstr(self, y: int, x: int, text: str, n: int) -> None:
+        self.rows[y] = text[:n]
+
+    def refresh(self) -> None:
+        pass
+
+
+def _ui(example_path, inventory: int) -> tuple[TerminalUi, _Screen]:
+    with open(example_path) as f:
+        definition = json.load(f)
+    for i in range(inventory):
+        definition["objects"][f"item-{i}"] = {"type": "PickableObject", "width": 0.05, "height": 0.05}
+        definition["inventory"].append(f"item-{i}")
+    screen = _Screen()
+    ui = TerminalUi({}, dict_message_provider({}), screen)
+    ui.init(build_game(compile_definition(definition)))
+    return ui, screen
+
+
+def test_every_inventory_item_is_listed_and_selectable(example_path):
+    ui, screen = _ui(example_path, 30)
+    ui.render()
+    listed = [row.strip() for row in screen.rows.values()]
+    assert "i30. item-29" in listed
+
+    screen.keys = list("i30\n")
+    ui.input()
+    assert ui.game.in_hand_object_id == "item-29"
+
+    screen.keys = list("i31\n")
+    ui.input()
+    assert ui.messages[-1] == "? i31"
+    assert ui.game.in_hand_object_id == "item-29"
@@ -0,0 +1,90 @@
+# Copyright (C) 2026 Matteo Zeccoli Marazzini
+#
+# This file is part of escapy.
+#
+# escapy is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# escapy is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for
+# more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with escapy. If not, see <https://www.gnu.org/licenses/>.
+
+import random
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from escapy.pygame.tiles import TiledBackground, split_image  # noqa: E402
+
+
+@pytest.fixture
+def background(tmp_path):
+    rng = random.Random(3)
+    image = pygame.Surface((100, 70))
+    for x in range(0, 100, 5):
+        for y in range(0, 70, 5):
+            image.fill((rng.randrange(256), rng.randrange(256), rng.randrange(256)), (x, y, 5, 5))
+    pygame.image.save(image, tmp_path / "hall.png")
+    split_image(tmp_path / "hall.png", tmp_path / "tiles", tile_size=32)
+    return image, tmp_path / "tiles"
+
+
+def _draw(tiles: TiledBackground, offset: tuple[int, int], view: tuple[int, int], size: tuple[int, int]):
+    surface = pygame.Surface(view)
+    tiles.draw(surface, offset, size)
+    return surface
+
+
+def test_split_image_writes_edge_tiles_clipped(background):
+    image, directory = background
+    tiles = TiledBackground(directory)
+    assert (tiles.width, tiles.height, tiles.tile_size) == (100, 70, 32)
+    assert (tiles.columns, tiles.rows) == (4, 3)
+    assert pygame.image.load(directory / "3_2.png").get_size() == (4, 6)
+
+
+@pytest.mark.parametrize("offset", [(0, 0), (17, 9), (40, 30)])
+def test_draw_matches_the_unsplit_background(background, offset):
+    image, directory = background
+    surface = _draw(TiledBackground(directory), offset, (60, 40), (100, 70))
+    expected = pygame.Surface((60, 40))
+    expected.blit(image, (-offset[0], -offset[1]))
+    assert pygame.image.tobytes(surface, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_scaled_tiles_cover_the_view_without_gaps(background):
+    _, directory = background
+    surface = pygame.Surface((150, 105))
+    surface.fill((255, 0, 255))
+    TiledBackground(directory).draw(surface, (0, 0), (150, 105))
+    assert all(surface.get_at((x, y))[:3] != (255, 0, 255) for x in range(150) for y in range(105)), (
+        "scaled tiles leave gaps"
+    )
+
+
+def test_tiles_load_on_demand_and_stay_within_the_cache(background):
+    _, directory = background
+    loaded = []
+
+    def load(path):
+        loaded.append(path.name)
+        return pygame.image.load(path)
+
+    tiles = TiledBackground(directory, load, cache_size=4, prefetch_per_draw=1)
+    _draw(tiles, (0, 0), (30, 30), (100, 70))
+    # The visible tile and one of its neighbours
+    assert loaded == ["0_0.png", "1_0.png"]
+
+    _draw(tiles, (0, 0), (30, 30), (100, 70))
+    assert len(loaded) == 3
+
+    for x in range(0, 70, 10):
+        _draw(tiles, (x, 35), (30, 30), (100, 70))
+        assert len(tiles._tiles) <= 4